@@ -5,11 +5,14 @@ from enum import Enum
 from scenes.envy_case import EnvyCaseScene
 from scenes.wrath_case import WrathCaseScene
 from src.ui.main_scene import MainSceneUi
+from src.ui.hud import HudLayer, make_outline_frames
 from src.scenes.office import OfficeScene
 from src.scenes.interrogation_room import InterrogationRoomScene
 from src.tools.Notebook import Notebook
-from src.tools.Notebook_clues import * 
+from src.tools.casebook import Casebook, CasebookClueStore
+from src.tools.evidence_combiner import RecipeBook, EvidenceCombiner
 from src.tools.Inventory_UI import *
+from src.utils.font_registry import fonts as font_registry
 
 from src.player import Player
 from src.scenes.greed_case import GreedCaseScene
@@ -25,7 +28,7 @@ class GameState(Enum):
     NOTEBOOK = 3
 
 class Game:
-    def __init__(self):
+    def __init__(self, new_game=False):
         pygame.init()
         self.SCREEN_WIDTH = 1280
         self.SCREEN_HEIGHT = 720
@@ -33,6 +36,7 @@ class Game:
         pygame.display.set_caption("The Se7enth Code")
         self.clock = pygame.time.Clock()
         self.running = True
+        self.ACTIVE_CASES = (DEFAULT_CASE,)  # cases whose items are loaded
         self.state = GameState.PLAYING 
 
         # Assets
@@ -42,8 +46,11 @@ class Game:
         self.init_player()  # Initialize player first
         self.init_ui()
         self.init_scenes()  # Then scenes (which may reference player)
+        self.init_casebook(new_game)
         self.init_inventory() # FIX: Ensure this initializes the instance
         self.init_notebook()
+        self.init_combiner()
+        self.init_hud()
 
     def load_assets(self):
         self.closed_book_icon_size = (64, 64)
@@ -86,43 +93,62 @@ class Game:
         if hasattr(self.current_scene, 'set_player'):
             self.current_scene.set_player(self.player)
 
+    def init_casebook(self, new_game=False):
+        # Clue/item content and unlock progress live in SQLite; rows are loaded per page
+        self.casebook = Casebook()
+        if new_game:
+            self.casebook.reset_progress()
+        # Only the items of the cases in play are loaded (descriptions on demand)
+        self.item_registry = ItemRegistry(self.casebook, cases=self.ACTIVE_CASES)
+
     def init_inventory(self):
         # FIX: Initialize the InventoryUI instance correctly
         self.inventory_ui = InventoryUI(self.screen)
-        self.inventory_ui.initialize_inventory()
+        self.inventory_ui.initialize_inventory(self.item_registry)
+
+    def init_combiner(self):
+        # Evidence combination: recipes of the active cases, unlocking clues in the Notebook
+        recipes = RecipeBook(self.ACTIVE_CASES, self.item_registry)
+        self.inventory_ui.set_combiner(EvidenceCombiner(recipes, self.item_registry, self.clue_store))
 
     def init_notebook(self):
         fonts = self.load_notebook_fonts()
+        self.clue_store = CasebookClueStore(self.casebook)
         self.notebook = Notebook(
             screen=self.screen,
             clock=self.clock,
-            clues_data=clues,
+            clues_data=self.clue_store,
             fonts=fonts,
             screen_width=self.SCREEN_WIDTH,
             screen_height=self.SCREEN_HEIGHT
         )
 
+    def init_hud(self):
+        # Always-on icons are composited into cached surfaces, in two layers to keep
+        # the stacking: menu/map/journal under the UI popups, notebook/inventory above
+        self.ui.attach_hud(HudLayer())
+        self.hud = HudLayer()
+        self.hud.add_widget("notebook", self.closed_book_icon_rect,
+                            make_outline_frames(self.closed_book_icon, (255, 255, 255)))
+        self.hud.add_widget("inventory", self.inventory_ui.inventory_icon_rect,
+                            self.inventory_ui.get_inventory_icon_frames())
+
     def init_player(self):
         # Start player in the middle of the screen
         self.player = Player(self.SCREEN_WIDTH // 2, self.SCREEN_HEIGHT // 2)
 
     def load_notebook_fonts(self):
+        # Shared registry: missing 'Harmonic.ttf' falls back to the default font (size + 4) once
+        harmonic = "assets/fonts/Harmonic.ttf"
         fonts = {}
-        try:
-            fonts['list'] = pygame.font.Font("assets/fonts/Harmonic.ttf", 36)
-            font_title_sizes = [42, 36, 32, 28, 24]
-            fonts['title_options'] = {size: pygame.font.Font("assets/fonts/Harmonic.ttf", size) for size in font_title_sizes}
-            font_desc_sizes = [36, 32, 28, 24]
-            fonts['desc_options'] = {size: pygame.font.Font(None, size + 4) for size in font_desc_sizes}
-            fonts['page_count'] = pygame.font.Font("assets/fonts/Harmonic.ttf", 28)
-        except FileNotFoundError:
-            print("Warning: 'Harmonic.ttf' not found. Using default font.")
-            fonts['list'] = pygame.font.Font(None, 40)
-            font_title_sizes = [42, 36, 32, 28, 24]
-            fonts['title_options'] = {size: pygame.font.Font(None, size + 4) for size in font_title_sizes}
-            font_desc_sizes = [36, 32, 28, 24]
-            fonts['desc_options'] = {size: pygame.font.Font(None, size + 4) for size in font_desc_sizes}
-            fonts['page_count'] = pygame.font.Font(None, 32)
+        fonts['list'] = font_registry.font(harmonic, 36, fallback_size=40)
+        font_title_sizes = [42, 36, 32, 28, 24]
+        fonts['title_options'] = {size: font_registry.font(harmonic, size, fallback_size=size + 4) for size in font_title_sizes}
+        font_desc_sizes = [36, 32, 28, 24]
+        fonts['desc_options'] = {size: font_registry.font(None, size + 4) for size in font_desc_sizes}
+        fonts['page_count'] = font_registry.font(harmonic, 28, fallback_size=32)
+        fonts['search'] = font_registry.font(None, 28)
+        fonts['note'] = font_registry.font(None, 30)
         return fonts
 
     def change_scene(self, scene_id):
@@ -134,6 +160,8 @@ class Game:
             self.player.y = self.SCREEN_HEIGHT // 2
             self.player.rect.x = self.player.x
             self.player.rect.y = self.player.y
+            # Scenes with a world (BaseScene) widen this in set_player
+            self.player.bounds = pygame.Rect(0, 0, self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
 
             # Set player reference for collision detection
             if hasattr(self.current_scene, 'set_player'):
@@ -149,6 +177,7 @@ class Game:
             self.update()
             self.draw()
             self.clock.tick(60)
+        self.casebook.close()
         pygame.quit()
         sys.exit()
 
@@ -160,8 +189,11 @@ class Game:
                 if event.type == pygame.QUIT:
                     self.running = False
 
+                # Ô tìm kiếm của Notebook đang nhận chữ: bỏ qua phím tắt toàn cục
+                typing = self.state == GameState.NOTEBOOK and self.notebook.is_capturing_text()
+
                 # --- Global ESC key check ---
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE and not typing:
                     if self.state == GameState.NOTEBOOK:
                         self.notebook.close_notebook()
                         self.state = GameState.PLAYING
@@ -170,7 +202,7 @@ class Game:
                         self.state = GameState.PLAYING
                 
                 # --- Global Toggles (E key for Notebook, R key for Inventory) ---
-                if event.type == pygame.KEYDOWN:
+                if event.type == pygame.KEYDOWN and not typing:
                     if event.key == pygame.K_e: # Toggle Notebook
                         if self.state == GameState.NOTEBOOK:
                             self.notebook.close_notebook()
@@ -228,6 +260,8 @@ class Game:
                     # Inventory handling for movement and clicks
                     if event.type == pygame.KEYDOWN:
                         self.inventory_ui._handle_keys_inventory(event.key, mouse_pos)
+                    elif event.type == pygame.MOUSEWHEEL and event.y:
+                        self.inventory_ui._handle_keys_inventory("WHEEL_UP" if event.y > 0 else "WHEEL_DOWN", mouse_pos)
                     elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                         self.inventory_ui._handle_keys_inventory("LMB_CLICK", mouse_pos)
                         # Nếu inventory tự đóng (ví dụ: do click vào nút tắt), cập nhật state
@@ -304,6 +338,9 @@ class Game:
         elif self.state == GameState.INVENTORY:
             pass 
 
+        # Unlock and note changes made this frame are written in one transaction
+        self.casebook.flush()
+
     def draw(self):
         self.screen.fill((0, 0, 0))
         mouse_pos = pygame.mouse.get_pos()
@@ -321,19 +358,18 @@ class Game:
             # Khi không PLAYING, chỉ vẽ scene
             self.current_scene.draw(self.screen)
 
-        # Draw UI
+        # Draw UI (menu, map, journal icons + popups)
         self.ui.draw(self.screen)
 
-        # Draw Notebook Icon (if not open)
-        if not self.notebook.get_state():
-             self.screen.blit(self.closed_book_icon, self.closed_book_icon_rect)
-             if self.closed_book_icon_rect.collidepoint(mouse_pos):
-                 pygame.draw.rect(self.screen, (255, 255, 255), self.closed_book_icon_rect, 2)
-
-        # Draw Inventory Icon (if not in inventory)
+        # Draw HUD icons (notebook, inventory) - one cached blit
+        notebook_open = self.notebook.get_state()
+        self.hud.set_visible("notebook", not notebook_open)
+        self.hud.set_visible("inventory", self.state != GameState.INVENTORY)
+        if not notebook_open:
+            self.hud.update_hover("notebook", mouse_pos)
         if self.state != GameState.INVENTORY:
-            # FIX: Use instance method, which only needs mouse_pos
-            self.inventory_ui.draw_inventory_icon(mouse_pos)
+            self.hud.set_frame("inventory", HudLayer.HOVER if self.inventory_ui.update_icon_hover(mouse_pos) else HudLayer.IDLE)
+        self.hud.draw(self.screen)
 
         # Draw Notebook (Overlay)
         if self.state == GameState.NOTEBOOK:
@@ -341,8 +377,8 @@ class Game:
 
         # Draw Inventory (Overlay)
         if self.state == GameState.INVENTORY:
-            # FIX: Call initialize before drawing open inventory, and use instance method
-            self.inventory_ui.initialize_inventory()
+            # Inventory is filled once in init_inventory; re-filling here every frame
+            # would discard changes and rebuild the whole grid
             self.inventory_ui.draw_inventory(mouse_pos)
 
         pygame.display.flip()
\ No newline at end of file
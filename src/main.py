@@ -10,5 +10,6 @@ if project_root not in sys.path:
 from src.game import Game
 
 if __name__ == "__main__":
-    game = Game()
+    # --new-game: start over instead of continuing the saved casebook progress
+    game = Game(new_game="--new-game" in sys.argv[1:])
     game.run()
\ No newline at end of file
@@ -58,6 +58,9 @@ class Player:
         
         # Create rect for collision detection
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+
+        # Area the player is kept inside (scenes set it to their world size)
+        self.bounds = pygame.Rect(0, 0, cfg.SCREEN_WIDTH, cfg.SCREEN_HEIGHT)
         
         # Direction mapping: 0=down, 1=right, 2=up, 3=left
         self.direction = Direction.DOWN
@@ -251,9 +254,9 @@ class Player:
             elif self.dx > 0:
                 self.direction = Direction.RIGHT
 
-        # Keep player within screen bounds
-        self.x = max(0, min(self.x, cfg.SCREEN_WIDTH - self.width))
-        self.y = max(0, min(self.y, cfg.SCREEN_HEIGHT - self.height))
+        # Keep player within the world bounds
+        self.x = max(self.bounds.left, min(self.x, self.bounds.right - self.width))
+        self.y = max(self.bounds.top, min(self.y, self.bounds.bottom - self.height))
 
         # IMPORTANT: Update rect to reflect new position
         self.rect.x = int(self.x)
@@ -273,16 +276,22 @@ class Player:
             if num_frames > 0:
                 self.animation_frame = (self.animation_frame + 1) % num_frames
     
-    def draw(self, screen):
+    def draw(self, screen, offset=(0, 0)):
         """
         Draw the player on the screen with sprite animation
         
         Args:
             screen: Pygame surface to draw on
+            offset: Camera offset subtracted from the world position
         """
+        # Screen position
+        x = self.x - offset[0]
+        y = self.y - offset[1]
+        rect = self.rect.move(-offset[0], -offset[1])
+
         # Calculate center position (used for fallback and footsteps)
-        center_x = self.x + self.width // 2
-        center_y = self.y + self.height // 2
+        center_x = x + self.width // 2
+        center_y = y + self.height // 2
         
         if self.use_sprites:
             # Choose sprite: idle or walking animation
@@ -304,23 +313,23 @@ class Player:
                     current_sprite = walk_frames[frame_idx]
             
             if current_sprite:
-                screen.blit(current_sprite, (self.x, self.y))
+                screen.blit(current_sprite, (x, y))
             else:
                 # Fallback if sprite is None
-                pygame.draw.rect(screen, cfg.BLUE, self.rect)
+                pygame.draw.rect(screen, cfg.BLUE, rect)
         else:
             # Fallback: Draw simple colored rectangle if sprites not loaded
-            pygame.draw.rect(screen, cfg.BLUE, self.rect)
+            pygame.draw.rect(screen, cfg.BLUE, rect)
             
             # Draw direction indicator
             if self.direction == Direction.DOWN:
-                points = [(center_x, self.y + self.height), (center_x - 5, center_y), (center_x + 5, center_y)]
+                points = [(center_x, y + self.height), (center_x - 5, center_y), (center_x + 5, center_y)]
             elif self.direction == Direction.RIGHT:
-                points = [(self.x + self.width, center_y), (center_x, center_y - 5), (center_x, center_y + 5)]
+                points = [(x + self.width, center_y), (center_x, center_y - 5), (center_x, center_y + 5)]
             elif self.direction == Direction.UP:
-                points = [(center_x, self.y), (center_x - 5, center_y), (center_x + 5, center_y)]
+                points = [(center_x, y), (center_x - 5, center_y), (center_x + 5, center_y)]
             else:  # Left
-                points = [(self.x, center_y), (center_x, center_y - 5), (center_x, center_y + 5)]
+                points = [(x, center_y), (center_x, center_y - 5), (center_x, center_y + 5)]
             
             pygame.draw.polygon(screen, cfg.YELLOW, points)
         
@@ -328,8 +337,8 @@ class Player:
         if self.moving and self.animation_frame in [1, 3]:
             foot_offset = 6
             if self.direction in (Direction.DOWN, Direction.UP):
-                pygame.draw.circle(screen, cfg.WHITE, (int(center_x - foot_offset), int(self.y + self.height)), 2)
-                pygame.draw.circle(screen, cfg.WHITE, (int(center_x + foot_offset), int(self.y + self.height)), 2)
+                pygame.draw.circle(screen, cfg.WHITE, (int(center_x - foot_offset), int(y + self.height)), 2)
+                pygame.draw.circle(screen, cfg.WHITE, (int(center_x + foot_offset), int(y + self.height)), 2)
             else:  # Left/Right
                 pygame.draw.circle(screen, cfg.WHITE, (int(center_x), int(center_y - foot_offset)), 2)
                 pygame.draw.circle(screen, cfg.WHITE, (int(center_x), int(center_y + foot_offset)), 2)
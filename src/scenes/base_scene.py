@@ -1,42 +1,115 @@
 import pygame
-from typing import List, Optional, Dict, Any
+from bisect import bisect_left
+from typing import Callable, List, Optional, Dict, Any
 from .i_scene import IScene
+from .scene_loader import load_scene_definition, SceneDefinitionError
+from .scene_objects import SceneObject, Obstacle, NpcSprite, Collectible
+from .wall_geometry import load_wall_geometry
+from .distance_field import DistanceField, load_distance_field, occupancy
+from src.utils.camera import Camera
 from src.utils.interaction_area import InteractionArea
+from src.utils.spatial_hash import SpatialHash
+from src.utils.trigger_manager import TriggerManager
+from src.utils.sprite_trim import footprint_mask
+from src.utils.text_cache import render_text, text_cache
+from src.utils.font_registry import fonts
 
 class BaseScene(IScene):
     """
     Base generic scene for Case Scenes, handling common logic like:
     - Debug mode (F3)
-    - Collision detection (Mask + Rects)
+    - Collision detection (spatial-hash broadphase over obstacle + wall rects, then
+      Mask overlap for footprint masks and diagonal wall edges)
+    - Collision response (signed distance field of walls + obstacles)
     - Asset loading (Background, Walls)
-    - Object management (Obstacles, NPCs, Interaction Areas)
-    - Rendering (Background, Y-sorted Entities, Debug info)
+    - Declarative scene files (assets/data/scenes/<id>.json, see scene_loader)
+    - Object management (Obstacles, NPCs, Interaction Areas behind a TriggerManager)
+    - Rendering (Background, Y-sorted Entities, Debug info) through a Camera: the
+      world may be larger than the screen, only what is in view is drawn
     """
 
+    BROADPHASE_CELL_SIZE = 64
+    RENDER_CELL_SIZE = 256  # spatial index of the sprites' draw bounds, for viewport culling
+    PUSH_OUT_ITERATIONS = 4
+    MAX_PUSH_OUT = 12  # px; further than this the move is rejected instead
+
     def __init__(self, screen_width: int = 1280, screen_height: int = 720):
         self.screen_width = screen_width
         self.screen_height = screen_height
+        # World size (= screen unless the scene file sets "world_size"); positions are world coordinates
+        self.world_width = screen_width
+        self.world_height = screen_height
+        self.camera = Camera((screen_width, screen_height), (screen_width, screen_height))
 
         # --- Asset Paths (Set these in subclass __init__ before super().__init__ if possible, or override _load methods) ---
         # Actually, standard practice: Subclass calls super().__init__, then loads specific things.
         # But for shared logic, we can have defaults or placeholders.
         
         # --- Core Data Structures ---
-        self.obstacles: List[Dict[str, Any]] = []           # Visual objects with potential collision
+        self.obstacles: List[Obstacle] = []                 # Visual objects with potential collision
         self.collision_rects: List[pygame.Rect] = []        # Pure collision rects (derived from obstacles or added manually)
-        self.interaction_areas: List[InteractionArea] = []  # Interactive zones
-        self.npcs: List[Dict[str, Any]] = []                # NPCs (visual only usually, interaction handled via areas)
-        self.collectible_items: List[Dict[str, Any]] = []   # Items on ground (like woodpad, mask)
+        self.collision_masks: List[Optional[pygame.mask.Mask]] = []  # Pixel mask of collision_rects[i] (None = solid rect)
+        self.interaction_areas: List[InteractionArea] = []  # Interactive zones (use add/remove_interaction_area)
+        self.npcs: List[NpcSprite] = []                     # NPCs (visual only usually, interaction handled via areas)
+        self.collectible_items: List[Collectible] = []      # Items on ground (like woodpad, mask)
+
+        # Y-sorted render queue of the scene objects (the player is merged in per frame)
+        self._render_queue: List[SceneObject] = []
+        self._render_keys: List[int] = []
+        self._render_version: Optional[tuple] = None
+        self._render_index = SpatialHash(self.RENDER_CELL_SIZE)  # queue index -> draw bounds
         
         self.wall_mask: Optional[pygame.mask.Mask] = None
-        self.background: pygame.Surface = pygame.Surface((self.screen_width, self.screen_height))
+        # Wall mask decomposed into rects (see wall_geometry) + leftover pixels of diagonal edges
+        self.wall_rects: List[pygame.Rect] = []
+        self.wall_residual: Optional[pygame.mask.Mask] = None
+        self._wall_residual_boxes: List[pygame.Rect] = []
+        self._wall_debug_overlay: Optional[pygame.Surface] = None
+
+        # Broadphase over collision_rects + wall_rects (rebuilt when either list changes)
+        self._broadphase = SpatialHash(self.BROADPHASE_CELL_SIZE)
+        self._broadphase_version: Optional[tuple] = None
+        self._broadphase_masks: Dict[tuple, pygame.mask.Mask] = {}  # broadphase key -> mask (masked rects only)
+        self._filled_masks: Dict[tuple, pygame.mask.Mask] = {}
+
+        # Spatial index of interaction_areas (re-synced if the list is edited directly)
+        self.triggers = TriggerManager()
+        self.triggers.subscribe(self._on_trigger)
+        self._triggers_version: Optional[tuple] = None
+
+        # Signed distance field of walls + obstacles (rebuilt with the broadphase)
+        self._distance_field: Optional[DistanceField] = None
+        self._distance_field_version: Optional[tuple] = None
+        self.background: pygame.Surface = pygame.Surface((self.world_width, self.world_height))
         self.background.fill((0, 0, 0))
 
         self.player: Optional[object] = None
+        self.player_start: Optional[tuple] = None
         self.debug_mode: bool = False
 
+    @classmethod
+    def from_definition(cls, scene_id: str, screen_width: int = 1280, screen_height: int = 720) -> "BaseScene":
+        """A scene built purely from its data file (no scene-specific code)."""
+        scene = cls(screen_width, screen_height)
+        scene.load_definition(scene_id)
+        return scene
+
+    def get_debug_font(self) -> pygame.font.Font:
+        """Font for debug overlays (shared through the font registry)."""
+        return fonts.font(None, 24)
+
     # --- Loading Methods (Subclasses can override or extend) ---
 
+    def set_world_size(self, width: int, height: int) -> None:
+        """
+        Resizes the world (call before loading the background and wall mask,
+        which are scaled to it). The camera scrolls when it exceeds the screen.
+        """
+        self.world_width, self.world_height = width, height
+        self.camera.set_world_size((width, height))
+        self.background = pygame.Surface((width, height))
+        self.background.fill((0, 0, 0))
+
     def setup_scene(self, background_path: Optional[str], wall_mask_path: Optional[str]):
         """
         Helper to load standard assets. Call this from subclass.
@@ -50,7 +123,7 @@ class BaseScene(IScene):
     def _load_background(self, path: str) -> None:
         try:
             bg = pygame.image.load(path).convert()
-            self.background = pygame.transform.scale(bg, (self.screen_width, self.screen_height))
+            self.background = pygame.transform.scale(bg, (self.world_width, self.world_height))
             print(f"✅ Loaded background: {path}")
         except (pygame.error, FileNotFoundError) as e:
             print(f"⚠️  Could not load background {path}: {e}")
@@ -59,27 +132,196 @@ class BaseScene(IScene):
     def _load_wall_mask(self, path: str) -> None:
         try:
             mask_image = pygame.image.load(path).convert()
-            mask_image = pygame.transform.scale(mask_image, (self.screen_width, self.screen_height))
+            mask_image = pygame.transform.scale(mask_image, (self.world_width, self.world_height))
             mask_image.set_colorkey((0, 0, 0)) # Assuming black is transparent/walkable
-            self.wall_mask = pygame.mask.from_surface(mask_image)
+            self.set_wall_mask(pygame.mask.from_surface(mask_image), source=path)
             print(f"✅ Loaded wall collision mask: {path}")
         except (pygame.error, FileNotFoundError) as e:
             print(f"⚠️  Could not load wall mask {path}: {e}")
-            self.wall_mask = pygame.mask.Mask((self.screen_width, self.screen_height), fill=False)
+            self.set_wall_mask(pygame.mask.Mask((self.world_width, self.world_height), fill=False))
+
+    def set_wall_mask(self, mask: pygame.mask.Mask, source: Optional[str] = None) -> None:
+        """
+        Sets the wall mask and decomposes it into rects for the broadphase.
+
+        Args:
+            mask: Wall mask (set bits = walls), world-sized
+            source: Image the mask was built from; enables the on-disk rect cache
+        """
+        self.wall_mask = mask
+        self.wall_rects, self.wall_residual, from_cache = load_wall_geometry(mask, source)
+        self._wall_residual_boxes = self.wall_residual.get_bounding_rects() if self.wall_residual else []
+        self._wall_debug_overlay = None
+        self.invalidate_broadphase()
+        residual = self.wall_residual.count() if self.wall_residual else 0
+        print(f"✅ Wall geometry{' (cache)' if from_cache else ''}: {len(self.wall_rects)} rects, "
+              f"{residual} px on diagonal edges")
+
+    def load_definition(self, scene_id: str) -> None:
+        """
+        Loads assets, obstacles, collectibles, NPCs and interaction areas from
+        assets/data/scenes/<scene_id>.json. Positions and rects come precomputed
+        from the compiled cache; only the images are loaded here.
+        """
+        compiled, from_cache = load_scene_definition(scene_id, (self.screen_width, self.screen_height))
+
+        if compiled["world_size"] != (self.world_width, self.world_height):
+            self.set_world_size(*compiled["world_size"])
+        self.setup_scene(compiled["background"], compiled["wall_mask"])
+        if compiled["fallback_color"] and self.background.get_at((0, 0)) == (0, 0, 0, 255):
+            self.background.fill(compiled["fallback_color"])
+        self.debug_mode = compiled["debug"]
+        self.player_start = compiled["player_start"]
+
+        for entry in compiled["obstacles"]:
+            image = self._load_sprite_image(entry)
+            if image is not None:
+                rect = pygame.Rect(entry["rect"])
+                mask = None
+                if entry["pixel_collision"]:
+                    footprint = rect.move(-entry["position"][0], -entry["position"][1])
+                    mask = footprint_mask(image, footprint, key=(entry["image"], entry["size"]))
+                self.obstacles.append(Obstacle(entry["name"], image, entry["position"], rect, mask))
+        for entry in compiled["collectibles"]:
+            image = self._load_sprite_image(entry)
+            if image is not None:
+                self.collectible_items.append(
+                    Collectible(entry["name"], image, entry["position"], pygame.Rect(entry["rect"])))
+        for entry in compiled["npcs"]:
+            image = self._make_npc_image(entry["size"], entry["color"])
+            self.npcs.append(NpcSprite(entry["name"], image, entry["position"], pygame.Rect(entry["rect"]),
+                                       entry["color"]))
+
+        self.rebuild_collision_rects()
+        self.get_distance_field()
+        self._setup_interaction_areas_from(compiled)
+        source = "cache" if from_cache else "compiled"
+        print(f"✅ Loaded scene '{scene_id}' ({source}): {len(self.obstacles)} obstacles, "
+              f"{len(self.collectible_items)} collectibles, {len(self.npcs)} NPCs")
+
+    def _load_sprite_image(self, entry: Dict[str, Any]) -> Optional[pygame.Surface]:
+        try:
+            image = pygame.image.load(entry["image"]).convert_alpha()
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"⚠️  Could not load {entry['name']}: {e}")
+            return None
+        if entry["size"] is not None:
+            image = pygame.transform.scale(image, entry["size"])
+        if entry["crop"] is not None:
+            image = image.subsurface(entry["crop"]).copy()  # chỉ giữ vùng có alpha
+        return image
+
+    @staticmethod
+    def _make_npc_image(size: tuple, color: tuple) -> pygame.Surface:
+        """Placeholder NPC sprite: head + body in the NPC's color."""
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.ellipse(surface, color, (10, 10, 40, 50))  # Head
+        pygame.draw.rect(surface, color, (15, 55, 30, 25))  # Body
+        return surface
+
+    def _setup_interaction_areas_from(self, compiled: Dict[str, Any]) -> None:
+        """Creates the interaction areas declared in the scene file, in file order."""
+        groups = (("obstacles", self.obstacles), ("collectibles", self.collectible_items), ("npcs", self.npcs))
+        for group, entities in groups:
+            by_name = {entity.name: entity for entity in entities}
+            for entry in compiled[group]:
+                entity = by_name.get(entry["name"])
+                if entity is None or entry["interaction"] is None:
+                    continue
+                rect, callback_name, priority = entry["interaction"]
+                callback = self._resolve_callback(callback_name)
+                if group == "collectibles":
+                    action = lambda e=entity, cb=callback: self._pick_up(e, cb)
+                else:
+                    action = lambda e=entity, cb=callback: cb(e)
+                area = InteractionArea(rect=pygame.Rect(rect), callback=action, priority=priority)
+                entity.interaction_area = area
+                self.add_interaction_area(area)
+
+    def _resolve_callback(self, name: str) -> Callable:
+        callback = getattr(self, name, None)
+        if not callable(callback):
+            raise SceneDefinitionError(f"{type(self).__name__} has no callback method {name!r}")
+        return callback
+
+    def _pick_up(self, item: Collectible, callback: Callable) -> None:
+        """Removes a collectible (visual + interaction area), then runs the scene callback."""
+        if item not in self.collectible_items:
+            return
+        if item.interaction_area is not None:
+            self.remove_interaction_area(item.interaction_area)
+        self.collectible_items = [other for other in self.collectible_items if other is not item]
+        callback(item)
+
+    # --- Interaction areas ---
+
+    def add_interaction_area(self, area: InteractionArea) -> InteractionArea:
+        """Adds an interaction area to the scene (list + trigger index). Returns it."""
+        triggers = self._get_triggers()
+        self.interaction_areas.append(area)
+        triggers.add(area)
+        self._triggers_version = (id(self.interaction_areas), len(self.interaction_areas))
+        return area
+
+    def remove_interaction_area(self, area: InteractionArea) -> None:
+        """Removes an interaction area; an "exit" event is sent if the player was inside."""
+        triggers = self._get_triggers()
+        if area in self.interaction_areas:
+            self.interaction_areas.remove(area)
+        triggers.remove(area)
+        self._triggers_version = (id(self.interaction_areas), len(self.interaction_areas))
+
+    def _get_triggers(self) -> TriggerManager:
+        """The trigger index, re-synced when self.interaction_areas is replaced or changes length."""
+        version = (id(self.interaction_areas), len(self.interaction_areas))
+        if version != self._triggers_version:
+            self.triggers.sync(self.interaction_areas)
+            self._triggers_version = version
+        return self.triggers
+
+    def _on_trigger(self, event: str, area: InteractionArea) -> None:
+        if event == "enter":
+            self.on_area_enter(area)
+        else:
+            self.on_area_exit(area)
+
+    def on_area_enter(self, area: InteractionArea) -> None:
+        """Called when the player enters an interaction area (override in scenes)."""
+
+    def on_area_exit(self, area: InteractionArea) -> None:
+        """Called when the player leaves an interaction area (override in scenes)."""
+
+    # Default callbacks, usable from any scene file without scene-specific code
+
+    def _on_npc_interact(self, npc: NpcSprite) -> None:
+        """Default NPC callback."""
+        print(f"💬 Đang nói chuyện với {npc.name}...")
+
+    def _on_inspect(self, entity: SceneObject) -> None:
+        """Default callback for inspecting an obstacle."""
+        print(f"🔍 Đang xem xét {entity.name}...")
+
+    def _on_pick_up(self, item: Collectible) -> None:
+        """Default collectible callback (the item is already removed from the scene)."""
+        print(f"✅ Đã nhặt {item.name}")
 
     def rebuild_collision_rects(self) -> None:
-        """Rebuilds self.collision_rects from self.obstacles."""
-        self.collision_rects.clear()
-        for obj in self.obstacles:
-            if 'rect' in obj:
-                self.collision_rects.append(obj['rect'])
+        """Rebuilds self.collision_rects (and their masks) from self.obstacles."""
+        self.collision_rects[:] = [obj.rect for obj in self.obstacles]
+        self.collision_masks[:] = [obj.mask for obj in self.obstacles]
+        self.invalidate_broadphase()
         print(f"✅ Rebuilt {len(self.collision_rects)} collision rects from obstacles.")
 
-    def set_player(self, player: object, start_pos: tuple = (100, 100)) -> None:
+    def set_player(self, player: object, start_pos: Optional[tuple] = None) -> None:
         self.player = player
+        if start_pos is None:
+            start_pos = self.player_start or (100, 100)
         if self.player:
             self.player.x, self.player.y = start_pos
             self.player.rect.topleft = start_pos
+            if hasattr(self.player, "bounds"):
+                self.player.bounds = pygame.Rect(0, 0, self.world_width, self.world_height)
+            self.camera.center_on(self.player.rect)
             print(f"✅ Player set at {start_pos}")
 
     # --- Core Logic Implementation ---
@@ -87,40 +329,135 @@ class BaseScene(IScene):
     def check_collision(self, rect: pygame.Rect) -> bool:
         """
         Checks if the given rect collides with:
-        1. Any rect in self.collision_rects
-        2. The self.wall_mask (pixel perfect)
+        1. Any rect in self.collision_rects or self.wall_rects (broadphase);
+           rects with a footprint mask are then checked pixel by pixel
+        2. The leftover wall pixels on diagonal edges (pixel perfect)
+        Together the wall rects and 2 cover exactly the pixels of self.wall_mask.
         """
-        # 1. Obstacle Rects
-        if rect.collidelist(self.collision_rects) != -1:
-            return True
-        
-        # 2. Wall Mask
-        if self.wall_mask:
-            # Create a mask for the player/rect
-            # Optimisation: We assume the player is roughly a filled box for mask check, or we could use player's actual mask if available.
-            # Using a filled rect mask is safer and standard for top-down walking.
-            player_mask = pygame.mask.Mask(rect.size, fill=True)
-            offset = (rect.x, rect.y)
-            if self.wall_mask.overlap(player_mask, offset):
+        # The player is treated as a filled box (standard for top-down walking)
+        player_mask = self._filled_masks.get(rect.size)
+        if player_mask is None:
+            player_mask = self._filled_masks[rect.size] = pygame.mask.Mask(rect.size, fill=True)
+
+        # 1. Obstacle + Wall Rects
+        broadphase = self._get_broadphase()
+        if not self._broadphase_masks:
+            if broadphase.first_hit(rect) is not None:
+                return True
+        else:
+            for key in broadphase.query(rect):
+                mask = self._broadphase_masks.get(key)
+                if mask is None:
+                    return True
+                box = broadphase.get(key)
+                if mask.overlap(player_mask, (rect.x - box.x, rect.y - box.y)):
+                    return True
+
+        # 2. Diagonal wall edges
+        if self.wall_residual is not None and rect.collidelist(self._wall_residual_boxes) != -1:
+            if self.wall_residual.overlap(player_mask, rect.topleft):
                 return True
 
         return False
 
+    def _get_broadphase(self) -> SpatialHash:
+        """
+        Spatial hash of collision_rects ("rect", i) and wall_rects ("wall", i).
+        Rebuilt only when one of the lists is replaced or changes length; call
+        invalidate_broadphase() after moving a rect.
+        """
+        version = (id(self.collision_rects), len(self.collision_rects), id(self.wall_rects), len(self.wall_rects))
+        if version != self._broadphase_version:
+            broadphase = self._broadphase
+            broadphase.clear()
+            self._broadphase_masks.clear()
+            for i, rect in enumerate(self.collision_rects):
+                broadphase.insert(("rect", i), rect)
+                mask = self.collision_masks[i] if i < len(self.collision_masks) else None
+                if mask is not None:
+                    self._broadphase_masks[("rect", i)] = mask
+            for i, rect in enumerate(self.wall_rects):
+                broadphase.insert(("wall", i), rect)
+            self._broadphase_version = version
+        return self._broadphase
+
+    def invalidate_broadphase(self) -> None:
+        self._broadphase_version = None
+
+    def get_distance_field(self) -> DistanceField:
+        """
+        Signed distance field of the walls and collision rects (see distance_field).
+        Recomputed (or read from the disk cache) when the collision geometry changes.
+        """
+        self._get_broadphase()
+        if self._distance_field is None or self._distance_field_version != self._broadphase_version:
+            blocked = occupancy((self.world_width, self.world_height), self.wall_mask,
+                                self.collision_rects, self.collision_masks)
+            self._distance_field, from_cache = load_distance_field(blocked)
+            self._distance_field_version = self._broadphase_version
+            field = self._distance_field
+            print(f"✅ Distance field{' (cache)' if from_cache else ''}: {field.cols}x{field.rows} cells")
+        return self._distance_field
+
+    def prevent_collision(self, player_rect: pygame.Rect, old_x: float, old_y: float) -> tuple:
+        """
+        Collision response: slide along one axis if possible, otherwise push the
+        rect out of the wall along the distance-field gradient (handles diagonal
+        walls and spawning inside an obstacle). Returns the safe (x, y).
+        """
+        if not self.check_collision(player_rect):
+            return player_rect.x, player_rect.y
+
+        target_x, target_y = player_rect.x, player_rect.y
+        test_rect = player_rect.copy()
+
+        # 1. Axis separation (standard sliding), X first
+        if target_x != old_x:
+            test_rect.topleft = (target_x, int(old_y))
+            if not self.check_collision(test_rect):
+                return target_x, old_y
+        if target_y != old_y:
+            test_rect.topleft = (int(old_x), target_y)
+            if not self.check_collision(test_rect):
+                return old_x, target_y
+
+        # 2. Push out along the gradient; the box's extent along the normal is its "radius"
+        field = self.get_distance_field()
+        half_w, half_h = player_rect.width / 2, player_rect.height / 2
+        x, y = float(target_x), float(target_y)
+        for _ in range(self.PUSH_OUT_ITERATIONS):
+            cx, cy = x + half_w, y + half_h
+            nx, ny = field.gradient(cx, cy)
+            if nx == 0 and ny == 0:
+                break
+            depth = abs(nx) * half_w + abs(ny) * half_h - field.distance(cx, cy)
+            step = min(max(depth, 1.0), self.MAX_PUSH_OUT)
+            x += nx * step
+            y += ny * step
+            if abs(x - target_x) > self.MAX_PUSH_OUT or abs(y - target_y) > self.MAX_PUSH_OUT:
+                break
+            test_rect.topleft = (round(x), round(y))
+            if not self.check_collision(test_rect):
+                return test_rect.x, test_rect.y
+
+        # 3. Fallback: Full Stop
+        return old_x, old_y
+
     def handle_event(self, event: pygame.event.Event) -> None:
         """Handles debug toggle and interaction areas."""
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_F3:
                 self.debug_mode = not self.debug_mode
                 print(f"Debug mode: {'ON' if self.debug_mode else 'OFF'}")
-        
-        for area in self.interaction_areas:
-            area.handle_event(event)
+
+        # The interact key goes to the focused (highest-priority) area only
+        self._get_triggers().handle_event(event)
 
     def update(self) -> None:
-        """Updates interaction areas with player position."""
+        """Updates the areas the player is inside (enter/exit events, focus) and the camera."""
         if self.player:
-            for area in self.interaction_areas:
-                area.update(self.player.rect)
+            self._get_triggers().update(self.player.rect)
+            self.camera.update(self.player.rect)
 
     def draw(self, screen: pygame.Surface) -> None:
         """
@@ -130,95 +467,133 @@ class BaseScene(IScene):
         We will support `draw_with_player` as the primary render method if the game loop uses it.
         If the game loop calls `draw`, we will just draw background and debug.
         """
-        screen.blit(self.background, (0, 0))
+        self._draw_background(screen)
         if self.debug_mode:
             self._draw_debug(screen)
 
+    def _draw_background(self, screen: pygame.Surface) -> None:
+        """Blits only the visible region of the background (a subsurface of it)."""
+        if self.camera.scrolls:
+            view = self.camera.rect.clip(self.background.get_rect())
+            if view.width and view.height:
+                screen.blit(self.background.subsurface(view), self.camera.to_screen(view.topleft))
+        else:
+            screen.blit(self.background, (0, 0))
+
     def draw_with_player(self, screen: pygame.Surface, player: object) -> None:
         """
         Y-Sort rendering of all scene entities + player.
         """
-        # 1. Background
-        screen.blit(self.background, (0, 0))
-
-        # 2. Collect All Drawable Objects
-        drawable_objects = []
-
-        # Player
-        drawable_objects.append({
-            'type': 'player', 
-            'y': player.rect.bottom, 
-            'item': player
-        })
-
-        # Obstacles
-        for obj in self.obstacles:
-            # Ensure object has image and position
-            if 'image' in obj and 'position' in obj:
-                # Use bottom of rect for sorting if available, else position + height
-                y = obj['position'][1] + obj['image'].get_height()
-                if 'rect' in obj:
-                    y = obj['rect'].bottom
-                drawable_objects.append({'type': 'object', 'y': y, 'item': obj})
-
-        # NPCs
-        for npc in self.npcs:
-            y = npc['position'][1] + npc['image'].get_height()
-            if 'rect' in npc:
-                y = npc['rect'].bottom
-            drawable_objects.append({'type': 'npc', 'y': y, 'item': npc})
-
-        # Collectibles (Items on ground)
-        for item in self.collectible_items:
-            y = item['position'][1] + item['image'].get_height()
-            if 'rect' in item:
-                y = item['rect'].bottom
-            drawable_objects.append({'type': 'collectible', 'y': y, 'item': item})
-
-        # 3. Sort by Y
-        drawable_objects.sort(key=lambda x: x['y'])
-
-        # 4. Draw
-        for obj in drawable_objects:
-            t = obj['type']
-            item = obj['item']
-            if t == 'player':
-                item.draw(screen)
-            else:
-                screen.blit(item['image'], item['position'])
+        # 1. Background (visible region)
+        self._draw_background(screen)
+
+        # 2. Static objects are pre-sorted; the player is inserted by its Y
+        #    (before objects with the same Y, as in a stable sort with the player first)
+        queue = self._get_render_queue()
+        split = bisect_left(self._render_keys, player.rect.bottom)
 
-        # 5. Overlays (Interaction Areas)
-        for area in self.interaction_areas:
-            area.draw(screen, player.rect)
+        # 3. Draw
+        if not self.camera.scrolls:
+            for obj in queue[:split]:
+                screen.blit(obj.image, obj.position)
+            player.draw(screen)
+            for obj in queue[split:]:
+                screen.blit(obj.image, obj.position)
+        else:
+            # Only the sprites in view (render index), kept in queue order
+            visible = sorted(self._render_index.query(self.camera.rect))
+            cut = bisect_left(visible, split)
+            ox, oy = self.camera.offset
+            for i in visible[:cut]:
+                obj = queue[i]
+                screen.blit(obj.image, (obj.position[0] - ox, obj.position[1] - oy))
+            player.draw(screen, (ox, oy))
+            for i in visible[cut:]:
+                obj = queue[i]
+                screen.blit(obj.image, (obj.position[0] - ox, obj.position[1] - oy))
+
+        # 5. Overlays (prompt of the focused Interaction Area)
+        self.triggers.draw(screen, self.camera.apply(player.rect))
 
         # 6. Debug
         if self.debug_mode:
             self._draw_debug(screen)
 
+    def _get_render_queue(self) -> List[SceneObject]:
+        """
+        Scene objects sorted by sort_y (obstacles, NPCs, collectibles for equal Y).
+        Rebuilt only when one of the object lists is replaced or changes length;
+        call invalidate_render_queue() after moving objects. Scrolling scenes
+        also index the sprites' draw bounds (self._render_index) for culling.
+        """
+        version = (id(self.obstacles), len(self.obstacles), id(self.npcs), len(self.npcs),
+                   id(self.collectible_items), len(self.collectible_items), self.camera.scrolls)
+        if version != self._render_version:
+            queue = [*self.obstacles, *self.npcs, *self.collectible_items]
+            queue.sort(key=lambda obj: obj.sort_y)
+            self._render_queue = queue
+            self._render_keys = [obj.sort_y for obj in queue]
+            self._render_index.clear()
+            if self.camera.scrolls:
+                for i, obj in enumerate(queue):
+                    self._render_index.insert(i, (obj.position, obj.image.get_size()))
+            self._render_version = version
+        return self._render_queue
+
+    def invalidate_render_queue(self) -> None:
+        self._render_version = None
+
     def _draw_debug(self, screen: pygame.Surface):
-        # Obstacles (Red)
-        for rect in self.collision_rects:
-            s = pygame.Surface(rect.size, pygame.SRCALPHA)
-            s.fill((255, 0, 0, 100))
-            screen.blit(s, rect.topleft)
-            pygame.draw.rect(screen, (255, 0, 0), rect, 2)
+        view = self.camera.rect
+        ox, oy = self.camera.offset
+
+        # Obstacles in view (Red; footprint masks filled, their box outlined)
+        for kind, i in self._get_broadphase().query(view):
+            if kind != "rect":
+                continue
+            rect = self.collision_rects[i].move(-ox, -oy)
+            mask = self.collision_masks[i] if i < len(self.collision_masks) else None
+            if mask is None:
+                s = pygame.Surface(rect.size, pygame.SRCALPHA)
+                s.fill((255, 0, 0, 100))
+                screen.blit(s, rect.topleft)
+                pygame.draw.rect(screen, (255, 0, 0), rect, 2)
+            else:
+                screen.blit(mask.to_surface(setcolor=(255, 0, 0, 100), unsetcolor=(0, 0, 0, 0)), rect.topleft)
+                pygame.draw.rect(screen, (255, 0, 0), rect, 1)
         
-        # Wall Mask (Blue Outline)
+        # Walls (Blue rects, diagonal edges in light blue) - drawn once, then the visible part blitted
         if self.wall_mask:
-            outline = self.wall_mask.outline()
-            if outline:
-                pygame.draw.lines(screen, (0, 0, 255), True, outline, 2)
+            if self._wall_debug_overlay is None:
+                self._wall_debug_overlay = self._render_wall_overlay()
+            visible = view.clip(self._wall_debug_overlay.get_rect())
+            if visible.width and visible.height:
+                screen.blit(self._wall_debug_overlay, self.camera.to_screen(visible.topleft), visible)
 
-        # Interaction Areas (Cyan/Green - handled by their own debug draw)
-        for area in self.interaction_areas:
-            area.draw_debug(screen)
+        # Interaction Areas in view (Cyan/Green - handled by their own debug draw; focused one in yellow)
+        for area in self._get_triggers().query(view):
+            area.draw_debug(screen, (ox, oy))
+        if self.triggers.focused is not None:
+            pygame.draw.rect(screen, (255, 255, 0), self.camera.apply(self.triggers.focused.rect), 2)
             
         # Stats
-        font = pygame.font.Font(None, 24)
+        font = self.get_debug_font()
         count_obs = len(self.collision_rects)
+        count_walls = len(self.wall_rects)
         count_int = len(self.interaction_areas)
         count_npc = len(self.npcs)
         
-        text_str = f"BaseScene | Obs: {count_obs} | NPCs: {count_npc} | Interact: {count_int} | F3: Toggle Debug"
-        text = font.render(text_str, True, (255, 255, 0))
+        text_str = f"BaseScene | Obs: {count_obs} | Walls: {count_walls} | NPCs: {count_npc} | Interact: {count_int} | F3: Toggle Debug"
+        text = render_text(font, text_str, (255, 255, 0))
         screen.blit(text, (10, 10))
+
+        cache_str = f"Text cache: {text_cache.hit_rate:.0%} hits | {text_cache.bytes_used // 1024} KB"
+        screen.blit(render_text(font, cache_str, (255, 255, 0)), (10, 10 + text.get_height()))
+
+    def _render_wall_overlay(self) -> pygame.Surface:
+        overlay = pygame.Surface(self.wall_mask.get_size(), pygame.SRCALPHA)
+        if self.wall_residual is not None:
+            overlay.blit(self.wall_residual.to_surface(setcolor=(120, 160, 255, 140), unsetcolor=(0, 0, 0, 0)), (0, 0))
+        for rect in self.wall_rects:
+            pygame.draw.rect(overlay, (0, 0, 255), rect, 1)
+        return overlay
@@ -0,0 +1,193 @@
+"""
+Distance Field
+==============
+Trường khoảng cách có dấu (signed distance field) của vùng đi được trong một
+scene, tính bằng NumPy từ wall mask và footprint của các vật cản.
+
+- Lưới được thu nhỏ CELL_SIZE lần (mỗi ô bị chặn nếu có bất kỳ pixel tường /
+  vật cản nào), rồi chạy hai lượt chamfer (trọng số 1 và √2): lượt xuôi từ
+  trên-trái, lượt ngược từ dưới-phải. Mỗi dòng được xử lý bằng phép toán
+  vector (cummin), chỉ vòng lặp Python theo dòng.
+- Giá trị tính bằng pixel: dương trong vùng đi được (khoảng cách tới tường gần
+  nhất), âm bên trong tường. Gradient (np.gradient) chỉ hướng ra xa tường.
+- distance()/gradient() tra cứu O(1) theo ô.
+
+Trường được cache ra đĩa (saves/cache/scenes, cạnh bản biên dịch scene), khóa
+theo hash của lưới chiếm chỗ, nên chỉ tính lại khi tường hoặc vật cản đổi.
+"""
+
+import hashlib
+import math
+import os
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from .scene_loader import SCENE_CACHE_DIR
+
+FIELD_VERSION = 1
+CELL_SIZE = 4
+SQRT2 = math.sqrt(2.0)
+
+
+# --- Lưới chiếm chỗ ---
+
+def mask_to_array(mask: pygame.mask.Mask) -> np.ndarray:
+    """Mask -> mảng bool (h, w)."""
+    width, height = mask.get_size()
+    surface = mask.to_surface(setcolor=(255, 255, 255, 255), unsetcolor=(0, 0, 0, 0))
+    alpha = np.frombuffer(pygame.image.tobytes(surface, "RGBA"), dtype=np.uint8)[3::4]
+    return alpha.reshape(height, width) > 0
+
+
+def occupancy(size: Tuple[int, int], wall_mask: Optional[pygame.mask.Mask],
+              rects: List[pygame.Rect], masks: List[Optional[pygame.mask.Mask]]) -> np.ndarray:
+    """
+    Pixel bị chặn (bool, (h, w)): wall mask + các rect va chạm (đặc, hoặc theo
+    mask cùng chỉ số trong `masks`).
+    """
+    width, height = size
+    blocked = mask_to_array(wall_mask) if wall_mask is not None else np.zeros((height, width), dtype=bool)
+    screen = pygame.Rect(0, 0, width, height)
+    for i, rect in enumerate(rects):
+        clipped = rect.clip(screen)
+        if not clipped.width or not clipped.height:
+            continue
+        mask = masks[i] if i < len(masks) else None
+        target = blocked[clipped.top:clipped.bottom, clipped.left:clipped.right]
+        if mask is None:
+            target[...] = True
+        else:
+            pixels = mask_to_array(mask)
+            target |= pixels[clipped.top - rect.top:clipped.bottom - rect.top,
+                             clipped.left - rect.left:clipped.right - rect.left]
+    return blocked
+
+
+def downsample(blocked: np.ndarray, cell: int = CELL_SIZE) -> np.ndarray:
+    """Ô cell x cell bị chặn nếu có ít nhất một pixel bị chặn."""
+    height, width = blocked.shape
+    rows, cols = -(-height // cell), -(-width // cell)
+    padded = np.zeros((rows * cell, cols * cell), dtype=bool)
+    padded[:height, :width] = blocked
+    return padded.reshape(rows, cell, cols, cell).any(axis=(1, 3))
+
+
+# --- Chamfer ---
+
+def chamfer_distance(seeds: np.ndarray) -> np.ndarray:
+    """
+    Khoảng cách chamfer (đơn vị ô, trọng số 1 / √2) từ mỗi ô tới ô `seeds` gần nhất.
+    """
+    rows, cols = seeds.shape
+    far = float(rows + cols) * 2.0
+    dist = np.where(seeds, 0.0, far)
+    index = np.arange(cols, dtype=np.float64)
+
+    def sweep_row(row: np.ndarray, neighbour: Optional[np.ndarray]) -> np.ndarray:
+        if neighbour is not None:
+            row = np.minimum(row, neighbour + 1.0)
+            row[1:] = np.minimum(row[1:], neighbour[:-1] + SQRT2)
+            row[:-1] = np.minimum(row[:-1], neighbour[1:] + SQRT2)
+        # row[x] = min(row[x], row[x-1] + 1) cho cả dòng: cummin(row[k] - k) + x
+        row = np.minimum.accumulate(row - index) + index
+        # rồi chiều ngược lại
+        reverse = row[::-1]
+        return (np.minimum.accumulate(reverse - index) + index)[::-1]
+
+    for y in range(rows):  # lượt xuôi
+        dist[y] = sweep_row(dist[y], dist[y - 1] if y else None)
+    for y in range(rows - 2, -1, -1):  # lượt ngược
+        dist[y] = sweep_row(dist[y], dist[y + 1])
+    return dist
+
+
+def signed_distance(blocked_cells: np.ndarray, cell: int = CELL_SIZE) -> np.ndarray:
+    """Khoảng cách có dấu theo pixel: dương ở ô trống, âm ở ô bị chặn; biên nằm giữa hai ô."""
+    if blocked_cells.all():
+        return np.full(blocked_cells.shape, -float(cell), dtype=np.float32)
+    if not blocked_cells.any():
+        far = float(sum(blocked_cells.shape) * cell)
+        return np.full(blocked_cells.shape, far, dtype=np.float32)
+    outside = chamfer_distance(blocked_cells)
+    inside = chamfer_distance(~blocked_cells)
+    sdf = np.where(blocked_cells, -(inside - 0.5), outside - 0.5) * cell
+    return sdf.astype(np.float32)
+
+
+# --- Trường khoảng cách ---
+
+class DistanceField:
+    """SDF theo ô + gradient, tra cứu O(1) theo tọa độ pixel."""
+
+    def __init__(self, sdf: np.ndarray, cell: int = CELL_SIZE) -> None:
+        """
+        Args:
+            sdf: Khoảng cách có dấu theo pixel, shape (rows, cols)
+            cell: Kích thước một ô theo pixel
+        """
+        self.sdf = sdf
+        self.cell = cell
+        self.rows, self.cols = sdf.shape
+        grad_y, grad_x = np.gradient(sdf.astype(np.float64))
+        self.grad_x = grad_x.astype(np.float32)
+        self.grad_y = grad_y.astype(np.float32)
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        cx = min(max(int(x) // self.cell, 0), self.cols - 1)
+        cy = min(max(int(y) // self.cell, 0), self.rows - 1)
+        return cy, cx
+
+    def distance(self, x: float, y: float) -> float:
+        """Khoảng cách (px) từ (x, y) tới tường gần nhất; âm nếu đang ở trong tường."""
+        return self.sdf.item(self._cell(x, y))
+
+    def gradient(self, x: float, y: float) -> Tuple[float, float]:
+        """Hướng (đã chuẩn hóa) ra xa tường gần nhất; (0, 0) nếu trường phẳng."""
+        index = self._cell(x, y)
+        gx = self.grad_x.item(index)
+        gy = self.grad_y.item(index)
+        length = math.hypot(gx, gy)
+        if length < 1e-6:
+            return 0.0, 0.0
+        return gx / length, gy / length
+
+    def to_surface(self, scale: float = 2.0) -> pygame.Surface:
+        """Ảnh debug (kích thước lưới): xanh = xa tường, đỏ = trong tường."""
+        values = np.clip(self.sdf * scale, -255, 255)
+        rgb = np.zeros((self.rows, self.cols, 3), dtype=np.uint8)
+        rgb[..., 0] = np.where(values < 0, -values, 0)
+        rgb[..., 1] = np.where(values > 0, values, 0)
+        return pygame.image.frombuffer(rgb.tobytes(), (self.cols, self.rows), "RGB")
+
+
+def load_distance_field(blocked: np.ndarray, cell: int = CELL_SIZE,
+                        cache_dir: Optional[str] = SCENE_CACHE_DIR) -> Tuple[DistanceField, bool]:
+    """
+    DistanceField của lưới pixel `blocked`, lấy từ cache nếu lưới không đổi.
+    Trả về (field, from_cache).
+    """
+    cells = downsample(blocked, cell)
+    digest = hashlib.sha1(np.packbits(cells).tobytes())
+    digest.update(f"|{cells.shape}|{cell}|v{FIELD_VERSION}".encode())
+    cache_path = os.path.join(cache_dir, f"sdf-{digest.hexdigest()[:16]}.npy") if cache_dir else None
+
+    if cache_path:
+        try:
+            sdf = np.load(cache_path, allow_pickle=False)
+            if sdf.shape == cells.shape:
+                return DistanceField(sdf, cell), True
+        except (OSError, ValueError):
+            pass
+
+    sdf = signed_distance(cells, cell)
+    if cache_path:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = cache_path + ".tmp.npy"
+            np.save(tmp_path, sdf, allow_pickle=False)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"⚠️  Could not cache distance field: {e}")
+    return DistanceField(sdf, cell), False
@@ -0,0 +1,409 @@
+"""
+Reachability
+============
+Phân tích vùng đi được của một scene với đúng kích thước hitbox của player,
+bằng NumPy trên lưới chiếm chỗ (wall mask + collision rects / footprint mask,
+xem distance_field.occupancy).
+
+1. Không gian cấu hình (C-space): vị trí góc trên-trái (x, y) hợp lệ khi hitbox
+   w x h đặt tại đó không chạm pixel bị chặn nào. Tính chính xác từng pixel
+   bằng ảnh tích phân (integral image). Player bị kẹp trong thế giới của scene
+   (Player.bounds, đặt bởi set_player).
+2. Vị trí được gom theo khối STEP x STEP: khối "chắc chắn" khi mọi vị trí trong
+   khối hợp lệ (hai khối kề nhau như vậy luôn đi qua lại được), khối "có thể"
+   khi có ít nhất một vị trí hợp lệ. Loang (flood fill, 4 hướng) từ vị trí bắt
+   đầu trên cả hai lưới: chỉ tới được trên lưới "có thể" nghĩa là phải lách qua
+   khe hẹp hơn STEP px.
+3. Sàn (ô không có pixel bị chặn) mà thân player không bao giờ phủ tới là
+   "vùng chết"; vùng chết nằm giữa hai vùng đi được rời nhau là lối hẹp hơn
+   player.
+
+Báo cáo: khu vực tương tác / vật phẩm không tới được, lối hẹp, túi rời (vùng
+player đứng vừa nhưng không đi tới được), kèm ảnh heatmap.
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pygame
+
+import config as cfg
+from .distance_field import downsample, mask_to_array, occupancy
+
+# Hitbox thật của player (Player.width / height)
+PLAYER_SIZE = (cfg.SPRITE_WIDTH * cfg.SPRITE_SCALE, cfg.SPRITE_HEIGHT * cfg.SPRITE_SCALE)
+DEFAULT_START = (100, 100)  # như BaseScene.set_player
+STEP = 4
+MIN_GAP_CELLS = 2  # vùng chết nhỏ hơn (ô) bị bỏ qua
+
+REACHABLE = "reachable"
+TIGHT = "tight"
+UNREACHABLE = "unreachable"
+
+
+# --- Lưới ---
+
+def free_positions(blocked: np.ndarray, size: Tuple[int, int], bounds: Tuple[int, int]) -> np.ndarray:
+    """
+    Vị trí góc trên-trái hợp lệ của hitbox `size` (bool, (bh - h + 1, bw - w + 1)).
+    Pixel ngoài `blocked` nhưng trong `bounds` được coi là trống.
+    """
+    width, height = size
+    bound_w, bound_h = bounds
+    if bound_w < width or bound_h < height:
+        return np.zeros((0, 0), dtype=bool)
+    area = np.zeros((bound_h, bound_w), dtype=bool)
+    rows = min(bound_h, blocked.shape[0])
+    cols = min(bound_w, blocked.shape[1])
+    area[:rows, :cols] = blocked[:rows, :cols]
+
+    integral = np.zeros((bound_h + 1, bound_w + 1), dtype=np.int32)
+    np.cumsum(area, axis=0, out=integral[1:, 1:])
+    np.cumsum(integral[1:, 1:], axis=1, out=integral[1:, 1:])
+    hits = (integral[height:, width:] - integral[:-height, width:]
+            - integral[height:, :-width] + integral[:-height, :-width])
+    return hits == 0
+
+
+def group_blocks(free: np.ndarray, step: int = STEP) -> Tuple[np.ndarray, np.ndarray]:
+    """(chắc chắn, có thể): khối step x step có mọi / ít nhất một vị trí hợp lệ."""
+    height, width = free.shape
+    rows, cols = -(-height // step), -(-width // step)
+    padded = np.zeros((rows * step, cols * step), dtype=bool)
+    padded[:height, :width] = free
+    blocks = padded.reshape(rows, step, cols, step)
+    safe = blocks.all(axis=(1, 3))
+    if height % step or width % step:  # khối ở mép chỉ xét phần nằm trong lưới
+        safe[:, -1] = blocks[:, :, -1, :width - (cols - 1) * step].all(axis=(1, 2))
+        safe[-1, :] = blocks[-1, :height - (rows - 1) * step].all(axis=(0, 2))
+        safe[-1, -1] = free[(rows - 1) * step:, (cols - 1) * step:].all()
+    return safe, blocks.any(axis=(1, 3))
+
+
+def _neighbours(cells: np.ndarray) -> np.ndarray:
+    grown = cells.copy()
+    grown[1:] |= cells[:-1]
+    grown[:-1] |= cells[1:]
+    grown[:, 1:] |= cells[:, :-1]
+    grown[:, :-1] |= cells[:, 1:]
+    return grown
+
+
+def flood_fill(passable: np.ndarray, seeds: np.ndarray) -> np.ndarray:
+    """Số bước (4 hướng) từ `seeds` tới mỗi ô đi được; -1 nếu không tới được."""
+    distance = np.full(passable.shape, -1, dtype=np.int32)
+    frontier = seeds & passable
+    reached = frontier.copy()
+    step = 0
+    while frontier.any():
+        distance[frontier] = step
+        frontier = _neighbours(frontier) & passable & ~reached
+        reached |= frontier
+        step += 1
+    return distance
+
+
+def label_regions(passable: np.ndarray) -> Tuple[np.ndarray, int]:
+    """Gán nhãn 1..n cho các vùng liên thông (4 hướng); 0 là ô không đi được."""
+    labels = np.zeros(passable.shape, dtype=np.int32)
+    remaining = passable.copy()
+    count = 0
+    while remaining.any():
+        count += 1
+        seed = np.zeros_like(remaining)
+        seed[np.unravel_index(np.argmax(remaining), remaining.shape)] = True
+        region = flood_fill(remaining, seed) >= 0
+        labels[region] = count
+        remaining &= ~region
+    return labels, count
+
+
+def body_cover(blocks: np.ndarray, body: Tuple[int, int], shape: Tuple[int, int]) -> np.ndarray:
+    """
+    Ô sàn (lưới `shape`) mà thân player phủ tới từ ít nhất một khối trong
+    `blocks`; body = (số ô theo chiều ngang, chiều dọc) của hitbox.
+    """
+    body_w, body_h = body
+    rows, cols = shape
+    integral = np.zeros((rows + 1, cols + 1), dtype=np.int32)
+    source = np.zeros((rows, cols), dtype=np.int32)
+    r, c = min(rows, blocks.shape[0]), min(cols, blocks.shape[1])
+    source[:r, :c] = blocks[:r, :c]
+    np.cumsum(source, axis=0, out=integral[1:, 1:])
+    np.cumsum(integral[1:, 1:], axis=1, out=integral[1:, 1:])
+    # ô (i, j) được phủ nếu có khối trong [i - body_h + 1, i] x [j - body_w + 1, j]
+    top = np.clip(np.arange(rows) - body_h + 1, 0, None)
+    left = np.clip(np.arange(cols) - body_w + 1, 0, None)
+    bottom = np.arange(rows) + 1
+    right = np.arange(cols) + 1
+    hits = (integral[bottom][:, right] - integral[top][:, right]
+            - integral[bottom][:, left] + integral[top][:, left])
+    return hits > 0
+
+
+def array_to_mask(cells: np.ndarray) -> pygame.mask.Mask:
+    rows, cols = cells.shape
+    rgba = np.zeros((rows, cols, 4), dtype=np.uint8)
+    rgba[cells] = 255
+    surface = pygame.image.frombuffer(rgba.tobytes(), (cols, rows), "RGBA")
+    return pygame.mask.from_surface(surface, 127)
+
+
+# --- Báo cáo ---
+
+class ReachabilityReport:
+    """Kết quả analyze(): lưới theo khối STEP px và danh sách vấn đề (tọa độ pixel)."""
+
+    def __init__(self, name: str, size: Tuple[int, int], start: Tuple[int, int]) -> None:
+        """
+        Args:
+            name: Tên scene
+            size: Kích thước scene (pixel)
+            start: Vị trí bắt đầu của player (góc trên-trái)
+        """
+        self.name = name
+        self.size = size
+        self.start = start
+        self.player_size = PLAYER_SIZE
+        self.step = STEP
+        self.start_blocked = False
+        self.blocked_cells: Optional[np.ndarray] = None  # ô sàn bị chặn (lưới step)
+        self.distance: Optional[np.ndarray] = None       # số bước từ start theo khối vị trí, -1 = không tới
+        self.tight: Optional[np.ndarray] = None          # khối chỉ tới được qua khe hẹp
+        self.isolated: Optional[np.ndarray] = None       # khối chắc chắn nhưng không tới được (túi rời)
+        self.dead: Optional[np.ndarray] = None           # ô sàn thân player không phủ tới
+        self.targets: List[Dict] = []                    # {"kind", "name", "rect", "status"}
+        self.passages: List[pygame.Rect] = []            # sàn giữa hai vùng rời, player không lọt
+        self.pockets: List[Dict] = []                    # {"rect", "area" (số vị trí đứng), "tight"}
+        self.elapsed_ms = 0.0
+
+    @property
+    def problems(self) -> int:
+        unreachable = sum(1 for t in self.targets if t["status"] == UNREACHABLE)
+        return unreachable + int(self.start_blocked)
+
+    @property
+    def dead_ratio(self) -> float:
+        """Tỉ lệ sàn mà thân player không phủ tới được."""
+        if self.dead is None or self.blocked_cells is None:
+            return 0.0
+        floor = int((~self.blocked_cells).sum())
+        return float(self.dead.sum()) / floor if floor else 0.0
+
+    def summary(self) -> str:
+        tight = sum(1 for t in self.targets if t["status"] == TIGHT)
+        unreachable = [t for t in self.targets if t["status"] == UNREACHABLE]
+        lines = [f"{self.name}: {len(self.targets)} targets, {len(unreachable)} unreachable, "
+                 f"{tight} tight, {len(self.passages)} narrow passages, {len(self.pockets)} pockets, "
+                 f"{self.dead_ratio:.0%} of floor out of reach ({self.elapsed_ms:.0f} ms)"]
+        if self.start_blocked:
+            lines.append(f"   ⚠️  start {self.start} collides with walls/obstacles")
+        for target in unreachable:
+            lines.append(f"   ⚠️  unreachable {target['kind']} '{target['name']}' at {tuple(target['rect'])}")
+        for target in self.targets:
+            if target["status"] == TIGHT:
+                lines.append(f"   ⚠️  {target['kind']} '{target['name']}' only reachable through a gap < {self.step}px")
+        for passage in self.passages:
+            lines.append(f"   ⚠️  passage too narrow for the {self.player_size[0]}x{self.player_size[1]} player "
+                         f"at {tuple(passage)}")
+        for pocket in self.pockets:
+            note = " (tight entrance)" if pocket["tight"] else ""
+            lines.append(f"   ⚠️  disconnected pocket ({pocket['area']} standing positions) at {tuple(pocket['rect'])}{note}")
+        return "\n".join(lines)
+
+
+def _start_seed(safe: np.ndarray, possible: np.ndarray, start: Tuple[int, int],
+                step: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Ô khởi đầu trên hai lưới; trên lưới chắc chắn dùng các khối kề nếu khối chứa start không trọn."""
+    seed = np.zeros(safe.shape, dtype=bool)
+    row, col = start[1] // step, start[0] // step
+    if 0 <= row < seed.shape[0] and 0 <= col < seed.shape[1]:
+        seed[row, col] = True
+    if (seed & safe).any():
+        return seed, seed
+    return _neighbours(seed) & safe, seed & possible
+
+
+def _target_blocks(rect: pygame.Rect, size: Tuple[int, int], step: int,
+                   shape: Tuple[int, int]) -> Tuple[slice, slice]:
+    """Khối vị trí có ít nhất một vị trí mà hitbox chạm `rect`."""
+    width, height = size
+    rows, cols = shape
+    col0 = max((rect.left - width) // step, 0)  # x + width > rect.left
+    col1 = min(max(rect.right - 1, 0) // step + 1, cols)  # x < rect.right
+    row0 = max((rect.top - height) // step, 0)
+    row1 = min(max(rect.bottom - 1, 0) // step + 1, rows)
+    return slice(row0, max(row0, row1)), slice(col0, max(col0, col1))
+
+
+def scene_targets(scene) -> List[Dict]:
+    """
+    Khu vực tương tác và vật phẩm của scene. Vật phẩm dùng khu vực của nó (hoặc
+    rect); khu vực được đặt tên theo vật thể sở hữu nếu có.
+    """
+    owners = {}
+    for group, kind in ((getattr(scene, "obstacles", []), "obstacle"), (getattr(scene, "npcs", []), "npc")):
+        for entity in group:
+            if entity.interaction_area is not None:
+                owners[entity.interaction_area] = (kind, entity.name)
+    targets = []
+    for item in getattr(scene, "collectible_items", []):
+        area = item.interaction_area
+        if area is not None:
+            owners[area] = None
+        targets.append({"kind": "collectible", "name": item.name,
+                        "rect": pygame.Rect(area.rect if area is not None else item.rect)})
+    for area in getattr(scene, "interaction_areas", []):
+        owner = owners.get(area, ("area", getattr(area.callback, "__name__", "area")))
+        if owner is not None:
+            targets.append({"kind": owner[0], "name": owner[1], "rect": pygame.Rect(area.rect)})
+    return targets
+
+
+def analyze(scene, name: str = "", start: Optional[Tuple[int, int]] = None,
+            bounds: Optional[Tuple[int, int]] = None, step: int = STEP) -> ReachabilityReport:
+    """
+    Phân tích một BaseScene đã load.
+
+    Args:
+        scene: Scene (cần wall_mask, collision_rects, collision_masks)
+        name: Tên hiển thị trong báo cáo
+        start: Vị trí bắt đầu; mặc định như set_player (player_start hoặc (100, 100))
+        bounds: Giới hạn kẹp vị trí player; mặc định là thế giới của scene (như Player.bounds)
+        step: Kích thước khối vị trí / ô sàn (pixel)
+    """
+    clock = time.perf_counter()
+    size = (getattr(scene, "world_width", scene.screen_width), getattr(scene, "world_height", scene.screen_height))
+    bounds = bounds or size
+    start = start or getattr(scene, "player_start", None) or DEFAULT_START
+    width, height = PLAYER_SIZE
+    # Player.update kẹp vị trí ngay frame đầu
+    start = (int(max(0, min(start[0], bounds[0] - width))), int(max(0, min(start[1], bounds[1] - height))))
+    report = ReachabilityReport(name or type(scene).__name__, size, start)
+    report.step = step
+
+    blocked = occupancy(size, getattr(scene, "wall_mask", None),
+                        getattr(scene, "collision_rects", []), getattr(scene, "collision_masks", []))
+    free = free_positions(blocked, PLAYER_SIZE, bounds)
+    safe, possible = group_blocks(free, step)
+    sx, sy = start
+    report.start_blocked = not (0 <= sy < free.shape[0] and 0 <= sx < free.shape[1] and free[sy, sx])
+
+    seed_safe, seed_possible = _start_seed(safe, possible, start, step)
+    distance = flood_fill(safe, seed_safe)
+    loose = flood_fill(possible, seed_possible | (distance >= 0)) >= 0
+    reached = distance >= 0
+    report.distance = distance
+    report.tight = loose & ~reached
+    report.isolated = safe & ~loose
+
+    # Khu vực tương tác / vật phẩm
+    for target in scene_targets(scene):
+        rows, cols = _target_blocks(target["rect"], PLAYER_SIZE, step, safe.shape)
+        if reached[rows, cols].any():
+            target["status"] = REACHABLE
+        elif loose[rows, cols].any():
+            target["status"] = TIGHT
+        else:
+            target["status"] = UNREACHABLE
+        report.targets.append(target)
+
+    # Sàn, vùng chết và các vùng đi được rời nhau
+    blocked_cells = downsample(blocked, step)
+    report.blocked_cells = blocked_cells
+    floor = ~blocked_cells
+    body = (width // step, height // step)
+    labels, count = label_regions(safe)
+    covers = [body_cover(labels == k, body, floor.shape) for k in range(1, count + 1)]
+    covered = np.zeros(floor.shape, dtype=bool)
+    for cover in covers:
+        covered |= cover
+    dead = floor & ~covered
+    report.dead = dead
+
+    start_labels = set(np.unique(labels[seed_safe])) - {0}
+    for k in range(1, count + 1):
+        if k in start_labels:
+            continue
+        region = labels == k
+        ys, xs = np.nonzero(covers[k - 1] & floor)
+        if not len(xs):
+            continue
+        rect = pygame.Rect(xs.min() * step, ys.min() * step,
+                           (xs.max() - xs.min() + 1) * step, (ys.max() - ys.min() + 1) * step)
+        report.pockets.append({"rect": rect, "area": int(region.sum()) * step * step,
+                               "tight": bool((region & loose).any())})
+
+    if count > 1 and dead.any():
+        for component in array_to_mask(dead).connected_components(MIN_GAP_CELLS):
+            cells = mask_to_array(component)
+            ring = _neighbours(cells) & ~cells
+            if sum(1 for cover in covers if (cover & ring).any()) < 2:
+                continue  # góc / cạnh chéo chỉ giáp một vùng: không phải lối đi
+            x, y, w, h = component.get_bounding_rects()[0]
+            report.passages.append(pygame.Rect(x * step, y * step, w * step, h * step))
+
+    report.elapsed_ms = (time.perf_counter() - clock) * 1000
+    return report
+
+
+# --- Heatmap ---
+
+STATUS_COLORS = {REACHABLE: (80, 220, 80), TIGHT: (255, 160, 0), UNREACHABLE: (255, 40, 40)}
+
+
+def render_heatmap(report: ReachabilityReport, background: Optional[pygame.Surface] = None) -> pygame.Surface:
+    """
+    Ảnh heatmap cỡ scene. Mỗi khối vị trí được tô tại chân player (giữa cạnh
+    dưới hitbox): xanh -> đỏ theo số bước từ start, cam = chỉ tới qua khe hẹp,
+    tím = túi rời. Tường / vật cản tối đi, vùng chết xanh dương; khung mục tiêu
+    theo trạng thái, lối hẹp vàng, hitbox lúc bắt đầu trắng.
+    """
+    step = report.step
+    rows, cols = report.blocked_cells.shape
+    rgba = np.zeros((rows, cols, 4), dtype=np.uint8)
+    rgba[report.blocked_cells] = (0, 0, 0, 150)
+    rgba[report.dead] = (40, 90, 255, 90)
+
+    # khối vị trí (i, j) -> ô sàn dưới chân
+    width, height = report.player_size
+    foot_row, foot_col = height // step - 1, width // (2 * step)
+    distance = report.distance
+    layers = [(report.isolated, None), (report.tight, None), (distance >= 0, distance)]
+    far = max(int(distance.max()), 1)
+    for blocks, values in layers:
+        ys, xs = np.nonzero(blocks)
+        ys, xs_cells = ys + foot_row, xs + foot_col
+        inside = (ys < rows) & (xs_cells < cols)
+        ys, xs_cells = ys[inside], xs_cells[inside]
+        if values is None:
+            color = (255, 0, 255, 170) if blocks is report.isolated else (255, 140, 0, 170)
+            rgba[ys, xs_cells] = color
+        else:
+            t = values[blocks][inside] / far
+            rgba[ys, xs_cells, 0] = np.minimum(255, 510 * t).astype(np.uint8)
+            rgba[ys, xs_cells, 1] = np.minimum(255, 510 * (1 - t)).astype(np.uint8)
+            rgba[ys, xs_cells, 2] = 40
+            rgba[ys, xs_cells, 3] = 150
+
+    overlay = pygame.image.frombuffer(rgba.tobytes(), (cols, rows), "RGBA")
+    overlay = pygame.transform.scale(overlay, (cols * step, rows * step))
+    image = pygame.Surface(report.size, pygame.SRCALPHA)
+    image.fill((40, 40, 40, 255))
+    if background is not None:
+        image.blit(background, (0, 0))
+    image.blit(overlay, (0, 0))
+
+    font = pygame.font.Font(None, 18) if pygame.font.get_init() else None
+    for target in report.targets:
+        color = STATUS_COLORS[target["status"]]
+        pygame.draw.rect(image, color, target["rect"], 2)
+        if font is not None:
+            image.blit(font.render(target["name"], True, color), (target["rect"].x, target["rect"].y - 14))
+    for passage in report.passages:
+        pygame.draw.rect(image, (255, 230, 0), passage, 2)
+    for pocket in report.pockets:
+        pygame.draw.rect(image, (255, 0, 255), pocket["rect"], 1)
+    pygame.draw.rect(image, (255, 255, 255), pygame.Rect(report.start, report.player_size), 2)
+    return image
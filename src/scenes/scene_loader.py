@@ -0,0 +1,448 @@
+"""
+Scene Loader
+============
+Đọc file định nghĩa scene (JSON), kiểm tra schema và "biên dịch" thành dạng
+đã tính sẵn (kích thước ảnh sau scale, vị trí, rect va chạm, vùng tương tác).
+
+Ảnh vật thể được cắt sát vùng có alpha (get_bounding_rect) khi biên dịch; rect
+va chạm của vật cản là "footprint" lấy tự động từ mask alpha: khung bao các
+pixel đặc trong dải đáy của ảnh (theo tỉ lệ chiều cao hoặc số pixel), thay cho
+việc chỉnh tay rect_offset/rect_modifier. Mặc định ("collision": "mask") vật
+cản còn va chạm theo từng pixel trong footprint; "rect" = cả footprint là đặc.
+Khi ảnh không hợp với dải đáy (bàn nhìn từ trên xuống, ghế sát tường...),
+"footprint": {"rect": [dx, dy, w, h]} cho rect chỉnh tay, tính từ góc trên-trái
+của ảnh đã cắt. Footprint luôn bị kẹp trong ảnh đã cắt và trong thế giới.
+
+Bản biên dịch được pickle vào cache, khóa theo hash nội dung file JSON và kích
+thước màn hình; các lần khởi động sau chỉ cần đọc cache nếu file không đổi.
+
+Định dạng (assets/data/scenes/<scene_id>.json):
+    {
+        "background": "assets/images/scenes/x-bg.png",
+        "wall_mask": "assets/images/scenes/x-walls.png",
+        "fallback_color": [40, 40, 50],
+        "debug": false,
+        "world_size": ["W*2", "H"],
+        "player_start": [900, 400],
+        "footprint_ratio": 0.3,
+        "obstacles": [
+            {"name": "sofa", "image": "...", "pos": ["W//2", 250], "anchor": "center",
+             "scale": 2, "footprint": 0.5, "collision": "rect",
+             "interaction": {"inflate": [60, 60], "callback": "_on_sofa_interact"}},
+            {"name": "lamp", "image": "...", "pos": [100, 100], "footprint": {"band": 12}},
+            {"name": "table", "image": "...", "pos": [400, 300], "footprint": {"rect": [140, 90, 440, 410]}}
+        ],
+        "collectibles": [ ...giống obstacles, không có va chạm... ],
+        "npcs": [
+            {"name": "NPC_1", "pos": [100, 500], "color": [255, 100, 100],
+             "interaction": {"inflate": [100, 100], "callback": "_on_npc_interact", "priority": 1}}
+        ]
+    }
+
+"world_size" (mặc định = kích thước màn hình) là kích thước thế giới của scene:
+lớn hơn màn hình thì camera cuộn theo player. Nó được tính theo W/H của màn
+hình; mọi tọa độ khác là số hoặc biểu thức theo W/H của thế giới, vd "W//2+300".
+"pos" là vị trí của ảnh gốc (trước khi cắt); vùng tương tác được nới ra từ khung
+ảnh đã cắt.
+"""
+
+import ast
+import hashlib
+import json
+import operator
+import os
+import pickle
+from typing import Any, Dict, Optional, Tuple
+
+import pygame
+
+from src.utils.sprite_trim import footprint_rect, opaque_bounds
+
+SCENE_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              "assets", "data", "scenes")
+SCENE_CACHE_DIR = os.path.join("saves", "cache", "scenes")
+COMPILER_VERSION = 9
+
+NPC_SIZE = (60, 80)
+ANCHORS = ("topleft", "center")
+COLLISION_MODES = ("mask", "rect")
+DEFAULT_FOOTPRINT_RATIO = 0.3  # dải đáy = 30% chiều cao ảnh đã cắt
+
+
+class SceneDefinitionError(ValueError):
+    """File định nghĩa scene sai schema hoặc có biểu thức không hợp lệ."""
+
+
+# --- Biểu thức tọa độ (chỉ số học trên W/H, không dùng eval) ---
+
+_BIN_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+}
+_UNARY_OPS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+
+
+def eval_expr(expr, env: Dict[str, int]):
+    """
+    Tính giá trị một tọa độ: số giữ nguyên, chuỗi được parse bằng ast và chỉ
+    cho phép + - * / // %, dấu ngoặc, số và các tên trong env (W, H).
+    """
+    if isinstance(expr, (int, float)) and not isinstance(expr, bool):
+        return expr
+    if not isinstance(expr, str):
+        raise SceneDefinitionError(f"invalid coordinate {expr!r}")
+    try:
+        tree = ast.parse(expr, mode="eval")
+    except SyntaxError as e:
+        raise SceneDefinitionError(f"invalid expression {expr!r}: {e.msg}") from None
+
+    def visit(node):
+        if isinstance(node, ast.Expression):
+            return visit(node.body)
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            return node.value
+        if isinstance(node, ast.Name) and node.id in env:
+            return env[node.id]
+        if isinstance(node, ast.BinOp) and type(node.op) in _BIN_OPS:
+            return _BIN_OPS[type(node.op)](visit(node.left), visit(node.right))
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+            return _UNARY_OPS[type(node.op)](visit(node.operand))
+        raise SceneDefinitionError(f"unsupported syntax in {expr!r}: {ast.dump(node)[:40]}")
+
+    try:
+        return visit(tree)
+    except ZeroDivisionError:
+        raise SceneDefinitionError(f"division by zero in {expr!r}") from None
+
+
+def _point(value, env) -> Tuple[int, int]:
+    return int(eval_expr(value[0], env)), int(eval_expr(value[1], env))
+
+
+# --- Schema ---
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _check_pair(value, where, coords=False):
+    ok = isinstance(value, list) and len(value) == 2 and all(
+        _is_number(v) or (coords and isinstance(v, str)) for v in value)
+    if not ok:
+        kind = "numbers or W/H expressions" if coords else "numbers"
+        raise SceneDefinitionError(f"{where}: expected a list of 2 {kind}, got {value!r}")
+
+
+def _check_color(value, where):
+    if not (isinstance(value, list) and len(value) in (3, 4)
+            and all(isinstance(c, int) and 0 <= c <= 255 for c in value)):
+        raise SceneDefinitionError(f"{where}: expected an RGB(A) color, got {value!r}")
+
+
+def _check_str(value, where):
+    if not isinstance(value, str) or not value:
+        raise SceneDefinitionError(f"{where}: expected a non-empty string, got {value!r}")
+
+
+def _check_int(value, where):
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise SceneDefinitionError(f"{where}: expected an integer, got {value!r}")
+
+
+def _check_interaction(value, where):
+    _check_fields(value, where, {"inflate": (False, _check_pair), "callback": (True, _check_str),
+                                 "priority": (False, _check_int)})
+
+
+def _check_anchor(value, where):
+    if value not in ANCHORS:
+        raise SceneDefinitionError(f"{where}: anchor must be one of {ANCHORS}, got {value!r}")
+
+
+def _check_scale(value, where):
+    if not _is_number(value) or value <= 0:
+        raise SceneDefinitionError(f"{where}: scale must be a positive number, got {value!r}")
+
+
+def _check_ratio(value, where):
+    if not _is_number(value) or not 0 < value <= 1:
+        raise SceneDefinitionError(f"{where}: expected a ratio in (0, 1], got {value!r}")
+
+
+def _check_band(value, where):
+    if not isinstance(value, int) or isinstance(value, bool) or value <= 0:
+        raise SceneDefinitionError(f"{where}: band must be a positive number of pixels, got {value!r}")
+
+
+def _check_rect(value, where):
+    ok = isinstance(value, list) and len(value) == 4 and all(isinstance(v, int) and not isinstance(v, bool)
+                                                             for v in value)
+    if not ok or value[2] <= 0 or value[3] <= 0:
+        raise SceneDefinitionError(f"{where}: expected [dx, dy, w, h] in whole pixels with w, h > 0, got {value!r}")
+
+
+def _check_footprint(value, where):
+    if isinstance(value, dict):
+        _check_fields(value, where, {"band": (False, _check_band), "rect": (False, _check_rect)})
+        if len(value) != 1:
+            raise SceneDefinitionError(f"{where}: expected exactly one of 'band' or 'rect', got {sorted(value)}")
+    else:
+        _check_ratio(value, where)
+
+
+def _check_collision(value, where):
+    if value not in COLLISION_MODES:
+        raise SceneDefinitionError(f"{where}: collision must be one of {COLLISION_MODES}, got {value!r}")
+
+
+def _check_bool(value, where):
+    if not isinstance(value, bool):
+        raise SceneDefinitionError(f"{where}: expected true/false, got {value!r}")
+
+
+def _check_coords(value, where):
+    _check_pair(value, where, coords=True)
+
+
+# field -> (bắt buộc, hàm kiểm tra)
+_SPRITE_FIELDS = {
+    "name": (True, _check_str),
+    "image": (True, _check_str),
+    "pos": (True, _check_coords),
+    "anchor": (False, _check_anchor),
+    "scale": (False, _check_scale),
+    "interaction": (False, _check_interaction),
+}
+_OBSTACLE_FIELDS = {
+    **_SPRITE_FIELDS,
+    "footprint": (False, _check_footprint),
+    "collision": (False, _check_collision),
+}
+_NPC_FIELDS = {
+    "name": (True, _check_str),
+    "pos": (True, _check_coords),
+    "color": (True, _check_color),
+    "size": (False, _check_pair),
+    "interaction": (False, _check_interaction),
+}
+
+
+def _check_list_of(fields):
+    def check(value, where):
+        if not isinstance(value, list):
+            raise SceneDefinitionError(f"{where}: expected a list, got {type(value).__name__}")
+        names = set()
+        for i, entry in enumerate(value):
+            _check_fields(entry, f"{where}[{i}]", fields)
+            if entry["name"] in names:
+                raise SceneDefinitionError(f"{where}[{i}]: duplicate name {entry['name']!r}")
+            names.add(entry["name"])
+    return check
+
+
+_SCENE_FIELDS = {
+    "background": (False, _check_str),
+    "wall_mask": (False, _check_str),
+    "fallback_color": (False, _check_color),
+    "debug": (False, _check_bool),
+    "world_size": (False, _check_coords),
+    "player_start": (False, _check_coords),
+    "footprint_ratio": (False, _check_ratio),
+    "obstacles": (False, _check_list_of(_OBSTACLE_FIELDS)),
+    "collectibles": (False, _check_list_of(_SPRITE_FIELDS)),
+    "npcs": (False, _check_list_of(_NPC_FIELDS)),
+}
+
+
+def _check_fields(value, where, fields):
+    if not isinstance(value, dict):
+        raise SceneDefinitionError(f"{where}: expected an object, got {type(value).__name__}")
+    unknown = value.keys() - fields.keys()
+    if unknown:
+        raise SceneDefinitionError(f"{where}: unknown field(s) {sorted(unknown)}")
+    for key, (required, check) in fields.items():
+        if key in value:
+            check(value[key], f"{where}.{key}")
+        elif required:
+            raise SceneDefinitionError(f"{where}: missing required field {key!r}")
+
+
+def validate_definition(data: Dict[str, Any], source: str = "scene") -> None:
+    """Kiểm tra schema; ném SceneDefinitionError với đường dẫn tới trường sai."""
+    _check_fields(data, source, _SCENE_FIELDS)
+
+
+# --- Biên dịch ---
+
+def _file_signature(path: str) -> str:
+    try:
+        st = os.stat(path)
+        return f"{st.st_mtime_ns}:{st.st_size}"
+    except OSError:
+        return "missing"
+
+
+def _interaction(entry, rect: pygame.Rect) -> Optional[Tuple[Tuple[int, int, int, int], str, int]]:
+    interaction = entry.get("interaction")
+    if not interaction:
+        return None
+    area = rect.inflate(*interaction.get("inflate", (0, 0)))
+    return tuple(area), interaction["callback"], interaction.get("priority", 0)
+
+
+def _compile_sprite(entry, env, footprint: Optional[Any]) -> Optional[Dict[str, Any]]:
+    """
+    Vị trí/kích thước/rect của một vật thể có ảnh; None nếu không đọc được ảnh.
+
+    Args:
+        entry: Mục obstacle/collectible trong file scene
+        env: Biến cho biểu thức tọa độ (W, H)
+        footprint: Tỉ lệ dải đáy, {"band": px}, {"rect": [dx, dy, w, h]}, hoặc
+            None (không va chạm: rect = khung ảnh đã cắt)
+    """
+    try:
+        image = pygame.image.load(entry["image"])
+    except (pygame.error, FileNotFoundError) as e:
+        print(f"⚠️  Could not load {entry['name']}: {e}")
+        return None
+    native_size = image.get_size()
+    scale = entry.get("scale", 1)
+    size = (int(native_size[0] * scale), int(native_size[1] * scale))
+    if size != native_size:
+        image = pygame.transform.scale(image, size)  # giống hệt lúc chạy, để cắt đúng pixel
+    anchor = entry.get("anchor", "topleft")
+    image_rect = pygame.Rect((0, 0), size)
+    setattr(image_rect, anchor, _point(entry["pos"], env))
+
+    crop = opaque_bounds(image)
+    bounds = crop.move(image_rect.topleft)
+    if footprint is None:
+        rect = bounds.copy()
+    else:
+        trimmed = image.subsurface(crop)
+        if isinstance(footprint, dict) and "rect" in footprint:
+            rect = pygame.Rect(footprint["rect"]).clip(trimmed.get_rect())
+        elif isinstance(footprint, dict):
+            rect = footprint_rect(trimmed, band=footprint["band"])
+        else:
+            rect = footprint_rect(trimmed, ratio=footprint)
+        rect.move_ip(bounds.topleft)
+        # Ảnh có thể tràn ra ngoài thế giới (vd ghế sát mép dưới); phần đó không chặn được gì
+        rect = rect.clip(pygame.Rect(0, 0, env["W"], env["H"]))
+    return {
+        "name": entry["name"],
+        "image": entry["image"],
+        "size": size if size != native_size else None,  # None = không cần scale
+        "crop": tuple(crop) if crop.size != size else None,  # None = ảnh không có viền trong suốt
+        "position": bounds.topleft,
+        "rect": tuple(rect),
+        "pixel_collision": footprint is not None and entry.get("collision", "mask") == "mask",
+        "interaction": _interaction(entry, bounds),
+    }
+
+
+def _compile_npc(entry, env) -> Dict[str, Any]:
+    size = tuple(int(v) for v in entry.get("size", NPC_SIZE))
+    position = _point(entry["pos"], env)
+    rect = pygame.Rect(position, size)
+    return {
+        "name": entry["name"],
+        "color": tuple(entry["color"]),
+        "size": size,
+        "position": position,
+        "rect": tuple(rect),
+        "interaction": _interaction(entry, rect),
+    }
+
+
+def compile_definition(data: Dict[str, Any], screen_size: Tuple[int, int], source: str = "scene") -> Dict[str, Any]:
+    """Biên dịch một định nghĩa đã kiểm tra thành dict chỉ gồm tuple/số/chuỗi (pickle được)."""
+    validate_definition(data, source)
+    world_size = screen_size
+    if "world_size" in data:
+        world_size = _point(data["world_size"], {"W": screen_size[0], "H": screen_size[1]})
+        if world_size[0] <= 0 or world_size[1] <= 0:
+            raise SceneDefinitionError(f"{source}.world_size: must be positive, got {world_size}")
+    env = {"W": world_size[0], "H": world_size[1]}
+    default_footprint = data.get("footprint_ratio", DEFAULT_FOOTPRINT_RATIO)
+    images = {}
+    for group in ("obstacles", "collectibles"):
+        for entry in data.get(group, ()):
+            images[entry["image"]] = _file_signature(entry["image"])
+    for key in ("background", "wall_mask"):
+        if key in data:
+            images[data[key]] = _file_signature(data[key])
+
+    compiled = {
+        "background": data.get("background"),
+        "wall_mask": data.get("wall_mask"),
+        "fallback_color": tuple(data["fallback_color"]) if "fallback_color" in data else None,
+        "debug": data.get("debug", False),
+        "world_size": tuple(world_size),
+        "player_start": _point(data["player_start"], env) if "player_start" in data else None,
+        "obstacles": [s for s in (_compile_sprite(e, env, e.get("footprint", default_footprint))
+                                  for e in data.get("obstacles", ())) if s],
+        "collectibles": [s for s in (_compile_sprite(e, env, None) for e in data.get("collectibles", ())) if s],
+        "npcs": [_compile_npc(e, env) for e in data.get("npcs", ())],
+        "images": images,  # chữ ký file ảnh lúc biên dịch, để phát hiện ảnh bị thay
+    }
+    return compiled
+
+
+# --- Cache ---
+
+def definition_path(scene_id: str) -> str:
+    return os.path.join(SCENE_DATA_DIR, f"{scene_id}.json")
+
+
+def _cache_key(raw: bytes, screen_size: Tuple[int, int]) -> str:
+    digest = hashlib.sha1(raw)
+    digest.update(f"|{screen_size[0]}x{screen_size[1]}|v{COMPILER_VERSION}".encode())
+    return digest.hexdigest()
+
+
+def _images_unchanged(compiled) -> bool:
+    return all(_file_signature(path) == sig for path, sig in compiled["images"].items())
+
+
+def load_scene_definition(scene_id: str, screen_size: Tuple[int, int],
+                          cache_dir: Optional[str] = SCENE_CACHE_DIR) -> Tuple[Dict[str, Any], bool]:
+    """
+    Bản biên dịch của scene `scene_id`, lấy từ cache nếu file JSON (và các ảnh
+    nó dùng) không đổi. Trả về (compiled, from_cache).
+    """
+    path = definition_path(scene_id)
+    with open(path, "rb") as f:
+        raw = f.read()
+    key = _cache_key(raw, screen_size)
+    cache_path = os.path.join(cache_dir, f"{scene_id}.pickle") if cache_dir else None
+
+    if cache_path:
+        try:
+            with open(cache_path, "rb") as f:
+                cached = pickle.load(f)
+            if cached.get("key") == key and _images_unchanged(cached["compiled"]):
+                return cached["compiled"], True
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, KeyError, TypeError):
+            pass
+
+    try:
+        data = json.loads(raw.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise SceneDefinitionError(f"{path}: {e}") from None
+    compiled = compile_definition(data, screen_size, source=os.path.basename(path))
+
+    if cache_path:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = cache_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump({"key": key, "compiled": compiled}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"⚠️  Could not cache scene {scene_id}: {e}")
+    return compiled, False
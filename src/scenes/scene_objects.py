@@ -0,0 +1,70 @@
+"""
+Scene Objects
+=============
+Bản ghi có kiểu (__slots__) cho các vật thể trong scene: Obstacle, NpcSprite,
+Collectible. Vị trí blit và khóa sắp xếp theo Y được tính sẵn.
+"""
+
+from typing import Optional, Tuple
+
+import pygame
+
+
+class SceneObject:
+    """Vật thể có ảnh trong scene."""
+    __slots__ = ("name", "image", "position", "rect", "sort_y", "interaction_area")
+
+    def __init__(self, name: str, image: pygame.Surface, position: Tuple[int, int],
+                 rect: Optional[pygame.Rect] = None) -> None:
+        """
+        Args:
+            name: Tên vật thể (duy nhất trong scene)
+            image: Ảnh đã scale sẵn
+            position: Góc trên-trái để blit ảnh
+            rect: Rect va chạm / tương tác (mặc định: khung ảnh)
+        """
+        self.name = name
+        self.image = image
+        self.position = tuple(position)
+        self.rect = rect if rect is not None else pygame.Rect(self.position, image.get_size())
+        self.sort_y = self.rect.bottom  # khóa Y-sort: đáy rect
+        self.interaction_area = None
+
+    def move_to(self, position: Tuple[int, int]) -> None:
+        """Dời vật thể (ảnh + rect) tới vị trí blit mới."""
+        dx = position[0] - self.position[0]
+        dy = position[1] - self.position[1]
+        self.position = tuple(position)
+        self.rect.move_ip(dx, dy)
+        self.sort_y = self.rect.bottom
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r}, {self.position})"
+
+
+class Obstacle(SceneObject):
+    """
+    Vật cản: rect là vùng va chạm. Nếu có `mask` (cùng kích thước với rect),
+    va chạm được kiểm tra theo từng pixel bên trong rect.
+    """
+    __slots__ = ("mask",)
+
+    def __init__(self, name: str, image: pygame.Surface, position: Tuple[int, int],
+                 rect: Optional[pygame.Rect] = None, mask: Optional[pygame.mask.Mask] = None) -> None:
+        super().__init__(name, image, position, rect)
+        self.mask = mask
+
+
+class Collectible(SceneObject):
+    """Vật phẩm nhặt được trên mặt đất (không va chạm)."""
+    __slots__ = ()
+
+
+class NpcSprite(SceneObject):
+    """NPC (hiện chỉ có ảnh giữ chỗ vẽ theo màu)."""
+    __slots__ = ("color",)
+
+    def __init__(self, name: str, image: pygame.Surface, position: Tuple[int, int],
+                 rect: Optional[pygame.Rect] = None, color: Tuple[int, ...] = (255, 255, 255)) -> None:
+        super().__init__(name, image, position, rect)
+        self.color = color
@@ -0,0 +1,176 @@
+"""
+Stress Scene
+============
+Scene tổng hợp cho benchmark: số lượng vật cản, NPC, vật phẩm và khu vực
+tương tác tùy chỉnh (10 tới 50.000), bố cục ngẫu nhiên đều ("random") hoặc
+theo cụm ("clustered"), cùng wall mask sinh theo thủ tục.
+
+- Kích thước vật cản giảm theo số lượng để độ phủ gần như không đổi (khoảng
+  COVERAGE diện tích thế giới), nên thời gian đo phản ánh cấu trúc dữ liệu chứ
+  không phải việc mọi truy vấn đều trúng ngay vật đầu tiên.
+- Ảnh được dùng chung theo một bảng nhỏ (PALETTE_SIZE ảnh mỗi loại), footprint
+  mask dùng chung qua cache của sprite_trim, nên 50.000 vật thể vẫn nhẹ.
+- Wall mask: "none", "border" (viền), "rooms" (lưới phòng có cửa), "diagonal"
+  (phòng + tường chéo, để có phần dư pixel của wall_geometry).
+- world_size lớn hơn màn hình cho bản đồ nhiều phòng (camera cuộn, cắt theo
+  viewport); nội dung và độ phủ trải trên cả thế giới.
+
+Cùng tham số (kể cả seed) luôn cho cùng một scene.
+"""
+
+import math
+import random
+from typing import List, Optional, Tuple
+
+import pygame
+
+from .base_scene import BaseScene
+from .scene_loader import DEFAULT_FOOTPRINT_RATIO
+from .scene_objects import Obstacle, NpcSprite, Collectible
+from src.utils.interaction_area import InteractionArea
+from src.utils.sprite_trim import footprint_rect, footprint_mask
+
+LAYOUTS = ("random", "clustered")
+WALL_STYLES = ("none", "border", "rooms", "diagonal")
+
+COVERAGE = 0.25      # phần diện tích thế giới bị vật cản phủ (ước lượng)
+MIN_SIZE, MAX_SIZE = 4, 96
+PALETTE_SIZE = 8
+CLUSTERS = 8
+WALL_THICKNESS = 12
+ROOM_SIZE = 320
+DOOR_WIDTH = 128
+
+
+class StressScene(BaseScene):
+    """Scene sinh tự động; không cần file scene hay ảnh nào."""
+
+    def __init__(self, screen_width: int = 1280, screen_height: int = 720,
+                 obstacles: int = 100, npcs: int = 10, collectibles: int = 10, areas: int = 10,
+                 layout: str = "random", walls: str = "rooms", pixel_collision: bool = False,
+                 seed: int = 0, world_size: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Args:
+            screen_width: Chiều rộng màn hình
+            screen_height: Chiều cao màn hình
+            obstacles: Số vật cản (có va chạm)
+            npcs: Số NPC (mỗi NPC một khu vực tương tác)
+            collectibles: Số vật phẩm trên mặt đất
+            areas: Số khu vực tương tác độc lập
+            layout: "random" hoặc "clustered"
+            walls: Kiểu wall mask, xem WALL_STYLES
+            pixel_collision: Vật cản va chạm theo footprint mask thay vì rect đặc
+            seed: Hạt giống ngẫu nhiên
+            world_size: Kích thước thế giới (mặc định = màn hình)
+        """
+        super().__init__(screen_width, screen_height)
+        if world_size is not None:
+            self.set_world_size(*world_size)
+        if layout not in LAYOUTS:
+            raise ValueError(f"layout must be one of {LAYOUTS}, got {layout!r}")
+        if walls not in WALL_STYLES:
+            raise ValueError(f"walls must be one of {WALL_STYLES}, got {walls!r}")
+        self.layout = layout
+        self.walls = walls
+        self.rng = random.Random(seed)
+        self._centers = [(self.rng.uniform(0.1, 0.9) * self.world_width,
+                          self.rng.uniform(0.1, 0.9) * self.world_height) for _ in range(CLUSTERS)]
+
+        self.background.fill((45, 50, 55))
+        self.set_wall_mask(self._make_wall_mask(walls))
+        self._populate(obstacles, npcs, collectibles, areas, pixel_collision)
+        self.player_start = (self.world_width // 2, self.world_height // 2)
+
+    # --- Sinh dữ liệu ---
+
+    def object_size(self, count: int) -> int:
+        """Cạnh (px) của vật cản sao cho `count` vật phủ khoảng COVERAGE diện tích."""
+        area = self.world_width * self.world_height * COVERAGE / max(count, 1)
+        return int(min(MAX_SIZE, max(MIN_SIZE, math.sqrt(area))))
+
+    def random_point(self) -> Tuple[int, int]:
+        """Điểm theo bố cục: đều trên thế giới, hoặc phân phối chuẩn quanh một tâm cụm."""
+        if self.layout == "clustered":
+            cx, cy = self.rng.choice(self._centers)
+            spread = min(self.world_width, self.world_height) / 10
+            x, y = self.rng.gauss(cx, spread), self.rng.gauss(cy, spread)
+        else:
+            x, y = self.rng.uniform(0, self.world_width), self.rng.uniform(0, self.world_height)
+        return int(min(max(x, 0), self.world_width - 1)), int(min(max(y, 0), self.world_height - 1))
+
+    def _palette(self, size: int, kind: str) -> List[pygame.Surface]:
+        images = []
+        for i in range(PALETTE_SIZE):
+            width = max(MIN_SIZE, int(size * (0.6 + 0.8 * i / PALETTE_SIZE)))
+            height = max(MIN_SIZE, int(width * (0.8 + 0.1 * (i % 4))))
+            image = pygame.Surface((width, height), pygame.SRCALPHA)
+            color = (90 + 20 * i, 160 - 10 * i, 80 + 15 * (i % 3))
+            if kind == "obstacle":
+                pygame.draw.ellipse(image, color, image.get_rect())
+            else:
+                pygame.draw.rect(image, color, image.get_rect(), border_radius=max(1, width // 4))
+            images.append(image)
+        return images
+
+    def _populate(self, obstacles: int, npcs: int, collectibles: int, areas: int,
+                  pixel_collision: bool) -> None:
+        size = self.object_size(obstacles)
+        palette = self._palette(size, "obstacle")
+        footprints = [footprint_rect(image, DEFAULT_FOOTPRINT_RATIO) for image in palette]
+        for i in range(obstacles):
+            index = i % PALETTE_SIZE
+            image, footprint = palette[index], footprints[index]
+            x, y = self.random_point()
+            position = (x - image.get_width() // 2, y - image.get_height() // 2)
+            mask = None
+            if pixel_collision:
+                mask = footprint_mask(image, footprint, key=("stress", index, image.get_size()))
+            self.obstacles.append(Obstacle(f"obstacle_{i}", image, position,
+                                           footprint.move(position), mask))
+
+        small = self.object_size(max(collectibles, npcs, 1))
+        items = self._palette(max(MIN_SIZE, small // 2), "item")
+        for i in range(collectibles):
+            image = items[i % PALETTE_SIZE]
+            self.collectible_items.append(Collectible(f"item_{i}", image, self.random_point()))
+
+        npc_images = [self._make_npc_image((60, 80), (100 + 15 * i, 100, 255 - 15 * i)) for i in range(PALETTE_SIZE)]
+        for i in range(npcs):
+            image = npc_images[i % PALETTE_SIZE]
+            npc = NpcSprite(f"npc_{i}", image, self.random_point())
+            npc.interaction_area = self.add_interaction_area(
+                InteractionArea(npc.rect.inflate(60, 60), lambda n=npc: self._on_npc_interact(n)))
+            self.npcs.append(npc)
+
+        for i in range(areas):
+            x, y = self.random_point()
+            self.add_interaction_area(InteractionArea(pygame.Rect(x - 40, y - 40, 80, 80),
+                                                      lambda i=i: print(f"🔍 area {i}")))
+        self.rebuild_collision_rects()
+
+    def _make_wall_mask(self, style: str) -> pygame.mask.Mask:
+        width, height = self.world_width, self.world_height
+        surface = pygame.Surface((width, height))
+        surface.set_colorkey((0, 0, 0))
+        surface.fill((0, 0, 0))
+        wall = (255, 255, 255)
+        if style != "none":
+            pygame.draw.rect(surface, wall, surface.get_rect(), WALL_THICKNESS)
+        if style in ("rooms", "diagonal"):
+            for x in range(ROOM_SIZE, width - WALL_THICKNESS, ROOM_SIZE):
+                for y0 in range(0, height, ROOM_SIZE):  # tường dọc, chừa cửa ở giữa mỗi phòng
+                    door = y0 + ROOM_SIZE // 2
+                    pygame.draw.rect(surface, wall, (x, y0, WALL_THICKNESS, door - DOOR_WIDTH // 2 - y0))
+                    pygame.draw.rect(surface, wall, (x, door + DOOR_WIDTH // 2, WALL_THICKNESS,
+                                                     y0 + ROOM_SIZE - door - DOOR_WIDTH // 2))
+            for y in range(ROOM_SIZE, height - WALL_THICKNESS, ROOM_SIZE):
+                for x0 in range(0, width, ROOM_SIZE):
+                    door = x0 + ROOM_SIZE // 2
+                    pygame.draw.rect(surface, wall, (x0, y, door - DOOR_WIDTH // 2 - x0, WALL_THICKNESS))
+                    pygame.draw.rect(surface, wall, (door + DOOR_WIDTH // 2, y,
+                                                     x0 + ROOM_SIZE - door - DOOR_WIDTH // 2, WALL_THICKNESS))
+        if style == "diagonal":
+            for x0 in range(0, width, ROOM_SIZE):
+                pygame.draw.line(surface, wall, (x0 + 40, 40), (x0 + ROOM_SIZE // 2, ROOM_SIZE // 2 - 20),
+                                 WALL_THICKNESS)
+        return pygame.mask.from_surface(surface)
@@ -0,0 +1,174 @@
+"""
+Wall Geometry
+=============
+Phân rã wall mask (pygame.mask.Mask toàn màn hình) thành các hình chữ nhật
+thẳng trục, gộp tham lam (greedy meshing), để va chạm với tường dùng cùng
+broadphase với collision_rects thay vì overlap từng pixel.
+
+1. Mỗi dòng pixel được tách thành các đoạn liên tục (run); các run giống hệt
+   nhau ở những dòng liền kề được gộp theo chiều dọc thành một rect. Tường
+   thẳng (phần lớn wall mask) cho ra ít rect lớn, khớp đúng từng pixel.
+2. Rect thấp hơn MIN_RECT_HEIGHT dòng là dấu hiệu cạnh chéo (mỗi dòng một run
+   khác nhau); phần đó được chia theo lưới ô CELL_SIZE px, các ô đầy được gộp
+   lại theo cùng cách.
+3. Pixel còn lại (dải hẹp dọc cạnh chéo) giữ trong một mask dư (residual) để
+   vẫn kiểm tra overlap chính xác.
+
+rects ∪ residual == wall mask, nên kết quả va chạm không đổi.
+Danh sách rect được cache ra đĩa theo ảnh wall mask và kích thước màn hình;
+residual được dựng lại từ mask (vài trăm thao tác erase).
+"""
+
+import hashlib
+import os
+import pickle
+import re
+from typing import List, Optional, Tuple
+
+import pygame
+
+from .scene_loader import SCENE_CACHE_DIR
+
+GEOMETRY_VERSION = 2
+MIN_RECT_HEIGHT = 4
+CELL_SIZE = 8
+
+RectTuple = Tuple[int, int, int, int]
+Span = Tuple[int, int]
+
+_RUN = re.compile(rb"[^\x00]+")
+
+
+def mask_rows(mask: pygame.mask.Mask) -> List[List[Span]]:
+    """Các run (x0, x1) của từng dòng trong mask."""
+    width, height = mask.get_size()
+    surface = mask.to_surface(setcolor=(255, 255, 255, 255), unsetcolor=(0, 0, 0, 0))
+    alpha = pygame.image.tobytes(surface, "RGBA")[3::4]  # 1 byte mỗi pixel
+    rows = []
+    for y in range(height):
+        start = y * width
+        rows.append([(m.start() - start, m.end() - start) for m in _RUN.finditer(alpha, start, start + width)])
+    return rows
+
+
+def merge_rows(rows: List[List[Span]]) -> List[RectTuple]:
+    """
+    Gộp các run giống hệt nhau ở những dòng liền kề thành rect (x, y, w, h)
+    theo đơn vị của lưới (pixel hoặc ô).
+    """
+    rects = []
+    active = {}  # (x0, x1) -> dòng bắt đầu
+    for y, spans in enumerate(rows):
+        current = {span: active.pop(span, y) for span in spans}
+        for (x0, x1), y0 in active.items():
+            rects.append((x0, y0, x1 - x0, y - y0))
+        active = current
+    for (x0, x1), y0 in active.items():
+        rects.append((x0, y0, x1 - x0, len(rows) - y0))
+    return rects
+
+
+def _erase_rects(mask: pygame.mask.Mask, rects: List[RectTuple]) -> None:
+    for x, y, w, h in rects:
+        mask.erase(pygame.mask.Mask((w, h), fill=True), (x, y))
+
+
+def _full_cell_rows(mask: pygame.mask.Mask, cell: int) -> List[List[Span]]:
+    """Run của các ô cell x cell đầy pixel, theo từng hàng ô."""
+    width, height = mask.get_size()
+    full = cell * cell
+    probe = pygame.mask.Mask((cell, cell), fill=True)
+    strip = pygame.mask.Mask((width, cell), fill=True)
+    columns = width // cell
+    rows = []
+    for cy in range(height // cell):
+        spans = []
+        y = cy * cell
+        if mask.overlap_area(strip, (0, y)) >= full:  # bỏ qua nhanh hàng ô gần như trống
+            start = None
+            for cx in range(columns):
+                if mask.overlap_area(probe, (cx * cell, y)) == full:
+                    if start is None:
+                        start = cx
+                elif start is not None:
+                    spans.append((start, cx))
+                    start = None
+            if start is not None:
+                spans.append((start, columns))
+        rows.append(spans)
+    return rows
+
+
+def decompose_mask(mask: pygame.mask.Mask, min_height: int = MIN_RECT_HEIGHT,
+                   cell: int = CELL_SIZE) -> List[RectTuple]:
+    """
+    Phân rã mask thành các rect rời nhau (x, y, w, h). Pixel không thuộc rect
+    nào là phần dư: xem residual_mask().
+    """
+    rects = [r for r in merge_rows(mask_rows(mask)) if r[3] >= min_height]
+
+    leftover = mask.copy()
+    _erase_rects(leftover, rects)
+    if leftover.count():
+        cells = merge_rows(_full_cell_rows(leftover, cell))
+        rects.extend((x * cell, y * cell, w * cell, h * cell) for x, y, w, h in cells)
+    return rects
+
+
+def residual_mask(mask: pygame.mask.Mask, rects: List[RectTuple]) -> Optional[pygame.mask.Mask]:
+    """Pixel của mask không nằm trong rect nào; None nếu không còn pixel."""
+    residual = mask.copy()
+    _erase_rects(residual, rects)
+    return residual if residual.count() else None
+
+
+def _file_signature(path: str) -> str:
+    try:
+        st = os.stat(path)
+        return f"{st.st_mtime_ns}:{st.st_size}"
+    except OSError:
+        return "missing"
+
+
+def load_wall_geometry(mask: pygame.mask.Mask, source: Optional[str] = None,
+                       cache_dir: Optional[str] = SCENE_CACHE_DIR
+                       ) -> Tuple[List[pygame.Rect], Optional[pygame.mask.Mask], bool]:
+    """
+    Rect và mask dư của một wall mask. Nếu biết file ảnh nguồn (`source`),
+    danh sách rect được lấy từ / ghi vào cache_dir.
+
+    Returns:
+        (rects, residual, from_cache)
+    """
+    cache_path = None
+    key = None
+    if source and cache_dir:
+        digest = hashlib.sha1(f"{os.path.abspath(source)}|{mask.get_size()}".encode())
+        cache_path = os.path.join(cache_dir, f"walls-{digest.hexdigest()[:16]}.pickle")
+        key = (GEOMETRY_VERSION, _file_signature(source), mask.get_size(), MIN_RECT_HEIGHT, CELL_SIZE)
+
+    rects = None
+    from_cache = False
+    if cache_path:
+        try:
+            with open(cache_path, "rb") as f:
+                cached = pickle.load(f)
+            if cached.get("key") == key:
+                rects = cached["rects"]
+                from_cache = True
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, KeyError, TypeError):
+            pass
+
+    if rects is None:
+        rects = decompose_mask(mask)
+        if cache_path:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                tmp_path = cache_path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    pickle.dump({"key": key, "rects": rects}, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                print(f"⚠️  Could not cache wall geometry for {source}: {e}")
+
+    return [pygame.Rect(r) for r in rects], residual_mask(mask, rects), from_cache
@@ -1,94 +1,189 @@
 # Inventory_Item.py
 
 # Item only stores data — no pygame image loading here.
-# InventoryUI will load the sprite sheet and extract icons.
+# InventoryUI gets the icons from the IconAtlas by icon_id.
+#
+# Items are declared per case in assets/data/items/<case_id>.json:
+#   {"case": "main",
+#    "items": [{"code", "name", "icon_id", "description", "starting"}, ...],
+#    "recipes": [...]}   (see evidence_combiner.py)
+# Items with "starting": false are not in the starting inventory; they are
+# obtained by combining evidence.
+
+import json
+import os
+import sys
+
+ITEM_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             "assets", "data", "items")
+DEFAULT_CASE = "main"
+
 
 class Item:
-    def __init__(self, name, code, description, icon_id):
+    """
+    Compact item record. The description can be loaded lazily: pass
+    description=None and a `source` callable(code) -> str, which is called
+    the first time the description is read.
+    """
+    __slots__ = ("name", "code", "icon_id", "_description", "_source")
+
+    def __init__(self, name, code, description=None, icon_id=0, source=None):
         self.name = name
-        self.code = code
-        self.description = description
-        self.icon_id = icon_id   # used later by InventoryUI
+        self.code = sys.intern(code)  # codes are dict keys everywhere; intern them once
+        self.icon_id = icon_id
+        self._description = description
+        self._source = source
+
+    @property
+    def description(self):
+        if self._description is None:
+            self._description = self._source(self.code) if self._source else ""
+            self._source = None
+        return self._description
 
     def __repr__(self):
         return f"Item({self.name}, {self.code})"
 
 
-# ---- DETECTIVE GAME ITEMS (9 total) ---------------------------------------
-
-magnifying_glass = Item(
-    name="Magnifying Glass",
-    code="MAG2",
-    description="Useful for spotting small details others overlook.",
-    icon_id=0
-)
-
-crime_scene_tape = Item(
-    name="Crime Scene Tape",
-    code="CST3",
-    description="Bright yellow tape used to secure areas. Smells like cheap plastic.",
-    icon_id=1
-)
-
-evidence_bag = Item(
-    name="Evidence Bag",
-    code="EVD4",
-    description="A sealed bag containing an unidentified object. Do not tamper.",
-    icon_id=2
-)
-
-fingerprint_duster = Item(
-    name="Fingerprint Duster",
-    code="FPD5",
-    description="Used to reveal fingerprints. Leaves black powder everywhere.",
-    icon_id=3
-)
-
-voice_recorder = Item(
-    name="Voice Recorder",
-    code="REC6",
-    description="Used to interview suspects. Battery life: unpredictable.",
-    icon_id=4
-)
-
-old_key = Item(
-    name="Rusty Key",
-    code="KEY7",
-    description="Found at a crime scene. Belongs to a lock long forgotten.",
-    icon_id=5
-)
-
-pocket_watch = Item(
-    name="Stopped Pocket Watch",
-    code="PW8",
-    description="Stopped at 11:47 PM. Possible time of crime?",
-    icon_id=6
-)
-
-cigarette_butt = Item(
-    name="Cigarette Butt",
-    code="CB9",
-    description="Left behind by someone at the scene. Menthol — unusual choice.",
-    icon_id=7
-)
-
-mysterious_letter = Item(
-    name="Mysterious Letter",
-    code="LTRX",
-    description="A handwritten note with no signature. The ink is still wet.",
-    icon_id=8
-)
+# ---- Data files ------------------------------------------------------------
+
+def item_file(case_id):
+    return os.path.join(ITEM_DATA_DIR, f"{case_id}.json")
+
+
+def item_case_ids():
+    """Cases that have an item data file."""
+    try:
+        names = os.listdir(ITEM_DATA_DIR)
+    except OSError:
+        return []
+    return sorted(name[:-5] for name in names if name.endswith(".json"))
+
+
+def load_case_file(case_id):
+    """Parsed data file of one case; {} if the case has no item file."""
+    try:
+        with open(item_file(case_id), encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def load_item_file(case_id):
+    """Raw item entries (dicts) of one case; [] if the case has no item file."""
+    entries = load_case_file(case_id).get("items", [])
+    for entry in entries:
+        missing = {"code", "name", "icon_id"} - entry.keys()
+        if missing:
+            raise ValueError(f"{item_file(case_id)}: item {entry.get('code', '?')} is missing {sorted(missing)}")
+    return entries
+
 
 # ---- Registry --------------------------------------------------------------
 
-item_list = [
-    magnifying_glass,
-    crime_scene_tape,
-    evidence_bag,
-    fingerprint_duster,
-    voice_recorder,
-    old_key,
-    pocket_watch,
-    cigarette_butt,
-    mysterious_letter
-]
+class ItemRegistry:
+    """
+    Items of the cases currently in play, with O(1) lookup by code or icon id.
+
+    Records come from the Casebook (descriptions are fetched on first access)
+    or, without a Casebook, straight from the case data files. Cases are
+    loaded and unloaded individually so only the cases in play stay in memory.
+    """
+
+    def __init__(self, casebook=None, cases=(DEFAULT_CASE,)):
+        """
+        Args:
+            casebook: Casebook to read items from (None = read the data files)
+            cases: Case ids to load right away
+        """
+        self.casebook = casebook
+        self._by_code = {}     # code -> Item
+        self._by_icon = {}     # icon_id -> [Item]
+        self._case_codes = {}  # case_id -> [code] in declaration order
+        self._starting = {}    # case_id -> [code] of the starting inventory
+        for case_id in cases:
+            self.load_case(case_id)
+
+    def _records(self, case_id):
+        """(Item, starting) pairs of a case."""
+        if self.casebook is not None:
+            describe = self.casebook.item_description
+            return [(Item(name, code, None, icon_id, describe), bool(starting))
+                    for code, name, icon_id, starting in self.casebook.item_rows(case_id)]
+        return [(Item(e["name"], e["code"], e.get("description", ""), e["icon_id"]), e.get("starting", True))
+                for e in load_item_file(case_id)]
+
+    def load_case(self, case_id):
+        """Load the items of a case (no-op if already loaded). Returns the number of items."""
+        if case_id in self._case_codes:
+            return len(self._case_codes[case_id])
+        codes = []
+        starting = []
+        for item, is_starting in self._records(case_id):
+            if item.code not in self._by_code:
+                self._by_code[item.code] = item
+                self._by_icon.setdefault(item.icon_id, []).append(item)
+            codes.append(item.code)
+            if is_starting:
+                starting.append(item.code)
+        self._case_codes[case_id] = codes
+        self._starting[case_id] = starting
+        return len(codes)
+
+    def unload_case(self, case_id):
+        """Drop the items of a case, except those still used by another loaded case."""
+        codes = self._case_codes.pop(case_id, None)
+        self._starting.pop(case_id, None)
+        if not codes:
+            return
+        still_used = {code for other in self._case_codes.values() for code in other}
+        for code in codes:
+            if code in still_used:
+                continue
+            item = self._by_code.pop(code, None)
+            if item is None:
+                continue
+            same_icon = self._by_icon[item.icon_id]
+            same_icon.remove(item)
+            if not same_icon:
+                del self._by_icon[item.icon_id]
+
+    @property
+    def cases(self):
+        return list(self._case_codes)
+
+    def get(self, code):
+        return self._by_code.get(code)
+
+    def __getitem__(self, code):
+        return self._by_code[code]
+
+    def __contains__(self, code):
+        return code in self._by_code
+
+    def __len__(self):
+        return len(self._by_code)
+
+    def by_icon(self, icon_id):
+        """Items drawn with this icon (several items may share one)."""
+        return self._by_icon.get(icon_id, ())
+
+    def items(self, case_id=None):
+        """Items of one case, or of every loaded case, in declaration order."""
+        return self._collect(self._case_codes, case_id)
+
+    def starting_items(self, case_id=None):
+        """Items the player starts with (excludes items obtained by combining)."""
+        return self._collect(self._starting, case_id)
+
+    def _collect(self, codes_by_case, case_id):
+        if case_id is not None:
+            return [self._by_code[code] for code in codes_by_case.get(case_id, ())]
+        seen = set()
+        result = []
+        for codes in codes_by_case.values():
+            for code in codes:
+                if code not in seen:
+                    seen.add(code)
+                    result.append(self._by_code[code])
+        return result
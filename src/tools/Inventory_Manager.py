@@ -1,29 +1,207 @@
 # inventory_manager.py
+import heapq
+from contextlib import contextmanager
+
+DEFAULT_MAX_STACK = 99
+
 
 class InventoryManager:
-    def __init__(self, rows, cols):
+    """
+    Slot-based inventory with stacking.
+
+    Free slots are kept in a min-heap (lowest index first) and every item code
+    maps to the slots that hold it, so adding, finding and removing items never
+    scans the whole inventory. Listeners registered with subscribe() receive
+    callback(event, slots) with the set of slot indices that changed
+    ("changed"), or the new slots when the inventory grows ("resized").
+    """
+
+    def __init__(self, rows, cols, max_stack=DEFAULT_MAX_STACK, max_rows=None):
+        """
+        rows/cols: initial grid size; with max_rows the inventory adds rows
+        on demand (up to max_rows) instead of rejecting items.
+        """
         self.rows = rows
         self.cols = cols
+        self.max_rows = max(rows, max_rows or rows)
         self.max_slots = rows * cols
+        self.max_stack = max_stack
         self.items = [None] * self.max_slots
+        self.quantities = [0] * self.max_slots
+        self._free = list(range(self.max_slots))  # already a valid heap
+        self._slots_by_code = {}  # code -> set(slot index)
+        self._listeners = []
+        self._used = 0
+        self._changed_slots = None  # slots changed since the last event
+        self._batching = False
+
+    # --- Slot bookkeeping ---
+
+    def _stack_limit(self, item):
+        return getattr(item, "max_stack", self.max_stack)
+
+    def _pop_free(self):
+        # Heap entries can be stale if a slot was filled by index
+        while self._free:
+            index = heapq.heappop(self._free)
+            if self.items[index] is None:
+                return index
+        return None
+
+    def _place(self, index, item, quantity):
+        self.items[index] = item
+        self.quantities[index] = quantity
+        self._used += 1
+        self._slots_by_code.setdefault(item.code, set()).add(index)
+        self._changed(index)
+
+    def _clear_slot(self, index):
+        item = self.items[index]
+        if item is None:
+            return
+        slots = self._slots_by_code[item.code]
+        slots.discard(index)
+        if not slots:
+            del self._slots_by_code[item.code]
+        self.items[index] = None
+        self.quantities[index] = 0
+        self._used -= 1
+        heapq.heappush(self._free, index)
+        self._changed(index)
+
+    def _capacity_for(self, item):
+        """How many more of `item` fit (existing stacks + free slots)."""
+        limit = self._stack_limit(item)
+        room = sum(limit - self.quantities[i] for i in self._slots_by_code.get(item.code, ()))
+        return room + self.free_slot_count() * limit
 
-    def add_item(self, item, index=None):
-        """Add item to a specific slot or first available slot."""
-        if index is not None and 0 <= index < self.max_slots:
-            self.items[index] = item
+    def _ensure_capacity(self, item, quantity):
+        """True if `quantity` of item fits, growing the grid when allowed."""
+        missing = quantity - self._capacity_for(item)
+        if missing <= 0:
             return True
-        for i in range(self.max_slots):
-            if self.items[i] is None:
-                self.items[i] = item
-                return True
-        return False  # Inventory full
-
-    def remove_item(self, index):
-        """Remove item from a specific slot."""
-        if 0 <= index < self.max_slots:
-            self.items[index] = None
+        slots_needed = -(-missing // self._stack_limit(item))
+        rows_needed = -(-slots_needed // self.cols)
+        if self.rows + rows_needed > self.max_rows:
+            return False
+        self.grow(rows_needed)
+        return True
+
+    def grow(self, rows):
+        """Append `rows` empty rows."""
+        start = self.max_slots
+        self.rows += rows
+        self.max_slots = self.rows * self.cols
+        self.items.extend([None] * (self.max_slots - start))
+        self.quantities.extend([0] * (self.max_slots - start))
+        for index in range(start, self.max_slots):
+            heapq.heappush(self._free, index)
+        self._notify("resized", set(range(start, self.max_slots)))
+
+    # --- Adding ---
+
+    def add_item(self, item, index=None, quantity=1):
+        """
+        Add item to a specific slot (replacing its content) or stack it onto
+        existing slots / the first free slots. Returns False if it does not fit.
+        """
+        if index is not None:
+            if not 0 <= index < self.max_slots:
+                return False
+            self._clear_slot(index)
+            self._place(index, item, min(quantity, self._stack_limit(item)))
+            self._flush_changes()
             return True
-        return False
+
+        if not self._ensure_capacity(item, quantity):
+            return False
+        self._add_stacked(item, quantity)
+        self._flush_changes()
+        return True
+
+    def _add_stacked(self, item, quantity):
+        limit = self._stack_limit(item)
+        for i in sorted(self._slots_by_code.get(item.code, ())):
+            if quantity <= 0:
+                return
+            room = limit - self.quantities[i]
+            if room > 0:
+                moved = min(room, quantity)
+                self.quantities[i] += moved
+                quantity -= moved
+                self._changed(i)
+        while quantity > 0:
+            index = self._pop_free()
+            moved = min(limit, quantity)
+            self._place(index, item, moved)
+            quantity -= moved
+
+    def add_items(self, entries):
+        """
+        Add many items at once; entries are items or (item, quantity) pairs.
+        Listeners get a single event. Returns the entries that did not fit.
+        """
+        rejected = []
+        with self.batch():
+            for entry in entries:
+                item, quantity = entry if isinstance(entry, tuple) else (entry, 1)
+                if not self._ensure_capacity(item, quantity):
+                    rejected.append(entry)
+                else:
+                    self._add_stacked(item, quantity)
+        return rejected
+
+    # --- Removing ---
+
+    def remove_item(self, index, quantity=None):
+        """Remove a whole slot, or `quantity` from its stack."""
+        if not 0 <= index < self.max_slots or self.items[index] is None:
+            return False
+        if quantity is None or quantity >= self.quantities[index]:
+            self._clear_slot(index)
+        else:
+            self.quantities[index] -= quantity
+            self._changed(index)
+        self._flush_changes()
+        return True
+
+    def remove_by_code(self, code, quantity=1):
+        """Remove up to `quantity` items with this code (latest slots first); returns the number removed."""
+        removed = 0
+        for i in sorted(self._slots_by_code.get(code, ()), reverse=True):
+            if removed >= quantity:
+                break
+            taken = min(self.quantities[i], quantity - removed)
+            removed += taken
+            if taken == self.quantities[i]:
+                self._clear_slot(i)
+            else:
+                self.quantities[i] -= taken
+                self._changed(i)
+        self._flush_changes()
+        return removed
+
+    def remove_items(self, entries):
+        """Remove many items at once; entries are codes or (code, quantity) pairs. Returns total removed."""
+        removed = 0
+        with self.batch():
+            for entry in entries:
+                code, quantity = entry if isinstance(entry, tuple) else (entry, 1)
+                removed += self.remove_by_code(code, quantity)
+        return removed
+
+    def clear_inventory(self):
+        """Remove all items."""
+        changed = {i for i, item in enumerate(self.items) if item is not None}
+        self.items = [None] * self.max_slots
+        self.quantities = [0] * self.max_slots
+        self._free = list(range(self.max_slots))
+        self._slots_by_code.clear()
+        self._used = 0
+        if changed:
+            self._notify("changed", changed)
+
+    # --- Queries ---
 
     def get_item(self, index):
         """Get item from a specific slot."""
@@ -31,10 +209,59 @@ class InventoryManager:
             return self.items[index]
         return None
 
-    def clear_inventory(self):
-        """Remove all items."""
-        self.items = [None] * self.max_slots
+    def get_quantity(self, index):
+        if 0 <= index < self.max_slots:
+            return self.quantities[index]
+        return 0
+
+    def find_slots(self, code):
+        """Slots holding items with this code, in slot order."""
+        return sorted(self._slots_by_code.get(code, ()))
+
+    def count(self, code):
+        return sum(self.quantities[i] for i in self._slots_by_code.get(code, ()))
+
+    def has_item(self, code):
+        return code in self._slots_by_code
+
+    def free_slot_count(self):
+        return self.max_slots - self._used
 
     def get_all_items(self):
         """Return all items in inventory."""
-        return self.items
\ No newline at end of file
+        return self.items
+
+    # --- Change events ---
+
+    def subscribe(self, callback):
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, event, slots):
+        for callback in self._listeners:
+            callback(event, slots)
+
+    def _changed(self, index):
+        if self._changed_slots is None:
+            self._changed_slots = set()
+        self._changed_slots.add(index)
+
+    def _flush_changes(self):
+        if self._changed_slots and not self._batching:
+            slots, self._changed_slots = self._changed_slots, None
+            self._notify("changed", slots)
+
+    @contextmanager
+    def batch(self):
+        """Group all changes made inside the block into one "changed" event."""
+        outer = not self._batching
+        self._batching = True
+        try:
+            yield self
+        finally:
+            if outer:
+                self._batching = False
+                self._flush_changes()
@@ -1,9 +1,13 @@
 import pygame
 import sys
 import textwrap
+from collections import OrderedDict
 from .help_func import get_sprite, slice_9, draw_9slice_box
 from .Inventory_Manager import InventoryManager
 from .Inventory_Item import *
+from .icon_atlas import IconAtlas, DETAIL_SIZE
+from src.utils.text_cache import render_text
+from src.utils.font_registry import fonts
 
 class InventoryUI:
     def __init__(self, screen):
@@ -11,10 +15,14 @@ class InventoryUI:
         self.state = "CLOSED"  # Possible states: "CLOSED", "OPEN"
 
         # Config
-        self.ROWS = 6
+        self.ROWS = 6          # visible rows; the grid scrolls when there are more
         self.COLS = 4
+        self.MAX_ROWS = 500    # inventory grows on demand up to MAX_ROWS * COLS slots
         self.SLOT_SIZE = 40
         self.MARGIN = 12
+        self.PITCH = self.SLOT_SIZE + self.MARGIN
+        self.SCROLL_SMOOTHING = 0.35  # fraction of the remaining distance scrolled per frame
+        self.ROW_CACHE_SIZE = self.ROWS + 6
 
         # Colors
         self.BOX_COLOR = (20, 20, 20)
@@ -23,6 +31,9 @@ class InventoryUI:
         self.HOVER_COLOR = (211, 211, 211)
         self.HIGHLIGHT_COLOR = (255, 255, 0)
         self.ICON_HIGHLIGHT_COLOR = (255, 215, 0)
+        self.COMBINE_COLOR = (255, 140, 0)
+        self.PARTNER_COLOR = (90, 200, 90)
+        self.HINT_COLOR = (150, 150, 150)
 
         # State
         self.SLOT_HOVERING = False
@@ -30,90 +41,149 @@ class InventoryUI:
         self.CLOSE_BTN_HOVERING = False
 
         self.selected_index = -1
-        self.inventory_rects = []
-        self.inventory_logic = InventoryManager(self.ROWS, self.COLS)
+        self.combiner = None         # EvidenceCombiner, set by the game
+        self.combine_from = None     # slot picked as the first item to combine
+        self.combine_partners = set()
+        self.status_message = ""     # result of the last combination
+        self.scroll_y = 0.0       # current scroll offset in px (animated)
+        self.scroll_target = 0    # scroll offset we are moving towards
+        self.inventory_logic = None
+        self._calculate_layout()
+        self._set_inventory(InventoryManager(self.ROWS, self.COLS, max_rows=self.MAX_ROWS))
+
+        # Item icons come pre-scaled from the atlas (built once, cached on disk)
+        self.icon_atlas = IconAtlas()
+        self.ICON_SIZE = 32
+        self.DETAIL_ICON_SIZE = DETAIL_SIZE
 
-        # Load item icon sheet (only once)
-        self.item_sheet = pygame.image.load("assets/images/tools/UI_Item_icon_temp.png").convert_alpha()
+        # Fonts (shared registry; rendered text goes through the shared cache)
+        self.title_font = fonts.sysfont("consolas", 28, bold=True)
+        self.name_font = fonts.sysfont("consolas", 24)
+        self.desc_font = fonts.sysfont("consolas", 16)
 
-        # Icon config
-        self.ICON_SIZE = 32
-        self.ICONS_PER_ROW = 3
-        self.ICON_GRID_SIZE = 340
-    def initialize_inventory(self):
-        self.inventory_logic = InventoryManager(self.ROWS, self.COLS)
-        for i, item in enumerate(item_list):
-            self.inventory_logic.add_item(item, i)
-
-    def get_item_icon(self, item):
-        col = item.icon_id % self.ICONS_PER_ROW
-        row = item.icon_id // self.ICONS_PER_ROW
-
-        x = col * self.ICON_GRID_SIZE + 10
-        y = row * self.ICON_GRID_SIZE + 15
-        icon = get_sprite(self.item_sheet, x, y, self.ICON_GRID_SIZE, self.ICON_GRID_SIZE)
-        icon_scaled = pygame.transform.scale(icon, (self.ICON_SIZE, self.ICON_SIZE))
-        return icon_scaled
-
-    def draw_inventory_icon(self, mouse_pos):
+        # Inventory HUD icon (load, slice and scale only once)
         WIDTH, HEIGHT = self.screen.get_size()
         ICON_WIDTH, ICON_HEIGHT = 64, 64
-        ICON_X = WIDTH - ICON_WIDTH - 20
-        ICON_Y = ICON_HEIGHT + 50 - 20
-
-        # Load inventory icon sprite sheet
+        self.inventory_icon_rect = pygame.Rect(WIDTH - ICON_WIDTH - 20, ICON_HEIGHT + 50 - 20, ICON_WIDTH, ICON_HEIGHT)
         inventory_icon_sprite_sheet = pygame.image.load("assets/images/tools/UI_Inventory_icon.png").convert_alpha()
         inventory_icon_sprite = get_sprite(inventory_icon_sprite_sheet, 20, 15, 85, 100)
-        inventory_icon_scaled = pygame.transform.scale(inventory_icon_sprite, (ICON_WIDTH, ICON_HEIGHT))
+        self.inventory_icon = pygame.transform.scale(inventory_icon_sprite, (ICON_WIDTH, ICON_HEIGHT))
 
-        icon_rect = pygame.Rect(ICON_X, ICON_Y, ICON_WIDTH, ICON_HEIGHT)
-        self.screen.blit(inventory_icon_scaled, (ICON_X, ICON_Y))
-
-        if icon_rect.collidepoint(mouse_pos):
-            self.ICON_HOVERING = True
-            pygame.draw.rect(self.screen, self.ICON_HIGHLIGHT_COLOR, icon_rect, 2)
-        else:
-            self.ICON_HOVERING = False
-
-    def draw_inventory(self, mouse_pos):
-        WIDTH, HEIGHT = self.screen.get_size()
-        BOX_WIDTH, BOX_HEIGHT = 650, 400
-        BOX_X = (WIDTH - BOX_WIDTH) // 2
-        BOX_Y = (HEIGHT - BOX_HEIGHT) // 2
-
-        GRID_X = BOX_X + 30
-        GRID_Y = BOX_Y + 60
-
-        CLOSE_BTN_SCALE = 2
-        CLOSE_BTN_SIZE = 13 * CLOSE_BTN_SCALE  # 26x26
-
-        if not self.inventory_rects:
-            for i in range(self.ROWS * self.COLS):
-                col = i % self.COLS
-                row = i // self.COLS
-                x = GRID_X + col * (self.SLOT_SIZE + self.MARGIN)
-                y = GRID_Y + row * (self.SLOT_SIZE + self.MARGIN)
-                if len(self.inventory_rects) < self.ROWS * self.COLS:
-                    self.inventory_rects.append(pygame.Rect(x, y, self.SLOT_SIZE, self.SLOT_SIZE))
-
-        # Load assets
+        # Panel sprites (load, slice and scale only once)
         inventory_sprite_sheet = pygame.image.load("assets/images/tools/UI Inventory.png").convert_alpha()
         border_sprite_sheet = pygame.image.load("assets/images/tools/BlackGrey UI Border.png").convert_alpha()
         button_sprite_sheet = pygame.image.load("assets/images/tools/UI Buttons.png").convert_alpha()
-
-        slot_sprite = get_sprite(inventory_sprite_sheet, 100, 68, 39, 39)
-        border_sprite = get_sprite(border_sprite_sheet, 116, 5, 48, 48)
-    
-        # Load and scale close button sprite
+        self.slot_sprite = get_sprite(inventory_sprite_sheet, 100, 68, 39, 39)
+        self.border_slices = slice_9(get_sprite(border_sprite_sheet, 116, 5, 48, 48))
+        self.CLOSE_BTN_SIZE = 13 * 2  # 26x26
         close_button_sprite = get_sprite(button_sprite_sheet, 172, 1, 13, 13)
-        close_button_scaled = pygame.transform.scale(close_button_sprite, (CLOSE_BTN_SIZE, CLOSE_BTN_SIZE))
+        self.close_button_scaled = pygame.transform.scale(close_button_sprite, (self.CLOSE_BTN_SIZE, self.CLOSE_BTN_SIZE))
+        self.qty_font = fonts.sysfont("consolas", 12, bold=True)
+
+    def _calculate_layout(self):
+        WIDTH, HEIGHT = self.screen.get_size()
+        self.BOX_WIDTH, self.BOX_HEIGHT = 650, 400
+        self.BOX_X = (WIDTH - self.BOX_WIDTH) // 2
+        self.BOX_Y = (HEIGHT - self.BOX_HEIGHT) // 2
+        self.GRID_X = self.BOX_X + 30
+        self.GRID_Y = self.BOX_Y + 60
+        self.GRID_WIDTH = self.COLS * self.PITCH - self.MARGIN
+        self.VIEW_HEIGHT = self.ROWS * self.PITCH - self.MARGIN
+        self.grid_view_rect = pygame.Rect(self.GRID_X, self.GRID_Y, self.GRID_WIDTH, self.VIEW_HEIGHT)
+
+    def _set_inventory(self, manager):
+        """Use a new InventoryManager; its change events redraw only the affected slots."""
+        if self.inventory_logic is not None:
+            self.inventory_logic.unsubscribe(self._on_inventory_changed)
+        self.inventory_logic = manager
+        manager.subscribe(self._on_inventory_changed)
+        self._row_cache = OrderedDict()  # row -> Surface (slot sprites + icons + counts)
+        self.scroll_y = 0.0
+        self.scroll_target = 0
+        self._cancel_combine()
+
+    def _on_inventory_changed(self, event, slots):
+        if event != "changed":
+            return
+        for index in slots:
+            row_surf = self._row_cache.get(index // self.COLS)
+            if row_surf is not None:
+                self._draw_slot(row_surf, index)
+        if self.combine_from is not None:
+            self.combine_partners = self.combiner.partner_slots(self.inventory_logic, self.combine_from)
+
+    # --- Evidence combination ---
+
+    def set_combiner(self, combiner):
+        self.combiner = combiner
+
+    def _start_combine(self):
+        """Pick the selected item as the first half of a combination."""
+        if self.combiner is None or self.inventory_logic.get_item(self.selected_index) is None:
+            return
+        self.combine_from = self.selected_index
+        self.combine_partners = self.combiner.partner_slots(self.inventory_logic, self.selected_index)
+        self.status_message = "Choose an item to combine with."
+
+    def _cancel_combine(self):
+        self.combine_from = None
+        self.combine_partners = set()
+
+    def _finish_combine(self, target):
+        result = self.combiner.combine(self.inventory_logic, self.combine_from, target)
+        self._cancel_combine()
+        self.status_message = result.message
+        if result.produced:
+            slots = self.inventory_logic.find_slots(result.produced[0].code)
+            if slots:
+                self.selected_index = slots[0]
+                self._scroll_to_index(self.selected_index)
+        return result
+
+    def _partner_names(self, item):
+        if self.combiner is None:
+            return []
+        names = []
+        for code in sorted(self.combiner.recipes.partners(item.code)):
+            partner = self.combiner.registry.get(code)
+            if partner is not None:
+                names.append(partner.name)
+        return names
+
+    def initialize_inventory(self, registry=None, case_id=None):
+        """Fill the inventory with the items of an ItemRegistry (default: the item data files)."""
+        self._set_inventory(InventoryManager(self.ROWS, self.COLS, max_rows=self.MAX_ROWS))
+        if registry is None:
+            registry = ItemRegistry()
+        self.inventory_logic.add_items(registry.starting_items(case_id))
+
+    def get_item_icon(self, item, size=None):
+        """Pre-scaled icon of the item (shared surface, blit only); None if it has no icon."""
+        return self.icon_atlas.get(item.icon_id, size or self.ICON_SIZE)
+
+    def get_inventory_icon_frames(self):
+        """Idle and hover surfaces of the inventory icon, for the HUD compositor."""
+        hover = self.inventory_icon.copy()
+        pygame.draw.rect(hover, self.ICON_HIGHLIGHT_COLOR, hover.get_rect(), 2)
+        return [self.inventory_icon, hover]
+
+    def update_icon_hover(self, mouse_pos):
+        self.ICON_HOVERING = self.inventory_icon_rect.collidepoint(mouse_pos)
+        return self.ICON_HOVERING
+
+    def draw_inventory(self, mouse_pos):
+        BOX_WIDTH, BOX_HEIGHT = self.BOX_WIDTH, self.BOX_HEIGHT
+        BOX_X, BOX_Y = self.BOX_X, self.BOX_Y
+        GRID_X, GRID_Y = self.GRID_X, self.GRID_Y
+
+        CLOSE_BTN_SIZE = self.CLOSE_BTN_SIZE
 
         # Fonts
-        title_font = pygame.font.SysFont("consolas", 28, bold=True)
-        name_font = pygame.font.SysFont("consolas", 24)
-        desc_font = pygame.font.SysFont("consolas", 16)
+        title_font = self.title_font
+        name_font = self.name_font
+        desc_font = self.desc_font
 
-        slices = slice_9(border_sprite)
+        slices = self.border_slices
 
         # Close button position
         CLOSE_BTN_X = BOX_X + BOX_WIDTH - CLOSE_BTN_SIZE - 8
@@ -125,33 +195,19 @@ class InventoryUI:
         draw_9slice_box(self.screen, slices, BOX_X, BOX_Y, BOX_WIDTH, BOX_HEIGHT)
 
         # Title label with 9-slice border
-        title_text = title_font.render("INVENTORY", True, self.TEXT_COLOR)
+        title_text = render_text(title_font, "INVENTORY", self.TEXT_COLOR)
         title_rect = title_text.get_rect(center=(BOX_X + BOX_WIDTH // 2, BOX_Y - 0))
         label_bg_rect = title_rect.inflate(40, 20)
         draw_9slice_box(self.screen, slices, label_bg_rect.x, label_bg_rect.y, label_bg_rect.width, label_bg_rect.height)
         self.screen.blit(title_text, title_rect)
 
-        # Left panel: inventory grid
-        self.SLOT_HOVERING = False
-        for i, slot in enumerate(self.inventory_rects):
-            self.screen.blit(slot_sprite, (slot.x, slot.y))
-            if slot.collidepoint(mouse_pos):
-                self.SLOT_HOVERING = True
-                pygame.draw.rect(self.screen, self.HOVER_COLOR, slot, 2)
-            if i == self.selected_index:
-                pygame.draw.rect(self.screen, self.HIGHLIGHT_COLOR, slot, 2)
-            # Draw item icon inside slot
-            item = self.inventory_logic.get_item(i)
-            if item:
-                icon = self.get_item_icon(item)
-                icon_x = slot.x + (self.SLOT_SIZE - self.ICON_SIZE) // 2
-                icon_y = slot.y + (self.SLOT_SIZE - self.ICON_SIZE) // 2
-                self.screen.blit(icon, (icon_x, icon_y))
+        # Left panel: virtualized inventory grid (only visible rows are drawn)
+        self._draw_grid(mouse_pos)
 
         # Divider line
-        divider_x = GRID_X + self.COLS * (self.SLOT_SIZE + self.MARGIN) + 20
+        divider_x = GRID_X + self.COLS * self.PITCH + 20
         divider_top = GRID_Y
-        divider_bottom = GRID_Y + self.ROWS * (self.SLOT_SIZE + self.MARGIN) - self.MARGIN
+        divider_bottom = GRID_Y + self.VIEW_HEIGHT
         pygame.draw.line(self.screen, self.LINE_COLOR, (divider_x, divider_top), (divider_x, divider_bottom), 2)
 
         # Right panel
@@ -159,7 +215,7 @@ class InventoryUI:
         panel_width = BOX_X + BOX_WIDTH - panel_x - 20
 
         # Draw close button
-        self.screen.blit(close_button_scaled, (close_button_rect.x, close_button_rect.y))
+        self.screen.blit(self.close_button_scaled, (close_button_rect.x, close_button_rect.y))
         if close_button_rect.collidepoint(mouse_pos):
             pygame.draw.rect(self.screen, self.HOVER_COLOR, close_button_rect, 2)
             self.CLOSE_BTN_HOVERING = True
@@ -168,12 +224,14 @@ class InventoryUI:
         # Display selected item details
         item = self.inventory_logic.get_item(self.selected_index)
         if item:
-            item_name = name_font.render(item.name, True, self.TEXT_COLOR)
-            item_code = desc_font.render(f"Code: {item.code}", True, self.TEXT_COLOR)
+            quantity = self.inventory_logic.get_quantity(self.selected_index)
+            title = f"{item.name} x{quantity}" if quantity > 1 else item.name
+            item_name = render_text(name_font, title, self.TEXT_COLOR)
+            item_code = render_text(desc_font, f"Code: {item.code}", self.TEXT_COLOR)
             item_desc = textwrap.wrap(item.description, width=panel_width // 9)
         else:
-            item_name = name_font.render("Empty Slot", True, self.TEXT_COLOR)
-            item_code = desc_font.render("N/A", True, self.TEXT_COLOR)
+            item_name = render_text(name_font, "Empty Slot", self.TEXT_COLOR)
+            item_code = render_text(desc_font, "N/A", self.TEXT_COLOR)
             item_desc = textwrap.wrap("No item in this slot.", width=panel_width // 9)
         
         # Render item name
@@ -189,9 +247,152 @@ class InventoryUI:
 
         # Render description
         for i, line in enumerate(item_desc):
-            desc = desc_font.render(line, True, self.TEXT_COLOR)
+            desc = render_text(desc_font, line, self.TEXT_COLOR)
             self.screen.blit(desc, (panel_x, GRID_Y + 80 + i * 20))
 
+        # Known combinations of the selected item (precomputed partner sets)
+        y = GRID_Y + 80 + len(item_desc) * 20 + 10
+        partners = self._partner_names(item) if item else []
+        if partners:
+            hint = "Combines with: " + ", ".join(partners) + "  [C]"
+            for i, line in enumerate(textwrap.wrap(hint, width=panel_width // 9)):
+                text = render_text(desc_font, line, self.PARTNER_COLOR)
+                self.screen.blit(text, (panel_x, y + i * 20))
+
+        # Result of the last combination (or the prompt while choosing)
+        if self.status_message:
+            lines = textwrap.wrap(self.status_message, width=panel_width // 9)
+            status_y = GRID_Y + self.VIEW_HEIGHT - self.DETAIL_ICON_SIZE - 10 - len(lines) * 20
+            for i, line in enumerate(lines):
+                status = render_text(desc_font, line, self.COMBINE_COLOR)
+                self.screen.blit(status, (panel_x + (panel_width - status.get_width()) // 2, status_y + i * 20))
+
+        # Large icon of the selected item at the bottom of the panel
+        icon = self.get_item_icon(item, self.DETAIL_ICON_SIZE) if item else None
+        if icon is not None:
+            icon_x = panel_x + (panel_width - self.DETAIL_ICON_SIZE) // 2
+            self.screen.blit(icon, (icon_x, GRID_Y + self.VIEW_HEIGHT - self.DETAIL_ICON_SIZE))
+
+    # --- Virtualized grid ---
+
+    def _total_rows(self):
+        return self.inventory_logic.rows
+
+    def _max_scroll(self):
+        return max(0, self._total_rows() * self.PITCH - self.MARGIN - self.VIEW_HEIGHT)
+
+    def scroll_to(self, offset):
+        self.scroll_target = max(0, min(self._max_scroll(), int(offset)))
+
+    def scroll_by_rows(self, rows):
+        self.scroll_to(self.scroll_target + rows * self.PITCH)
+
+    def _scroll_to_index(self, index):
+        """Scroll just enough to make the slot at `index` fully visible."""
+        if index < 0:
+            return
+        top = (index // self.COLS) * self.PITCH
+        if top < self.scroll_target:
+            self.scroll_to(top)
+        elif top + self.SLOT_SIZE > self.scroll_target + self.VIEW_HEIGHT:
+            self.scroll_to(top + self.SLOT_SIZE - self.VIEW_HEIGHT)
+
+    def _advance_scroll(self):
+        delta = self.scroll_target - self.scroll_y
+        if abs(delta) < 0.5:
+            self.scroll_y = float(self.scroll_target)
+        else:
+            self.scroll_y += delta * self.SCROLL_SMOOTHING
+
+    def _slot_at(self, mouse_pos):
+        """Slot index under the mouse by arithmetic on the grid pitch, or None."""
+        x = mouse_pos[0] - self.GRID_X
+        view_y = mouse_pos[1] - self.GRID_Y
+        if not (0 <= x < self.GRID_WIDTH and 0 <= view_y < self.VIEW_HEIGHT):
+            return None
+        y = view_y + int(self.scroll_y)
+        col, col_off = divmod(x, self.PITCH)
+        row, row_off = divmod(y, self.PITCH)
+        if col_off >= self.SLOT_SIZE or row_off >= self.SLOT_SIZE:
+            return None  # in the margin between slots
+        index = row * self.COLS + col
+        return index if index < self.inventory_logic.max_slots else None
+
+    def _slot_rect(self, index):
+        """Screen rect of a slot at the current scroll offset."""
+        row, col = divmod(index, self.COLS)
+        return pygame.Rect(self.GRID_X + col * self.PITCH,
+                           self.GRID_Y + row * self.PITCH - int(self.scroll_y),
+                           self.SLOT_SIZE, self.SLOT_SIZE)
+
+    def _get_row_surface(self, row):
+        row_surf = self._row_cache.get(row)
+        if row_surf is not None:
+            self._row_cache.move_to_end(row)
+            return row_surf
+        row_surf = pygame.Surface((self.GRID_WIDTH, self.SLOT_SIZE), pygame.SRCALPHA)
+        first = row * self.COLS
+        for index in range(first, min(first + self.COLS, self.inventory_logic.max_slots)):
+            self._draw_slot(row_surf, index)
+        self._row_cache[row] = row_surf
+        if len(self._row_cache) > self.ROW_CACHE_SIZE:
+            self._row_cache.popitem(last=False)
+        return row_surf
+
+    def _draw_slot(self, row_surf, index):
+        """Slot sprite + item icon + stack count, drawn into its row surface."""
+        rect = pygame.Rect((index % self.COLS) * self.PITCH, 0, self.SLOT_SIZE, self.SLOT_SIZE)
+        row_surf.fill((0, 0, 0, 0), rect)
+        row_surf.blit(self.slot_sprite, rect.topleft)
+        item = self.inventory_logic.get_item(index)
+        if item:
+            icon = self.get_item_icon(item)
+            if icon is not None:
+                icon_x = rect.x + (self.SLOT_SIZE - self.ICON_SIZE) // 2
+                icon_y = rect.y + (self.SLOT_SIZE - self.ICON_SIZE) // 2
+                row_surf.blit(icon, (icon_x, icon_y))
+            quantity = self.inventory_logic.get_quantity(index)
+            if quantity > 1:
+                qty = render_text(self.qty_font, str(quantity), self.TEXT_COLOR)
+                qty_rect = qty.get_rect(bottomright=(rect.right - 3, rect.bottom - 3))
+                row_surf.fill(self.BOX_COLOR, qty_rect.inflate(2, 0))
+                row_surf.blit(qty, qty_rect)
+
+    def _draw_grid(self, mouse_pos):
+        self._advance_scroll()
+        scroll = int(self.scroll_y)
+        first_row = scroll // self.PITCH
+        last_row = min(self._total_rows() - 1, (scroll + self.VIEW_HEIGHT) // self.PITCH)
+
+        previous_clip = self.screen.get_clip()
+        self.screen.set_clip(self.grid_view_rect)
+        for row in range(first_row, last_row + 1):
+            self.screen.blit(self._get_row_surface(row), (self.GRID_X, self.GRID_Y + row * self.PITCH - scroll))
+
+        hovered = self._slot_at(mouse_pos)
+        self.SLOT_HOVERING = hovered is not None
+        if hovered is not None:
+            pygame.draw.rect(self.screen, self.HOVER_COLOR, self._slot_rect(hovered), 2)
+        if self.combine_from is not None:
+            first_slot = first_row * self.COLS
+            last_slot = (last_row + 1) * self.COLS
+            for index in self.combine_partners:
+                if first_slot <= index < last_slot:
+                    pygame.draw.rect(self.screen, self.PARTNER_COLOR, self._slot_rect(index), 2)
+            pygame.draw.rect(self.screen, self.COMBINE_COLOR, self._slot_rect(self.combine_from), 3)
+        if 0 <= self.selected_index < self.inventory_logic.max_slots:
+            pygame.draw.rect(self.screen, self.HIGHLIGHT_COLOR, self._slot_rect(self.selected_index), 2)
+        self.screen.set_clip(previous_clip)
+
+        # Scrollbar (only when the grid does not fit)
+        max_scroll = self._max_scroll()
+        if max_scroll > 0:
+            track = pygame.Rect(self.GRID_X + self.GRID_WIDTH + 6, self.GRID_Y, 4, self.VIEW_HEIGHT)
+            thumb_h = max(16, self.VIEW_HEIGHT * self.VIEW_HEIGHT // (self.VIEW_HEIGHT + max_scroll))
+            thumb_y = track.y + (self.VIEW_HEIGHT - thumb_h) * self.scroll_y / max_scroll
+            pygame.draw.rect(self.screen, self.LINE_COLOR, track)
+            pygame.draw.rect(self.screen, self.HOVER_COLOR, (track.x, thumb_y, track.width, thumb_h))
+
     def _inventory_get_state(self):
         return self.state == "OPEN"
     
@@ -199,6 +400,8 @@ class InventoryUI:
         self.state = new_state  
         if new_state == "CLOSED":
             self.selected_index = -1
+            self.status_message = ""
+            self._cancel_combine()
             self.SLOT_HOVERING = False
             self.CLOSE_BTN_HOVERING = False   
             self.ICON_HOVERING = False
@@ -210,22 +413,42 @@ class InventoryUI:
         return self.CLOSE_BTN_HOVERING
 
     def _select_slot(self, mouse_pos):
-        for i, slot in enumerate(self.inventory_rects):
-            if slot.collidepoint(mouse_pos):
-                return i
+        return self._slot_at(mouse_pos)
     
     def _handle_keys_inventory(self, key, mouse_pos):
+        slot_count = self.inventory_logic.max_slots
         if key == pygame.K_RIGHT:
-            self.selected_index = (self.selected_index + 1) % len(self.inventory_rects)
+            self.selected_index = (self.selected_index + 1) % slot_count
         elif key == pygame.K_LEFT:
-            self.selected_index = (self.selected_index - 1) % len(self.inventory_rects)
+            self.selected_index = (self.selected_index - 1) % slot_count
         elif key == pygame.K_DOWN:
-            self.selected_index = (self.selected_index + self.COLS) % len(self.inventory_rects)
+            self.selected_index = (self.selected_index + self.COLS) % slot_count
         elif key == pygame.K_UP:
-            self.selected_index = (self.selected_index - self.COLS) % len(self.inventory_rects)
+            self.selected_index = (self.selected_index - self.COLS) % slot_count
+        elif key == pygame.K_PAGEDOWN:
+            self.selected_index = min(slot_count - 1, max(0, self.selected_index) + self.ROWS * self.COLS)
+        elif key == pygame.K_PAGEUP:
+            self.selected_index = max(0, self.selected_index - self.ROWS * self.COLS)
+        elif key == "WHEEL_UP":
+            self.scroll_by_rows(-1)
+        elif key == "WHEEL_DOWN":
+            self.scroll_by_rows(1)
+        elif key == pygame.K_c:
+            if self.combine_from is None:
+                self._start_combine()
+            else:
+                self._cancel_combine()
+                self.status_message = ""
+        elif key == pygame.K_RETURN:
+            if self.combine_from is not None:
+                self._finish_combine(self.selected_index)
         elif key == "LMB_CLICK":
             if self.SLOT_HOVERING:
-                self.selected_index = self._select_slot(mouse_pos)
+                slot = self._select_slot(mouse_pos)
+                if slot is not None and self.combine_from is not None:
+                    self._finish_combine(slot)
+                elif slot is not None:
+                    self.selected_index = slot
             elif self.ICON_HOVERING:
                 self.state = "OPEN"
                 self.selected_index = -1
@@ -233,6 +456,8 @@ class InventoryUI:
             elif self.CLOSE_BTN_HOVERING:
                 self.state = "CLOSED"
                 self.CLOSE_BTN_HOVERING = False
+        if key in (pygame.K_RIGHT, pygame.K_LEFT, pygame.K_DOWN, pygame.K_UP, pygame.K_PAGEDOWN, pygame.K_PAGEUP):
+            self._scroll_to_index(self.selected_index)
 
 
 
@@ -2,6 +2,12 @@
 import pygame
 import math
 from .help_func import *
+from src.utils.text_cache import render_text
+from .text_layout import layout_text
+from .clue_store import ClueStore
+from .clue_search import ClueSearchIndex
+from .note_editor import NoteEditor, KEY_REPEAT
+from .rich_text import has_markup, layout_rich_text
 
 # --- Hằng số & Cài đặt (Giữ nguyên) ---
 COLOR_DARK_COVER = (25, 25, 30)
@@ -24,10 +30,15 @@ COLOR_TEXT_BRIGHT = (10, 10, 10)
 COLOR_TEXT_DIM = (194, 178, 146)
 COLOR_CLOSE_BUTTON = (200, 50, 50) 
 COLOR_CLOSE_BUTTON_HOVER = (255, 0, 0) 
+COLOR_SEARCH_BOX = (240, 220, 180)
+COLOR_SEARCH_BOX_ACTIVE = (255, 245, 215)
+COLOR_SEARCH_PLACEHOLDER = (140, 120, 90)
+COLOR_NOTE_TEXT = (20, 40, 110)
 
 # --- Cài đặt ---
 PULSE_CYCLE_MS = 1000.0
 PULSE_HALF_CYCLE = PULSE_CYCLE_MS / 2.0
+PULSE_FRAMES = 12 # Số màu tính sẵn cho hiệu ứng nhấp nháy của dòng được chọn
 CLUES_PER_PAGE = 10
 LINE_SPACING = 50 # <<< THAY ĐỔI: Điều chỉnh khoảng cách dòng (từ 52)
 FIRST_LINE_OFFSET_Y = -30 # <<< THAY ĐỔI: Tăng lề trên (từ 30)
@@ -35,26 +46,9 @@ TEXT_ABOVE_LINE_OFFSET = 5 # <<< THÊM MỚI: Pixel để đẩy chữ lên trê
 
 # --- Hàm trợ giúp (Giữ nguyên) ---
 def draw_text(surface, text, font, color, rect, aa=True, bkg=None, line_height_override=None):
-    y = rect.top
-    actual_line_step = line_height_override if line_height_override is not None else font.get_linesize()
-    original_rect_bottom = rect.bottom
-    while text and y <= original_rect_bottom:
-        i = 1
-        while font.size(text[:i])[0] < rect.width and i < len(text):
-            i += 1
-        if i < len(text):
-            temp_i = text.rfind(" ", 0, i)
-            if temp_i != -1 and temp_i != 0:
-                i = temp_i + 1
-            elif i == 0:
-                i = 1
-        # Nên dùng aa=False nếu bạn đổi sang font pixel
-        image = font.render(text[:i], aa, color, bkg)
-        image_rect = image.get_rect(bottomleft=(rect.left, y))
-        surface.blit(image, image_rect)
-        y += actual_line_step
-        text = text[i:]
-    return text
+    # Layout được ghi nhớ theo (text, font, width, line_height) - dùng chung với check_text_fit
+    layout = layout_text(text, font, rect.width, line_height_override)
+    return layout.draw(surface, font, color, rect, aa, bkg)
 
 def lerp_color(color_a, color_b, t):
     r = color_a[0] + (color_b[0] - color_a[0]) * t
@@ -63,22 +57,7 @@ def lerp_color(color_a, color_b, t):
     return (int(r), int(g), int(b))
 
 def check_text_fit(text, font, rect_width, max_lines, line_height_override=None):
-    line_count = 0
-    while text:
-        line_count += 1
-        if line_count > max_lines:
-            return False
-        i = 1
-        while font.size(text[:i])[0] < rect_width and i < len(text):
-            i += 1
-        if i < len(text):
-            temp_i = text.rfind(" ", 0, i)
-            if temp_i != -1 and temp_i != 0:
-                i = temp_i + 1
-            elif i == 0:
-                i = 1
-        text = text[i:]
-    return True
+    return layout_text(text, font, rect_width, line_height_override).fits(max_lines)
 
 
 # --- Lớp Sổ Tay Chính ---
@@ -86,19 +65,52 @@ class Notebook:
     def __init__(self, screen, clock, clues_data, fonts, screen_width, screen_height):
         self.screen = screen
         self.clock = clock
-        self.clues = clues_data
+        # Nhận ClueStore hoặc list dict (sẽ được bọc trong ClueStore)
+        self.clues = clues_data if isinstance(clues_data, ClueStore) else ClueStore(clues_data)
+        # Chỉ mục tìm kiếm phải đăng ký trước để được cập nhật trước Notebook;
+        # nó chỉ đọc các manh mối ở lần tìm kiếm đầu tiên
+        self.search_index = ClueSearchIndex(self.clues)
+        self.clues.subscribe(self._on_clues_changed)
         self.fonts = fonts
         self.screen_width = screen_width
         self.screen_height = screen_height
 
         self.selected_clue_index = -1
-        self.clue_list_rects = []
+        self.visible_clue_ids = []  # id các manh mối trên trang hiện tại (để hit-test)
         self.current_page = 0
         self.total_pages = 1
         self.running = False
         self.current_pulse_color = COLOR_TEXT_BRIGHT
+        self.current_pulse_frame = 0
         self.is_open = False
 
+        # --- Tìm kiếm ---
+        self.search_query = ""
+        self.search_active = False
+        self.search_results = None  # None = hiện mọi manh mối đã mở khóa
+
+        # --- Ghi chú của người chơi (trang phải: "clue" hoặc "notes") ---
+        self.right_mode = "clue"
+        self._note_clue_id = -1  # manh mối đang được nạp vào note_editor
+        self._saved_key_repeat = None
+
+        # --- Cache render theo trang ---
+        # Trang trái, trang phải và số trang được vẽ sẵn vào surface riêng và chỉ
+        # vẽ lại khi đổi trang, mở khóa manh mối hoặc đổi lựa chọn.
+        self._dirty_parts = {"left", "right", "counter", "search"}
+        self._left_page_surf = None
+        self._right_page_surf = None
+        self._page_count_surf = None
+        self._page_count_rect = None
+        self._search_surf = None
+        self._search_caret_x = 0
+        self._link_boxes = []  # [(Rect màn hình, đích)] của link trong mô tả đang hiển thị
+        self._frame_surf = None
+        self._pulse_frames = []  # [(surface, pos)] cho dòng đang được chọn
+        self._pulse_colors = [
+            lerp_color(COLOR_TEXT_BRIGHT, COLOR_TEXT_DIM, i / (PULSE_FRAMES - 1)) for i in range(PULSE_FRAMES)
+        ]
+
         # Tải asset tại đây
         try:
             self.ui_spritesheet = pygame.image.load("assets/images/tools/bookassets.png").convert_alpha()
@@ -115,6 +127,7 @@ class Notebook:
         self.notebook_background_sprite = None 
         
         self._calculate_layout()
+        self.refresh()
 
     def _calculate_layout(self):
         # Kích thước mong muốn trên màn hình (Giữ nguyên)
@@ -182,17 +195,245 @@ class Notebook:
             CLOSE_BUTTON_SIZE
         )
 
+        # --- Ô tìm kiếm (phía trên sổ) ---
+        SEARCH_BOX_W, SEARCH_BOX_H = 320, 34
+        self.search_box_rect = pygame.Rect(self.BOOK_X + (BOOK_TOTAL_WIDTH - SEARCH_BOX_W) // 2,
+                                           self.BOOK_Y - SEARCH_BOX_H - 8,
+                                           SEARCH_BOX_W, SEARCH_BOX_H)
+
+        # --- Tab Ghi chú / Manh mối (góc dưới trái của trang phải) ---
+        self.notes_tab_rect = pygame.Rect(self.INFO_DETAIL_AREA_X, page_turn_y_pos - 14, 90, 28)
+
+        # --- Ô ghi chú: đè lên các dòng kẻ bên dưới tiêu đề ---
+        note_font = self.fonts.get('note') or self.fonts['desc_options'][min(self.fonts['desc_options'])]
+        note_top = self.INFO_DETAIL_AREA_Y + FIRST_LINE_OFFSET_Y + LINE_SPACING - TEXT_ABOVE_LINE_OFFSET
+        self.note_editor = NoteEditor(note_font,
+                                      (self.INFO_DETAIL_AREA_X, note_top, self.INFO_DETAIL_AREA_WIDTH, (CLUES_PER_PAGE - 1) * LINE_SPACING),
+                                      LINE_SPACING, color=COLOR_NOTE_TEXT)
+
         # === Scale sprite 1 LẦN DUY NHẤT ===
         self.notebook_background_sprite = pygame.transform.scale(
             self.notebook_bg_sprite_original, 
             (BOOK_TOTAL_WIDTH, BOOK_TOTAL_HEIGHT) 
         )
 
+        # Nền tĩnh: màu tối + sổ + dòng kẻ (chỉ vẽ 1 lần)
+        self.book_size = (BOOK_TOTAL_WIDTH, BOOK_TOTAL_HEIGHT)
+        self._base_surf = pygame.Surface((self.screen_width, self.screen_height)).convert()
+        self._base_surf.fill(COLOR_DARK_COVER)
+        self._base_surf.blit(self.notebook_background_sprite, (self.BOOK_X, self.BOOK_Y))
+        for i in range(CLUES_PER_PAGE):
+            # Dòng kẻ trang trái
+            y_left = self.CLUE_LIST_AREA_Y + FIRST_LINE_OFFSET_Y + (i * LINE_SPACING)
+            pygame.draw.line(self._base_surf, COLOR_LINE, (self.CLUE_LIST_AREA_X, y_left), (self.CLUE_LIST_AREA_X + self.CLUE_LIST_AREA_WIDTH, y_left), 1)
+            # Dòng kẻ trang phải
+            y_right = self.INFO_DETAIL_AREA_Y + FIRST_LINE_OFFSET_Y + (i * LINE_SPACING)
+            pygame.draw.line(self._base_surf, COLOR_LINE, (self.INFO_DETAIL_AREA_X, y_right), (self.INFO_DETAIL_AREA_X + self.INFO_DETAIL_AREA_WIDTH, y_right), 1)
+        self.invalidate()
+
     def open_notebook(self):
         self.is_open = True
 
     def close_notebook(self):
         self.is_open = False
+        self._set_search_active(False)
+        self.note_editor.blur()
+        self._sync_text_input()
+        self._save_note()
+
+    # --- Cache invalidation ---
+
+    def invalidate(self, *parts):
+        """Đánh dấu các phần cần vẽ lại ("left", "right", "counter", "search"); không truyền gì = tất cả."""
+        self._dirty_parts.update(parts or ("left", "right", "counter", "search"))
+
+    def refresh(self):
+        """Cập nhật số trang từ ClueStore và vẽ lại toàn bộ."""
+        self.total_pages = self._page_count()
+        self.current_page = min(self.current_page, self.total_pages - 1)
+        self.invalidate()
+
+    def unlock_clue(self, index):
+        """Mở khóa một manh mối (ClueStore sẽ báo lại qua _on_clues_changed)."""
+        self.clues.unlock(index)
+
+    # --- Phân trang (theo kết quả tìm kiếm nếu đang lọc) ---
+
+    def _page_count(self):
+        if self.search_results is None:
+            return self.clues.page_count(CLUES_PER_PAGE)
+        return max(1, math.ceil(len(self.search_results) / CLUES_PER_PAGE))
+
+    def _page_ids(self, page):
+        if self.search_results is None:
+            return self.clues.page(page, CLUES_PER_PAGE)
+        start = page * CLUES_PER_PAGE
+        return self.search_results[start:start + CLUES_PER_PAGE]
+
+    # --- Tìm kiếm ---
+
+    def is_capturing_text(self):
+        """True khi ô tìm kiếm hoặc ô ghi chú đang nhận phím (Game không xử lý phím tắt E/R/ESC)."""
+        return self.is_open and (self.search_active or self.note_editor.focused)
+
+    def _sync_text_input(self):
+        """Bật/tắt nhập văn bản (IME) và lặp phím theo ô đang focus."""
+        if self.search_active or self.note_editor.focused:
+            pygame.key.start_text_input()
+            if self.note_editor.focused:
+                pygame.key.set_text_input_rect(self.note_editor.caret_rect())
+            else:
+                pygame.key.set_text_input_rect(self.search_box_rect)
+            if self._saved_key_repeat is None:
+                self._saved_key_repeat = pygame.key.get_repeat()
+                pygame.key.set_repeat(*KEY_REPEAT)
+        else:
+            pygame.key.stop_text_input()
+            if self._saved_key_repeat is not None:
+                pygame.key.set_repeat(*self._saved_key_repeat)
+                self._saved_key_repeat = None
+
+    def _set_search_active(self, active):
+        if active == self.search_active:
+            return
+        self.search_active = active
+        if active:
+            self.note_editor.blur()
+        self._sync_text_input()
+        self.invalidate("search")
+
+    # --- Ghi chú ---
+
+    def _set_right_mode(self, mode):
+        if mode != self.right_mode:
+            self.right_mode = mode
+            if mode != "notes":
+                self.note_editor.blur()
+                self._sync_text_input()
+            self.invalidate("right")
+
+    def _save_note(self):
+        if self.note_editor.dirty and self._note_clue_id != -1:
+            self.clues.set_note(self._note_clue_id, self.note_editor.text)
+            self.note_editor.dirty = False
+
+    def _sync_note(self):
+        """Nạp ghi chú của manh mối đang chọn vào note_editor (lưu ghi chú cũ trước)."""
+        if self._note_clue_id == self.selected_clue_index:
+            return
+        self._save_note()
+        self.note_editor.blur()
+        self._sync_text_input()
+        self._note_clue_id = self.selected_clue_index
+        self.note_editor.set_text(self.clues.note(self._note_clue_id) if self._note_clue_id != -1 else "")
+
+    # --- Link giữa các manh mối ---
+
+    def _link_at(self, mouse_pos):
+        if self.right_mode != "clue":
+            return None
+        for box, target in self._link_boxes:
+            if box.collidepoint(mouse_pos):
+                return target
+        return None
+
+    def _resolve_link(self, target):
+        if target.isdigit():
+            clue_id = int(target)
+            return clue_id if 0 <= clue_id < len(self.clues) else -1
+        return self.clues.find(target)
+
+    def jump_to_clue(self, clue_id):
+        """Lật tới trang chứa manh mối và chọn nó (bỏ lọc tìm kiếm nếu cần)."""
+        if clue_id == -1 or not self.clues.is_unlocked(clue_id):
+            return False
+        if self.search_results is not None and clue_id not in self.search_results:
+            self.set_search_query("")
+        if self.search_results is None:
+            page = self.clues.page_of(clue_id, CLUES_PER_PAGE)
+        else:
+            page = self.search_results.index(clue_id) // CLUES_PER_PAGE
+        self._set_page(page)
+        self._set_selection(clue_id)
+        return True
+
+    def _handle_note_event(self, event):
+        """Chuyển sự kiện cho note_editor khi trang phải đang ở chế độ ghi chú."""
+        if self.right_mode != "notes" or self.selected_clue_index == -1:
+            return False
+        was_focused = self.note_editor.focused
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE and was_focused:
+            self.note_editor.blur()
+            self._sync_text_input()
+            return True
+        used = self.note_editor.handle_event(event)
+        if used and self.note_editor.focused:
+            if not was_focused:
+                self._set_search_active(False)
+            self._sync_text_input()
+        return used
+
+    def set_search_query(self, query):
+        if query == self.search_query:
+            return
+        self.search_query = query
+        self._apply_search()
+        self.current_page = 0
+        self.invalidate()
+
+    def _apply_search(self):
+        self.search_results = self.search_index.search(self.search_query)
+        self.total_pages = self._page_count()
+        self.current_page = min(self.current_page, self.total_pages - 1)
+        if self.search_results is not None and self.selected_clue_index not in self.search_results:
+            self.selected_clue_index = -1
+
+    def _handle_search_key(self, event):
+        if event.key == pygame.K_BACKSPACE:
+            self.set_search_query(self.search_query[:-1])
+        elif event.key in (pygame.K_ESCAPE, pygame.K_RETURN, pygame.K_KP_ENTER):
+            self._set_search_active(False)
+
+    def _on_clues_changed(self, event, clue_id):
+        if self.search_results is not None:
+            # Chỉ mục đã cập nhật trước đó; chạy lại truy vấn trên chỉ mục mới
+            self._apply_search()
+            self.invalidate("left", "right", "counter")
+            return
+        self.total_pages = self._page_count()
+        self.current_page = min(self.current_page, self.total_pages - 1)
+        self.invalidate("counter")
+        # Chỉ vẽ lại danh sách nếu manh mối nằm trên trang hiện tại hoặc trước đó
+        page = self.clues.page_of(clue_id, CLUES_PER_PAGE)
+        if page == -1 or page <= self.current_page:
+            self.invalidate("left")
+        if clue_id == self.selected_clue_index:
+            if event == "lock":
+                self.selected_clue_index = -1
+            self.invalidate("left", "right")
+
+    def _clue_at(self, mouse_pos):
+        """Hit-test bằng phép tính trên các dòng đang hiển thị (không duyệt rect)."""
+        x, y = mouse_pos
+        if not (self.CLUE_LIST_AREA_X <= x < self.CLUE_LIST_AREA_X + self.CLUE_LIST_AREA_WIDTH):
+            return -1
+        first_row_top = ((self.CLUE_LIST_AREA_Y + FIRST_LINE_OFFSET_Y) - TEXT_ABOVE_LINE_OFFSET
+                         - LINE_SPACING + (LINE_SPACING - self.fonts['list'].get_height()) // 2)
+        row = int((y - first_row_top) // LINE_SPACING)
+        if 0 <= row < len(self.visible_clue_ids) and y >= first_row_top:
+            return self.visible_clue_ids[row]
+        return -1
+
+    def _set_page(self, page):
+        if page != self.current_page:
+            self.current_page = page
+            self.selected_clue_index = -1
+            self.invalidate()
+
+    def _set_selection(self, index):
+        if index != self.selected_clue_index:
+            self.selected_clue_index = index
+            self.invalidate("left", "right")
 
     def _handle_input(self, event, mouse_pos):
         # ... (Giữ nguyên code) ...
@@ -200,208 +441,313 @@ class Notebook:
             self.running = False
         
         if self.is_open: 
+            self._sync_note()
+            if self._handle_note_event(event):
+                return
+
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:
                     if self.close_button_rect.collidepoint(mouse_pos):
                         self.close_notebook()
                         return 
+
+                    if self.note_editor.focused:
+                        self.note_editor.blur()
+                        self._sync_text_input()
+                    self._set_search_active(self.search_box_rect.collidepoint(mouse_pos))
+
+                    if self.selected_clue_index != -1 and self.notes_tab_rect.collidepoint(mouse_pos):
+                        self._set_right_mode("clue" if self.right_mode == "notes" else "notes")
+                        return
+
+                    link = self._link_at(mouse_pos)
+                    if link is not None:
+                        self.jump_to_clue(self._resolve_link(link))
+                        return
                     
                     if self.prev_page_rect.collidepoint(mouse_pos) and self.current_page > 0:
-                        self.current_page = max(0, self.current_page - 1)
-                        self.selected_clue_index = -1
+                        self._set_page(max(0, self.current_page - 1))
                     elif self.next_page_rect.collidepoint(mouse_pos) and self.current_page < self.total_pages - 1:
-                        self.current_page = min(self.total_pages - 1, self.current_page + 1)
-                        self.selected_clue_index = -1
+                        self._set_page(min(self.total_pages - 1, self.current_page + 1))
                     else:
-                        for rect_info in self.clue_list_rects:
-                            if rect_info and rect_info["rect"].collidepoint(mouse_pos):
-                                self.selected_clue_index = rect_info["original_index"]
-                                break
+                        clue_id = self._clue_at(mouse_pos)
+                        if clue_id != -1:
+                            self._set_selection(clue_id)
+
+            elif self.search_active:
+                if event.type == pygame.TEXTINPUT:
+                    self.set_search_query(self.search_query + event.text)
+                elif event.type == pygame.KEYDOWN:
+                    self._handle_search_key(event)
 
     def _update_logic(self):
-        # ... (Giữ nguyên code) ...
+        # Chỉ chọn 1 trong các frame màu đã tính sẵn, không render lại chữ
         if self.is_open: 
+            self._sync_note()
+            self._save_note()  # tối đa 1 lần mỗi frame; Casebook ghi cùng transaction với mở khóa
             time_in_cycle = pygame.time.get_ticks() % PULSE_CYCLE_MS
             t = time_in_cycle / PULSE_HALF_CYCLE
             if t > 1.0:
                 t = 2.0 - t 
-            self.current_pulse_color = lerp_color(COLOR_TEXT_BRIGHT, COLOR_TEXT_DIM, t)
+            self.current_pulse_frame = round(t * (PULSE_FRAMES - 1))
+            self.current_pulse_color = self._pulse_colors[self.current_pulse_frame]
 
-    def _draw_close_button(self, mouse_pos):
+    def _draw_close_button(self, surface, hovered=False):
         # ... (Giữ nguyên code) ...
-        button_color = COLOR_CLOSE_BUTTON
-        if self.close_button_rect.collidepoint(mouse_pos):
-            button_color = COLOR_CLOSE_BUTTON_HOVER
+        button_color = COLOR_CLOSE_BUTTON_HOVER if hovered else COLOR_CLOSE_BUTTON
         
-        pygame.draw.rect(self.screen, button_color, self.close_button_rect, 0)
-        pygame.draw.rect(self.screen, COLOR_BORDER, self.close_button_rect, 1) 
+        pygame.draw.rect(surface, button_color, self.close_button_rect, 0)
+        pygame.draw.rect(surface, COLOR_BORDER, self.close_button_rect, 1) 
 
         x_padding = 5
-        pygame.draw.line(self.screen, COLOR_BUTTON_TEXT,
+        pygame.draw.line(surface, COLOR_BUTTON_TEXT,
                          (self.close_button_rect.left + x_padding, self.close_button_rect.top + x_padding),
                          (self.close_button_rect.right - x_padding, self.close_button_rect.bottom - x_padding), 3)
-        pygame.draw.line(self.screen, COLOR_BUTTON_TEXT,
+        pygame.draw.line(surface, COLOR_BUTTON_TEXT,
                          (self.close_button_rect.left + x_padding, self.close_button_rect.bottom - x_padding),
                          (self.close_button_rect.right - x_padding, self.close_button_rect.top + x_padding), 3)
 
-    def _draw_open_notebook(self, mouse_pos):
-        """Vẽ toàn bộ cuốn sổ khi nó đang mở."""
-        
-        # 1. Vẽ nền sổ tay (đã được scale)
-        self.screen.blit(self.notebook_background_sprite, (self.BOOK_X, self.BOOK_Y))
-        
-        # 3. Vẽ dòng kẻ (Giữ lại, vì ta dùng sprite KHÔNG CÓ DÒNG KẺ)
-        for i in range(CLUES_PER_PAGE):
-            # Dòng kẻ trang trái
-            y_left = self.CLUE_LIST_AREA_Y + FIRST_LINE_OFFSET_Y + (i * LINE_SPACING)
-            pygame.draw.line(self.screen, COLOR_LINE, (self.CLUE_LIST_AREA_X, y_left), (self.CLUE_LIST_AREA_X + self.CLUE_LIST_AREA_WIDTH, y_left), 1)
-            # Dòng kẻ trang phải
-            y_right = self.INFO_DETAIL_AREA_Y + FIRST_LINE_OFFSET_Y + (i * LINE_SPACING)
-            pygame.draw.line(self.screen, COLOR_LINE, (self.INFO_DETAIL_AREA_X, y_right), (self.INFO_DETAIL_AREA_X + self.INFO_DETAIL_AREA_WIDTH, y_right), 1)
+    def _draw_page_arrows(self, surface, mouse_pos=None):
+        """Vẽ nút lật trang; nếu có mouse_pos thì chỉ vẽ nút đang được hover."""
+        if self.current_page > 0:
+            hovered = mouse_pos is not None and self.prev_page_rect.collidepoint(mouse_pos)
+            if mouse_pos is None or hovered:
+                prev_color = COLOR_BUTTON_HOVER if hovered else COLOR_BUTTON_TEXT
+                pygame.draw.polygon(surface, prev_color, [(self.prev_page_rect.right, self.prev_page_rect.top),
+                                                         (self.prev_page_rect.right, self.prev_page_rect.bottom),
+                                                         (self.prev_page_rect.left, self.prev_page_rect.centery)])
+        if self.current_page < self.total_pages - 1:
+            hovered = mouse_pos is not None and self.next_page_rect.collidepoint(mouse_pos)
+            if mouse_pos is None or hovered:
+                next_color = COLOR_BUTTON_HOVER if hovered else COLOR_BUTTON_TEXT
+                pygame.draw.polygon(surface, next_color, [(self.next_page_rect.left, self.next_page_rect.top),
+                                                         (self.next_page_rect.left, self.next_page_rect.bottom),
+                                                         (self.next_page_rect.right, self.next_page_rect.centery)])
 
+    def _render_list_row(self, number, name_text, color):
+        """Render số thứ tự + tên manh mối (đã cắt "...") thành 1 surface."""
+        font_list = self.fonts['list']
+        num_surf = render_text(font_list, f"{number}.", color)
+        max_name_width = self.CLUE_LIST_AREA_WIDTH - (num_surf.get_width() + 10)
+        if font_list.size(name_text)[0] > max_name_width:
+            truncated_text = name_text
+            while font_list.size(truncated_text + "...")[0] > max_name_width and len(truncated_text) > 0:
+                truncated_text = truncated_text[:-1]
+            name_text = truncated_text + "..."
+        name_surf = render_text(font_list, name_text, color)
+
+        row = pygame.Surface((num_surf.get_width() + 10 + name_surf.get_width(),
+                              max(num_surf.get_height(), name_surf.get_height())), pygame.SRCALPHA)
+        row.blit(num_surf, num_surf.get_rect(bottomleft=(0, row.get_height())))
+        row.blit(name_surf, name_surf.get_rect(bottomleft=(num_surf.get_width() + 10, row.get_height())))
+        return row
+
+    def _build_left_page(self):
+        """Trang trái: danh sách manh mối của trang hiện tại + vùng click."""
+        surf = pygame.Surface(self.book_size, pygame.SRCALPHA)
+        origin = (self.BOOK_X, self.BOOK_Y)
+        self._pulse_frames = []
 
-        # 4. Vẽ Danh sách Ghi chú (Giữ lại)
-        self.clue_list_rects.clear()
-        self.clue_list_rects = [None] * len(self.clues)
-        
-        unlocked_clues = []
-        for i, c in enumerate(self.clues):
-            if c["unlocked"]:
-                unlocked_clues.append({"clue_data": c, "original_index": i})
-        
-        self.total_pages = max(1, math.ceil(len(unlocked_clues) / CLUES_PER_PAGE))
-        
         start_index = self.current_page * CLUES_PER_PAGE
-        end_index = start_index + CLUES_PER_PAGE
-        clues_to_display = unlocked_clues[start_index:end_index]
-        
+        clues_to_display = self._page_ids(self.current_page)
+        self.visible_clue_ids = clues_to_display
+
         # <<< THAY ĐỔI: Trừ đi offset để chữ nằm trên dòng kẻ
         current_y_for_clue_list = (self.CLUE_LIST_AREA_Y + FIRST_LINE_OFFSET_Y) - TEXT_ABOVE_LINE_OFFSET
 
-        font_list = self.fonts['list']
-
-        for i, clue_info in enumerate(clues_to_display):
-            # ... (Toàn bộ code vẽ text clue list giữ nguyên) ...
-            clue = clue_info["clue_data"]
-            original_i = clue_info["original_index"]
+        for i, original_i in enumerate(clues_to_display):
+            clue = self.clues[original_i]
             visible_clue_count = start_index + i + 1
             is_selected = (original_i == self.selected_clue_index)
-            text_color = self.current_pulse_color if is_selected else COLOR_TEXT_BRIGHT
-            
-            num_text = f"{visible_clue_count}."
-            num_surf = font_list.render(num_text, True, text_color)
-            num_rect = num_surf.get_rect(bottomleft=(self.CLUE_LIST_AREA_X, current_y_for_clue_list))
-            
-            name_text = clue["name"]
-            max_name_width = (self.CLUE_LIST_AREA_X + self.CLUE_LIST_AREA_WIDTH) - (num_rect.right + 10)
-            name_surf = font_list.render(name_text, True, text_color)
-            if name_surf.get_width() > max_name_width:
-                truncated_text = name_text
-                while font_list.size(truncated_text + "...")[0] > max_name_width and len(truncated_text) > 0:
-                    truncated_text = truncated_text[:-1]
-                name_text = truncated_text + "..."
-                name_surf = font_list.render(name_text, True, text_color)
-            name_rect = name_surf.get_rect(bottomleft=(num_rect.right + 10, current_y_for_clue_list))
-            
-            self.screen.blit(num_surf, num_rect)
-            self.screen.blit(name_surf, name_rect)
-            
-            clickable_rect = pygame.Rect(self.CLUE_LIST_AREA_X,
-                                          current_y_for_clue_list - LINE_SPACING + (LINE_SPACING - font_list.get_height()) // 2,
-                                          self.CLUE_LIST_AREA_WIDTH,
-                                          LINE_SPACING)
-            self.clue_list_rects[original_i] = {"rect": clickable_rect, "original_index": original_i}
-            
+
+            row_rect = pygame.Rect(0, 0, 0, 0)
             if is_selected:
-                underline_y = current_y_for_clue_list + 1
-                start_pos = (num_rect.left, underline_y)
-                end_pos = (name_rect.right, underline_y)
-                pygame.draw.line(self.screen, COLOR_SELECT_LINE, start_pos, end_pos, 2)
-            
+                # Dòng được chọn: tính sẵn mỗi frame màu, vẽ đè lên cache mỗi frame
+                for color in self._pulse_colors:
+                    row = self._render_list_row(visible_clue_count, clue["name"], color)
+                    row_rect = row.get_rect(bottomleft=(self.CLUE_LIST_AREA_X, current_y_for_clue_list))
+                    self._pulse_frames.append((row, row_rect.topleft))
+                underline_y = current_y_for_clue_list + 1 - origin[1]
+                pygame.draw.line(surf, COLOR_SELECT_LINE,
+                                 (row_rect.left - origin[0], underline_y), (row_rect.right - origin[0], underline_y), 2)
+            else:
+                row = self._render_list_row(visible_clue_count, clue["name"], COLOR_TEXT_BRIGHT)
+                row_rect = row.get_rect(bottomleft=(self.CLUE_LIST_AREA_X, current_y_for_clue_list))
+                surf.blit(row, (row_rect.x - origin[0], row_rect.y - origin[1]))
+
             current_y_for_clue_list += LINE_SPACING
 
-        # 5. Vẽ Nút Lật Trang và Số Trang (Giữ lại)
-        if self.current_page > 0:
-            # ... (Giữ nguyên) ...
-            prev_color = COLOR_BUTTON_HOVER if self.prev_page_rect.collidepoint(mouse_pos) else COLOR_BUTTON_TEXT
-            pygame.draw.polygon(self.screen, prev_color, [(self.prev_page_rect.right, self.prev_page_rect.top),
-                                                         (self.prev_page_rect.right, self.prev_page_rect.bottom),
-                                                         (self.prev_page_rect.left, self.prev_page_rect.centery)])
-        if self.current_page < self.total_pages - 1:
-            # ... (Giữ nguyên) ...
-            next_color = COLOR_BUTTON_HOVER if self.next_page_rect.collidepoint(mouse_pos) else COLOR_BUTTON_TEXT
-            pygame.draw.polygon(self.screen, next_color, [(self.next_page_rect.left, self.next_page_rect.top),
-                                                         (self.next_page_rect.left, self.next_page_rect.bottom),
-                                                         (self.next_page_rect.right, self.next_page_rect.centery)])
-        
+        self._left_page_surf = surf
+
+    def _build_right_page(self):
+        """Trang phải: tiêu đề + mô tả của manh mối đang chọn (tự chọn cỡ chữ)."""
+        surf = pygame.Surface(self.book_size, pygame.SRCALPHA)
+        self._right_page_surf = surf
+        self._link_boxes = []
+        if self.selected_clue_index == -1 or not self.clues.is_unlocked(self.selected_clue_index):
+            return
+
+        # Vẽ với tọa độ màn hình rồi dịch về gốc của surface
+        origin_x, origin_y = self.BOOK_X, self.BOOK_Y
+        area_x = self.INFO_DETAIL_AREA_X - origin_x
+
+        self._draw_notes_tab(surf)
+
+        selected_clue = self.clues[self.selected_clue_index]
+        title_text = selected_clue["name"]
+
+        font_title_options = self.fonts['title_options']
+        font_title_sizes = sorted(font_title_options.keys(), reverse=True)
+        selected_title_font = font_title_options[font_title_sizes[-1]]
+        for size in font_title_sizes:
+            current_font = font_title_options[size]
+            if current_font.size(title_text)[0] <= self.INFO_DETAIL_AREA_WIDTH:
+                selected_title_font = current_font
+                break
+
+        if selected_title_font.size(title_text)[0] > self.INFO_DETAIL_AREA_WIDTH:
+            truncated_text = title_text
+            while selected_title_font.size(truncated_text + "...")[0] > self.INFO_DETAIL_AREA_WIDTH and len(truncated_text) > 0:
+                truncated_text = truncated_text[:-1]
+            title_text = truncated_text + "..."
+        title_surf = render_text(selected_title_font, title_text, COLOR_TEXT_BRIGHT)
+
+        # <<< THAY ĐỔI: Trừ đi offset để tiêu đề nằm trên dòng kẻ
+        title_rect = title_surf.get_rect(bottomleft=(area_x, self.INFO_DETAIL_AREA_Y + FIRST_LINE_OFFSET_Y - TEXT_ABOVE_LINE_OFFSET - origin_y))
+        surf.blit(title_surf, title_rect)
+
+        line_y = self.INFO_DETAIL_AREA_Y + FIRST_LINE_OFFSET_Y - origin_y
+        pygame.draw.line(surf, COLOR_TEXT_BRIGHT, (area_x, line_y), (area_x + self.INFO_DETAIL_AREA_WIDTH, line_y), 2)
+
+        if self.right_mode == "notes":
+            return  # note_editor được vẽ trực tiếp mỗi frame
+
+        desc_text = selected_clue["description"]
+        max_lines_available = 9
+
+        font_desc_options = self.fonts['desc_options']
+        font_desc_sizes = sorted(font_desc_options.keys(), reverse=True)
+        selected_desc_font = font_desc_options[font_desc_sizes[-1]]
+        rich = has_markup(desc_text)
+
+        for size in font_desc_sizes:
+            current_font = font_desc_options[size]
+            if rich:
+                fits = layout_rich_text(desc_text, current_font, self.INFO_DETAIL_AREA_WIDTH, LINE_SPACING).fits(max_lines_available)
+            else:
+                fits = check_text_fit(desc_text, current_font, self.INFO_DETAIL_AREA_WIDTH, max_lines_available, line_height_override=LINE_SPACING)
+            if fits:
+                selected_desc_font = current_font
+                break
+
+        # <<< THAY ĐỔI: Trừ đi offset để mô tả nằm trên dòng kẻ
+        desc_start_y = self.INFO_DETAIL_AREA_Y + FIRST_LINE_OFFSET_Y + (1 * LINE_SPACING) - TEXT_ABOVE_LINE_OFFSET
+        desc_end_y = self.INFO_DETAIL_AREA_Y + FIRST_LINE_OFFSET_Y + ((CLUES_PER_PAGE - 1) * LINE_SPACING)
+        desc_area_rect = pygame.Rect(area_x,
+                                     desc_start_y - origin_y,
+                                     self.INFO_DETAIL_AREA_WIDTH,
+                                     desc_end_y - desc_start_y + LINE_SPACING)
+        if rich:
+            # Layout (kể cả hộp click của link) được cache; chỉ dịch hộp về tọa độ màn hình
+            layout = layout_rich_text(desc_text, selected_desc_font, self.INFO_DETAIL_AREA_WIDTH, LINE_SPACING)
+            boxes = layout.draw(surf, COLOR_TEXT_BRIGHT, desc_area_rect, link_color=COLOR_BUTTON_HOVER)
+            self._link_boxes = [(box.move(origin_x, origin_y), target) for box, target in boxes]
+        else:
+            draw_text(surf, desc_text, selected_desc_font, COLOR_TEXT_BRIGHT, desc_area_rect, line_height_override=LINE_SPACING)
+
+    def _draw_notes_tab(self, surf):
+        """Nút chuyển giữa mô tả manh mối và ghi chú (vẽ vào cache trang phải)."""
+        rect = self.notes_tab_rect.move(-self.BOOK_X, -self.BOOK_Y)
+        pygame.draw.rect(surf, COLOR_SEARCH_BOX, rect, 0)
+        pygame.draw.rect(surf, COLOR_LINE, rect, 2)
+        label = "Clue" if self.right_mode == "notes" else "Notes"
+        label_surf = render_text(self.fonts['page_count'], label, COLOR_TEXT_BRIGHT)
+        surf.blit(label_surf, label_surf.get_rect(center=rect.center))
+
+    def _build_page_count(self):
         page_text = f"Page {self.current_page + 1} / {self.total_pages}"
-        page_surf = self.fonts['page_count'].render(page_text, True, COLOR_TEXT_DIM)
+        self._page_count_surf = render_text(self.fonts['page_count'], page_text, COLOR_TEXT_DIM)
         # Căn giữa trang phải
-        page_rect = page_surf.get_rect(midbottom=(self.INFO_DETAIL_AREA_X + (self.INFO_DETAIL_AREA_WIDTH / 2), self.page_count_y))
-        self.screen.blit(page_surf, page_rect)
-
-
-        # 6. Vẽ Hộp Thông tin (Giữ lại)
-        if self.selected_clue_index != -1 and self.clues[self.selected_clue_index]["unlocked"]:
-            # ... (Toàn bộ code vẽ text info giữ nguyên) ...
-            selected_clue = self.clues[self.selected_clue_index]
-            title_text = selected_clue["name"]
-            
-            font_title_options = self.fonts['title_options']
-            font_title_sizes = sorted(font_title_options.keys(), reverse=True)
-            selected_title_font = font_title_options[font_title_sizes[-1]]
-            title_surf = None
-            
-            for size in font_title_sizes:
-                current_font = font_title_options[size]
-                title_surf = current_font.render(title_text, True, COLOR_TEXT_BRIGHT)
-                if title_surf.get_width() <= self.INFO_DETAIL_AREA_WIDTH:
-                    selected_title_font = current_font
-                    break
-            
-            if title_surf.get_width() > self.INFO_DETAIL_AREA_WIDTH:
-                 truncated_text = title_text
-                 while selected_title_font.size(truncated_text + "...")[0] > self.INFO_DETAIL_AREA_WIDTH and len(truncated_text) > 0:
-                     truncated_text = truncated_text[:-1]
-                 title_text = truncated_text + "..."
-                 title_surf = selected_title_font.render(title_text, True, COLOR_TEXT_BRIGHT)
-
-            # <<< THAY ĐỔI: Trừ đi offset để tiêu đề nằm trên dòng kẻ
-            title_rect = title_surf.get_rect(bottomleft=(self.INFO_DETAIL_AREA_X, self.INFO_DETAIL_AREA_Y + FIRST_LINE_OFFSET_Y - TEXT_ABOVE_LINE_OFFSET))
-            self.screen.blit(title_surf, title_rect)
-            
-            line_y = self.INFO_DETAIL_AREA_Y + FIRST_LINE_OFFSET_Y
-            pygame.draw.line(self.screen, COLOR_TEXT_BRIGHT, (self.INFO_DETAIL_AREA_X, line_y), (self.INFO_DETAIL_AREA_X + self.INFO_DETAIL_AREA_WIDTH, line_y), 2)
-            
-            desc_text = selected_clue["description"]
-            max_lines_available = 9
-            
-            font_desc_options = self.fonts['desc_options']
-            font_desc_sizes = sorted(font_desc_options.keys(), reverse=True)
-            selected_desc_font = font_desc_options[font_desc_sizes[-1]]
-            
-            for size in font_desc_sizes:
-                current_font = font_desc_options[size]
-                if check_text_fit(desc_text, current_font, self.INFO_DETAIL_AREA_WIDTH, max_lines_available, line_height_override=LINE_SPACING):
-                    selected_desc_font = current_font
-                    break
-            
-            # <<< THAY ĐỔI: Trừ đi offset để mô tả nằm trên dòng kẻ
-            desc_start_y = self.INFO_DETAIL_AREA_Y + FIRST_LINE_OFFSET_Y + (1 * LINE_SPACING) - TEXT_ABOVE_LINE_OFFSET
-            desc_end_y = self.INFO_DETAIL_AREA_Y + FIRST_LINE_OFFSET_Y + ((CLUES_PER_PAGE - 1) * LINE_SPACING)
-            desc_area_rect = pygame.Rect(self.INFO_DETAIL_AREA_X,
-                                         desc_start_y,
-                                         self.INFO_DETAIL_AREA_WIDTH,
-                                         desc_end_y - desc_start_y + LINE_SPACING)
-            draw_text(self.screen, desc_text, selected_desc_font, COLOR_TEXT_BRIGHT, desc_area_rect, line_height_override=LINE_SPACING)
-
-        # Vẽ nút đóng sổ (Giữ lại)
-        self._draw_close_button(mouse_pos)
+        self._page_count_rect = self._page_count_surf.get_rect(midbottom=(self.INFO_DETAIL_AREA_X + (self.INFO_DETAIL_AREA_WIDTH / 2), self.page_count_y))
+
+    def _build_search_box(self):
+        """Ô tìm kiếm: nền + chữ đã nhập (hoặc gợi ý) + số kết quả."""
+        rect = self.search_box_rect
+        surf = pygame.Surface(rect.size, pygame.SRCALPHA)
+        surf.fill(COLOR_SEARCH_BOX_ACTIVE if self.search_active else COLOR_SEARCH_BOX)
+        pygame.draw.rect(surf, COLOR_BORDER if self.search_active else COLOR_LINE, surf.get_rect(), 2)
+
+        font = self.fonts.get('search', self.fonts['page_count'])
+        padding = 8
+        if self.search_results is not None:
+            count_surf = render_text(font, str(len(self.search_results)), COLOR_SEARCH_PLACEHOLDER)
+            surf.blit(count_surf, count_surf.get_rect(midright=(rect.width - padding, rect.height // 2)))
+        if self.search_query:
+            text_surf = render_text(font, self.search_query, COLOR_TEXT_BRIGHT)
+        else:
+            text_surf = render_text(font, "Search...", COLOR_SEARCH_PLACEHOLDER)
+        text_rect = text_surf.get_rect(midleft=(padding, rect.height // 2))
+        # Giữ phần cuối của chữ khi dài hơn ô
+        max_width = rect.width - 2 * padding - 40
+        area = pygame.Rect(max(0, text_rect.width - max_width), 0, max_width, text_rect.height)
+        surf.blit(text_surf, text_rect.topleft, area)
+
+        self._search_caret_x = rect.left + padding + (min(text_rect.width, max_width) if self.search_query else 0)
+        self._search_surf = surf
+
+    def _rebuild_cache(self):
+        """Vẽ lại các phần bị đánh dấu rồi ghép lại thành 1 frame tĩnh."""
+        if "left" in self._dirty_parts:
+            self._build_left_page()
+        if "right" in self._dirty_parts:
+            self._build_right_page()
+        if "counter" in self._dirty_parts:
+            self._build_page_count()
+        if "search" in self._dirty_parts:
+            self._build_search_box()
+        self._dirty_parts.clear()
+
+        if self._frame_surf is None:
+            self._frame_surf = self._base_surf.copy()
+        else:
+            self._frame_surf.blit(self._base_surf, (0, 0))
+        self._frame_surf.blit(self._left_page_surf, (self.BOOK_X, self.BOOK_Y))
+        self._frame_surf.blit(self._right_page_surf, (self.BOOK_X, self.BOOK_Y))
+        self._frame_surf.blit(self._page_count_surf, self._page_count_rect)
+        self._frame_surf.blit(self._search_surf, self.search_box_rect)
+        self._draw_page_arrows(self._frame_surf)
+        self._draw_close_button(self._frame_surf)
+
+    def _draw_open_notebook(self, mouse_pos):
+        """Vẽ toàn bộ cuốn sổ khi nó đang mở (sổ tĩnh = 1 lần blit)."""
+        if self._dirty_parts:
+            self._rebuild_cache()
+        self.screen.blit(self._frame_surf, (0, 0))
+
+        # Dòng đang chọn: frame màu tính sẵn
+        if self._pulse_frames:
+            row, pos = self._pulse_frames[self.current_pulse_frame]
+            self.screen.blit(row, pos)
+
+        if self.right_mode == "notes" and self.selected_clue_index != -1:
+            self.note_editor.draw(self.screen)
+
+        # Con trỏ nhấp nháy trong ô tìm kiếm
+        if self.search_active and pygame.time.get_ticks() % PULSE_CYCLE_MS < PULSE_HALF_CYCLE:
+            caret_top = self.search_box_rect.top + 7
+            pygame.draw.line(self.screen, COLOR_TEXT_BRIGHT, (self._search_caret_x, caret_top),
+                             (self._search_caret_x, self.search_box_rect.bottom - 8), 2)
+
+        # Trạng thái hover chỉ được vẽ đè khi chuột nằm trên nút
+        self._draw_page_arrows(self.screen, mouse_pos)
+        if self.close_button_rect.collidepoint(mouse_pos):
+            self._draw_close_button(self.screen, hovered=True)
 
     def draw(self, mouse_pos):
-        self.screen.fill(COLOR_DARK_COVER) # Luôn vẽ nền tối
         if self.is_open:
             self._draw_open_notebook(mouse_pos)
+        else:
+            self.screen.fill(COLOR_DARK_COVER) # Luôn vẽ nền tối
 
     def handle_event(self, event, mouse_pos):
         self._handle_input(event, mouse_pos)
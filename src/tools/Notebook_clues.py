@@ -9,7 +9,7 @@ clues = [
     },
     {
         "name": "Murder Weapon",
-        "description": "A fruit knife, found 20m from the scene, with partial fingerprints. The knife is old and rusty. It does not belong to the victim.",
+        "description": "A *fruit knife*, found 20m from the scene, with partial {red:fingerprints}. The knife is old and rusty. It does not belong to the victim.",
         "unlocked": True
     },
     {
@@ -28,11 +28,11 @@ clues = [
     },
     {
         "name": "Anonymous Note", "unlocked": True,
-        "description": "A small note was found under the desk with threatening content. Handwritten in pencil. It mentions a past dealing that went sour, indicating a revenge motive. The handwriting is being analyzed."
+        "description": "A small note was found under the desk with threatening content. Handwritten in pencil. It mentions a past dealing that went sour, indicating a revenge [[Motive|motive]]. The handwriting is being analyzed."
     },
     {
         "name": "Motive", "unlocked": True,
-        "description": "The victim had many disputes with business rivals, and also had several large debts. There are also rumors of a secret affair, which could also be a strong motive. Investigations are ongoing."
+        "description": "The victim had many disputes with business rivals, and also had several large debts. There are also rumors of a **secret affair**, which could also be a strong motive. Investigations are ongoing."
     },
     {
         "name": "Hidden Camera Footage", "unlocked": False,
@@ -40,7 +40,7 @@ clues = [
     },
     {
         "name": "Old Diary Entry", "unlocked": True,
-        "description": "An old diary belonging to the victim mentions a deep secret involving a former business partner who had threatened him recently. This provides a clear suspect."
+        "description": "An old diary belonging to the victim mentions a deep secret involving a former business partner who had threatened him recently (see [[Phone Records]]). This provides a clear suspect."
     },
     {
         "name": "Witness Sighting", "unlocked": False,
@@ -48,11 +48,11 @@ clues = [
     },
     {
         "name": "Phone Records", "unlocked": True,
-        "description": "The victim's phone records show a series of calls to an unknown number shortly before his death. The last call was very brief, possibly a warning or a final threat."
+        "description": "The victim's phone records show a series of calls to an {red:unknown number} shortly before his death. The last call was very brief, possibly a warning or a final threat."
     },
     {
         "name": "Financial Transactions", "unlocked": True,
-        "description": "Recent large and suspicious financial transactions were found in the victim's bank account, totaling over a million dollars, with transfers to offshore accounts."
+        "description": "Recent large and suspicious financial transactions were found in the victim's bank account, totaling **over a million dollars**, with transfers to {gold:offshore accounts}. See [[Motive]]."
     },
     { "name": "Clue 11 (New)", "description": "This is the 11th unlocked clue.", "unlocked": True },
     { "name": "Clue 12 (New)", "description": "This is the 12th unlocked clue.", "unlocked": True },
@@ -0,0 +1,266 @@
+# file: benchmark.py
+# Đo cách check_collision, prevent_collision, draw_with_player và update tăng
+# theo lượng nội dung, trên các scene tổng hợp (scenes/stress_scene.py).
+#
+#   python src/tools/benchmark.py                          # 10 .. 50.000, random + clustered
+#   python src/tools/benchmark.py --counts 10,1000 --walls diagonal --pixel-collision
+#   python src/tools/benchmark.py --world 5120x2880     # thế giới cuộn, vẽ theo viewport
+#
+# Kết quả: bảng trên stdout, CSV và biểu đồ log-log (PNG, vẽ bằng pygame) trong
+# saves/benchmarks.
+import argparse
+import csv
+import math
+import os
+import random
+import sys
+import time
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_ROOT = os.path.dirname(SRC_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import pygame
+
+from src.scenes.stress_scene import StressScene, LAYOUTS, WALL_STYLES
+from src.utils.font_registry import fonts
+
+SCREEN_SIZE = (1280, 720)
+DEFAULT_COUNTS = (10, 100, 1000, 10000, 50000)
+DEFAULT_OUT_DIR = os.path.join("saves", "benchmarks")
+OPERATIONS = ("check_collision", "prevent_collision", "draw_with_player", "update")
+TIME_BUDGET = 0.25    # giây đo cho mỗi phép đo
+MAX_CALLS = 20000
+PLAYER_SIZE = (64, 96)
+LAYOUT_COLORS = {"random": (80, 200, 255), "clustered": (255, 160, 60)}
+
+
+class BenchPlayer:
+    """Player tối giản (rect + draw) để không phải nạp sprite sheet."""
+
+    def __init__(self) -> None:
+        self.x, self.y = 0.0, 0.0
+        self.rect = pygame.Rect((0, 0), PLAYER_SIZE)
+        self.image = pygame.Surface(PLAYER_SIZE)
+        self.image.fill((230, 230, 230))
+
+    def move_to(self, x: int, y: int) -> None:
+        self.x, self.y = x, y
+        self.rect.topleft = (x, y)
+
+    def draw(self, screen: pygame.Surface, offset=(0, 0)) -> None:
+        screen.blit(self.image, self.rect.move(-offset[0], -offset[1]))
+
+
+def quiet(function, *args, **kwargs):
+    """Gọi hàm với stdout bị ẩn (log lúc dựng scene)."""
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        return function(*args, **kwargs)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+
+def measure(run, setups):
+    """Gọi run(setup) lần lượt trên `setups` tới khi hết TIME_BUDGET. Trả về (µs / lần, số lần)."""
+    calls = 0
+    started = time.perf_counter()
+    elapsed = 0.0
+    while calls < len(setups) and elapsed < TIME_BUDGET:
+        run(setups[calls])
+        calls += 1
+        elapsed = time.perf_counter() - started
+    return elapsed * 1e6 / max(calls, 1), calls
+
+
+def bench_scene(scene: StressScene, rng: random.Random) -> dict:
+    """Thời gian trung bình (µs) của từng thao tác trên một scene."""
+    width, height = scene.world_width - PLAYER_SIZE[0], scene.world_height - PLAYER_SIZE[1]
+    points = [(rng.randrange(width), rng.randrange(height)) for _ in range(MAX_CALLS)]
+    player = BenchPlayer()
+    scene.player = player
+    screen = pygame.Surface(SCREEN_SIZE)
+    rect = pygame.Rect((0, 0), PLAYER_SIZE)
+    results = {}
+
+    # Dựng sẵn broadphase / trigger index / render queue / distance field (không tính vào phép đo)
+    scene.check_collision(rect)
+    quiet(scene.get_distance_field)
+    scene.update()
+    scene.draw_with_player(screen, player)
+
+    def check(point):
+        rect.topleft = point
+        scene.check_collision(rect)
+    results["check_collision"] = measure(check, points)
+
+    def prevent(point):
+        rect.topleft = point
+        scene.prevent_collision(rect, point[0] - 4, point[1] - 3)
+    results["prevent_collision"] = measure(prevent, points)
+
+    def draw(point):
+        player.move_to(*point)
+        scene.camera.center_on(player.rect)
+        scene.draw_with_player(screen, player)
+    results["draw_with_player"] = measure(draw, points)
+
+    def update(point):
+        player.move_to(*point)
+        scene.update()
+    results["update"] = measure(update, points)
+    return results
+
+
+def run(counts, layouts, walls, pixel_collision, seed, world_size=None):
+    """Chạy toàn bộ lưới tham số; trả về các dòng (layout, count, operation, µs, calls, build_ms)."""
+    rows = []
+    for layout in layouts:
+        for count in counts:
+            started = time.perf_counter()
+            scene = quiet(StressScene, *SCREEN_SIZE, obstacles=count, npcs=count, collectibles=count,
+                          areas=count, layout=layout, walls=walls, pixel_collision=pixel_collision, seed=seed,
+                          world_size=world_size)
+            build_ms = (time.perf_counter() - started) * 1000
+            results = quiet(bench_scene, scene, random.Random(seed))
+            line = [f"{layout:>9} {count:>6}", f"build {build_ms:7.0f} ms"]
+            for operation in OPERATIONS:
+                micros, calls = results[operation]
+                rows.append((layout, count, operation, micros, calls, build_ms))
+                line.append(f"{operation} {micros:9.1f} µs")
+            print(" | ".join(line))
+    return rows
+
+
+def write_csv(rows, path: str) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(("layout", "count", "operation", "mean_us", "calls", "build_ms"))
+        for layout, count, operation, micros, calls, build_ms in rows:
+            writer.writerow((layout, count, operation, f"{micros:.2f}", calls, f"{build_ms:.1f}"))
+
+
+# --- Biểu đồ ---
+
+def _log_ticks(low: float, high: float):
+    return [10 ** e for e in range(math.floor(math.log10(low)), math.ceil(math.log10(high)) + 1)]
+
+
+def _format_tick(value: float) -> str:
+    if value >= 1000000:
+        return f"{value / 1000000:g}M"
+    if value >= 1000:
+        return f"{value / 1000:g}k"
+    return f"{value:g}"
+
+
+def draw_panel(surface: pygame.Surface, area: pygame.Rect, operation: str, rows, font) -> None:
+    """Một ô biểu đồ log-log: số vật thể -> µs, mỗi bố cục một đường."""
+    points = [(count, micros, layout) for layout, count, op, micros, _, _ in rows if op == operation and micros > 0]
+    pygame.draw.rect(surface, (30, 32, 36), area)
+    surface.blit(font.render(f"{operation} (µs)", True, (235, 235, 235)), (area.x + 10, area.y + 6))
+    if not points:
+        return
+    plot = pygame.Rect(area.x + 60, area.y + 30, area.width - 80, area.height - 60)
+    counts = [p[0] for p in points]
+    times = [p[1] for p in points]
+    x_ticks = _log_ticks(min(counts), max(counts))
+    y_ticks = _log_ticks(min(times), max(times))
+    x_low, x_high = math.log10(x_ticks[0]), math.log10(x_ticks[-1])
+    y_low, y_high = math.log10(y_ticks[0]), math.log10(y_ticks[-1])
+
+    def to_screen(count, micros):
+        tx = (math.log10(count) - x_low) / ((x_high - x_low) or 1)
+        ty = (math.log10(micros) - y_low) / ((y_high - y_low) or 1)
+        return plot.x + tx * plot.width, plot.bottom - ty * plot.height
+
+    for tick in x_ticks:
+        x, _ = to_screen(tick, y_ticks[0])
+        pygame.draw.line(surface, (60, 64, 70), (x, plot.top), (x, plot.bottom))
+        label = font.render(_format_tick(tick), True, (170, 170, 170))
+        surface.blit(label, (x - label.get_width() // 2, plot.bottom + 4))
+    for tick in y_ticks:
+        _, y = to_screen(x_ticks[0], tick)
+        pygame.draw.line(surface, (60, 64, 70), (plot.left, y), (plot.right, y))
+        label = font.render(_format_tick(tick), True, (170, 170, 170))
+        surface.blit(label, (plot.left - label.get_width() - 6, y - label.get_height() // 2))
+    pygame.draw.rect(surface, (120, 120, 120), plot, 1)
+
+    for index, layout in enumerate(LAYOUTS):
+        series = sorted((c, m) for c, m, l in points if l == layout)
+        if not series:
+            continue
+        color = LAYOUT_COLORS.get(layout, (255, 255, 255))
+        coords = [to_screen(c, m) for c, m in series]
+        if len(coords) > 1:
+            pygame.draw.lines(surface, color, False, coords, 2)
+        for x, y in coords:
+            pygame.draw.circle(surface, color, (int(x), int(y)), 3)
+        surface.blit(font.render(layout, True, color), (plot.right - 90, plot.top + 6 + 16 * index))
+
+
+def plot(rows, path: str, title: str) -> None:
+    """Lưới 2x2 biểu đồ (một ô mỗi thao tác), lưu thành PNG."""
+    width, height = 1200, 820
+    surface = pygame.Surface((width, height))
+    surface.fill((18, 19, 22))
+    font = fonts.font(None, 20)
+    surface.blit(fonts.font(None, 28).render(title, True, (255, 255, 255)), (16, 10))
+    panel_w, panel_h = (width - 48) // 2, (height - 72) // 2
+    for i, operation in enumerate(OPERATIONS):
+        area = pygame.Rect(16 + (i % 2) * (panel_w + 16), 48 + (i // 2) * (panel_h + 12), panel_w, panel_h)
+        draw_panel(surface, area, operation, rows, font)
+    pygame.image.save(surface, path)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Scaling benchmark of BaseScene on synthetic stress scenes.")
+    parser.add_argument("--counts", default=",".join(map(str, DEFAULT_COUNTS)),
+                        help="comma-separated object counts (each of obstacles, NPCs, collectibles, areas)")
+    parser.add_argument("--layouts", default=",".join(LAYOUTS), help=f"comma-separated, from {LAYOUTS}")
+    parser.add_argument("--walls", default="rooms", choices=WALL_STYLES)
+    parser.add_argument("--pixel-collision", action="store_true", help="obstacles collide by footprint mask")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--world", default=None, help="world size WxH (default: the screen size)")
+    parser.add_argument("--out", default=DEFAULT_OUT_DIR, help="output directory (relative to src/)")
+    args = parser.parse_args(argv)
+
+    counts = [int(c) for c in args.counts.split(",") if c.strip()]
+    layouts = [l.strip() for l in args.layouts.split(",") if l.strip()]
+    for layout in layouts:
+        if layout not in LAYOUTS:
+            parser.error(f"unknown layout {layout!r}")
+    world_size = None
+    if args.world:
+        try:
+            world_size = tuple(int(v) for v in args.world.lower().split("x"))
+        except ValueError:
+            world_size = ()
+        if len(world_size) != 2:
+            parser.error(f"--world must look like 5120x2880, got {args.world!r}")
+
+    os.chdir(SRC_DIR)  # đường dẫn asset (font) tương đối với src/, như khi chạy game
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode(SCREEN_SIZE)
+
+    rows = run(counts, layouts, args.walls, args.pixel_collision, args.seed, world_size)
+
+    os.makedirs(args.out, exist_ok=True)
+    name = f"stress-{args.walls}{'-mask' if args.pixel_collision else ''}{'-' + args.world if args.world else ''}"
+    csv_path = os.path.join(args.out, f"{name}.csv")
+    png_path = os.path.join(args.out, f"{name}.png")
+    write_csv(rows, csv_path)
+    plot(rows, png_path, f"BaseScene scaling - walls: {args.walls}, "
+                         f"{'footprint masks' if args.pixel_collision else 'solid rects'}"
+                         f"{', world ' + args.world if args.world else ''}")
+    print(f"✅ {csv_path}\n✅ {png_path}")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
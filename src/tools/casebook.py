@@ -0,0 +1,443 @@
+# file: casebook.py
+import importlib
+import os
+import sqlite3
+from bisect import insort
+from collections import OrderedDict
+
+from .clue_store import ClueStore
+from .Inventory_Item import Item, DEFAULT_CASE, item_case_ids, item_file, load_item_file
+
+DEFAULT_DB_PATH = os.path.join("saves", "casebook.db")
+SCHEMA_VERSION = 3
+
+# Manh mối gốc có id = vị trí trong Notebook_clues; manh mối thêm lúc chơi
+# (add_clue) lấy id từ đây trở lên, để việc nhập lại nội dung không ghi đè chúng
+RUNTIME_CLUE_BASE = 1 << 20
+
+# Nguồn nội dung gốc (chỉ được import lại khi file thay đổi):
+# manh mối trong Notebook_clues.py, vật phẩm trong assets/data/items/<case>.json
+_CLUES_MODULE = "src.tools.Notebook_clues"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS clues (
+    id               INTEGER PRIMARY KEY,
+    name             TEXT NOT NULL,
+    description      TEXT NOT NULL,
+    unlocked_default INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS clues_name ON clues (name COLLATE NOCASE);
+CREATE TABLE IF NOT EXISTS items (
+    code        TEXT PRIMARY KEY,
+    position    INTEGER NOT NULL,
+    name        TEXT NOT NULL,
+    description TEXT NOT NULL,
+    icon_id     INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS case_clues (
+    case_id TEXT NOT NULL,
+    clue_id INTEGER NOT NULL REFERENCES clues(id),
+    PRIMARY KEY (case_id, clue_id)
+);
+CREATE TABLE IF NOT EXISTS case_items (
+    case_id   TEXT NOT NULL,
+    item_code TEXT NOT NULL REFERENCES items(code),
+    starting  INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (case_id, item_code)
+);
+CREATE TABLE IF NOT EXISTS clue_unlocks (
+    clue_id  INTEGER PRIMARY KEY REFERENCES clues(id),
+    unlocked INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS clue_notes (
+    clue_id INTEGER PRIMARY KEY REFERENCES clues(id),
+    text    TEXT NOT NULL
+);
+"""
+
+# Giới hạn số tham số "?" trong một câu IN (...) của SQLite
+_MAX_PARAMS = 900
+
+
+def _content_files():
+    base = os.path.dirname(os.path.abspath(__file__))
+    return [os.path.join(base, "Notebook_clues.py")] + [item_file(case_id) for case_id in item_case_ids()]
+
+
+def _content_signature():
+    parts = [str(SCHEMA_VERSION)]
+    for path in _content_files():
+        name = os.path.basename(path)
+        try:
+            st = os.stat(path)
+            parts.append(f"{name}:{st.st_mtime_ns}:{st.st_size}")
+        except OSError:
+            parts.append(f"{name}:missing")
+    return "|".join(parts)
+
+
+def _chunks(seq, size=_MAX_PARAMS):
+    for start in range(0, len(seq), size):
+        yield seq[start:start + size]
+
+
+class Casebook:
+    """
+    Kho nội dung vụ án (manh mối, vật phẩm) và tiến trình mở khóa trên SQLite.
+
+    Nội dung chỉ được nhập từ Notebook_clues / file vật phẩm khi file nguồn thay
+    đổi; các lần khởi động sau chỉ mở file .db. Notebook và Inventory đọc từng
+    trang dòng theo id, không giữ toàn bộ nội dung trong bộ nhớ.
+
+    Thay đổi trạng thái mở khóa và ghi chú được gom lại và ghi trong một
+    transaction khi gọi flush() (Game gọi 1 lần mỗi frame).
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        """
+        Args:
+            path: Đường dẫn file .db (":memory:" cho kho tạm thời)
+        """
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        self._migrate()
+        self._pending_unlocks = {}  # clue_id -> 0/1, chờ flush()
+        self._pending_notes = {}  # clue_id -> text, chờ flush()
+        self._seed_if_stale()
+
+    def _migrate(self):
+        """Nâng cấp file .db tạo bởi phiên bản schema cũ."""
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(case_items)")}
+        if "starting" not in columns:  # schema 1
+            with self.conn:
+                self.conn.execute("ALTER TABLE case_items ADD COLUMN starting INTEGER NOT NULL DEFAULT 1")
+
+    # --- Nhập nội dung ---
+
+    def _seed_if_stale(self):
+        signature = _content_signature()
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'content'").fetchone()
+        if row and row[0] == signature:
+            return
+        clues = importlib.import_module(_CLUES_MODULE).clues
+        self.import_content(clues, load_item_file(DEFAULT_CASE))
+        item_count = len(self.item_codes(DEFAULT_CASE))
+        for case_id in item_case_ids():
+            if case_id != DEFAULT_CASE:
+                item_count += self.import_items(load_item_file(case_id), case_id)
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('content', ?)", (signature,))
+        print(f"✅ Casebook imported: {len(clues)} clues, {item_count} items")
+
+    def import_content(self, clues, items, case_id=DEFAULT_CASE):
+        """
+        Ghi đè nội dung của một vụ án. Trạng thái mở khóa đã lưu được giữ lại;
+        manh mối mới nhận trạng thái mặc định ("unlocked" trong dữ liệu gốc).
+        Manh mối đã bị xóa khỏi nguồn bị xóa cùng trạng thái và ghi chú của
+        chúng; manh mối thêm lúc chơi (id >= RUNTIME_CLUE_BASE) không bị đụng tới.
+        `items` là các entry dict của file vật phẩm (hoặc Item).
+        """
+        stale = (len(clues), RUNTIME_CLUE_BASE)
+        with self.conn:
+            for table in ("case_clues", "clue_unlocks", "clue_notes"):
+                self.conn.execute(f"DELETE FROM {table} WHERE clue_id >= ? AND clue_id < ?", stale)
+            self.conn.execute("DELETE FROM clues WHERE id >= ? AND id < ?", stale)
+            self.conn.execute("DELETE FROM case_clues WHERE case_id = ? AND clue_id < ?",
+                              (case_id, RUNTIME_CLUE_BASE))
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO clues (id, name, description, unlocked_default) VALUES (?, ?, ?, ?)",
+                ((i, c["name"], c["description"], int(bool(c.get("unlocked")))) for i, c in enumerate(clues)))
+            self.conn.executemany("INSERT INTO case_clues (case_id, clue_id) VALUES (?, ?)",
+                                  ((case_id, i) for i in range(len(clues))))
+            self.conn.execute("INSERT OR IGNORE INTO clue_unlocks (clue_id, unlocked) "
+                              "SELECT id, unlocked_default FROM clues")
+        self.import_items(items, case_id)
+
+    def import_items(self, items, case_id=DEFAULT_CASE):
+        """Ghi đè danh sách vật phẩm của một vụ án; trả về số vật phẩm."""
+        rows = []
+        starting = []
+        for i, entry in enumerate(items):
+            if isinstance(entry, Item):
+                rows.append((entry.code, i, entry.name, entry.description, entry.icon_id))
+                starting.append(1)
+            else:
+                rows.append((entry["code"], i, entry["name"], entry.get("description", ""), entry["icon_id"]))
+                starting.append(int(bool(entry.get("starting", True))))
+        with self.conn:
+            self.conn.execute("DELETE FROM case_items WHERE case_id = ?", (case_id,))
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO items (code, position, name, description, icon_id) VALUES (?, ?, ?, ?, ?)",
+                rows)
+            self.conn.executemany("INSERT OR IGNORE INTO case_items (case_id, item_code, starting) VALUES (?, ?, ?)",
+                                  ((case_id, row[0], flag) for row, flag in zip(rows, starting)))
+        return len(rows)
+
+    def reset_progress(self):
+        """
+        Ván chơi mới: mọi manh mối về trạng thái mở khóa mặc định, xóa ghi chú
+        và các manh mối được thêm lúc chơi.
+        """
+        self._pending_unlocks.clear()
+        self._pending_notes.clear()
+        with self.conn:
+            self.conn.execute("DELETE FROM clue_notes")
+            self.conn.execute("DELETE FROM case_clues WHERE clue_id >= ?", (RUNTIME_CLUE_BASE,))
+            self.conn.execute("DELETE FROM clues WHERE id >= ?", (RUNTIME_CLUE_BASE,))
+            self.conn.execute("DELETE FROM clue_unlocks")
+            self.conn.execute("INSERT INTO clue_unlocks (clue_id, unlocked) SELECT id, unlocked_default FROM clues")
+
+    # --- Manh mối ---
+
+    def clue_ids(self, case_id=None):
+        if case_id is None:
+            rows = self.conn.execute("SELECT id FROM clues ORDER BY id")
+        else:
+            rows = self.conn.execute("SELECT clue_id FROM case_clues WHERE case_id = ? ORDER BY clue_id", (case_id,))
+        return [r[0] for r in rows]
+
+    def unlocked_clue_ids(self, case_id=None):
+        """Id các manh mối đã mở khóa (theo thứ tự), kể cả thay đổi chưa flush."""
+        if case_id is None:
+            rows = self.conn.execute("SELECT clue_id FROM clue_unlocks WHERE unlocked = 1 ORDER BY clue_id")
+        else:
+            rows = self.conn.execute(
+                "SELECT u.clue_id FROM clue_unlocks u JOIN case_clues c ON c.clue_id = u.clue_id "
+                "WHERE c.case_id = ? AND u.unlocked = 1 ORDER BY u.clue_id", (case_id,))
+        ids = {r[0] for r in rows}
+        for clue_id, unlocked in self._pending_unlocks.items():
+            if unlocked:
+                ids.add(clue_id)
+            else:
+                ids.discard(clue_id)
+        return sorted(ids)
+
+    def fetch_clues(self, ids):
+        """
+        Đọc các dòng manh mối theo id; trả về dict id -> {"name", "description",
+        "unlocked"} (giống dict của ClueStore, kể cả thay đổi chưa flush).
+        """
+        result = {}
+        for chunk in _chunks(list(ids)):
+            marks = ",".join("?" * len(chunk))
+            for clue_id, name, description, unlocked in self.conn.execute(
+                    "SELECT c.id, c.name, c.description, COALESCE(u.unlocked, c.unlocked_default) "
+                    f"FROM clues c LEFT JOIN clue_unlocks u ON u.clue_id = c.id WHERE c.id IN ({marks})", chunk):
+                unlocked = self._pending_unlocks.get(clue_id, unlocked)
+                result[clue_id] = {"name": name, "description": description, "unlocked": bool(unlocked)}
+        return result
+
+    def find_clue(self, name):
+        row = self.conn.execute("SELECT id FROM clues WHERE name = ? COLLATE NOCASE ORDER BY id LIMIT 1",
+                                (name,)).fetchone()
+        return row[0] if row else -1
+
+    def add_clue(self, name, description, unlocked=False, case_id=DEFAULT_CASE):
+        with self.conn:
+            last = self.conn.execute("SELECT MAX(id) FROM clues").fetchone()[0]
+            clue_id = max(RUNTIME_CLUE_BASE, (last or 0) + 1)
+            self.conn.execute("INSERT INTO clues (id, name, description, unlocked_default) VALUES (?, ?, ?, ?)",
+                              (clue_id, name, description, int(unlocked)))
+            self.conn.execute("INSERT INTO case_clues (case_id, clue_id) VALUES (?, ?)", (case_id, clue_id))
+            self.conn.execute("INSERT OR REPLACE INTO clue_unlocks (clue_id, unlocked) VALUES (?, ?)",
+                              (clue_id, int(unlocked)))
+        return clue_id
+
+    def set_clue_unlocked(self, clue_id, unlocked=True):
+        """Ghi nhận thay đổi; được ghi xuống đĩa ở lần flush() tiếp theo."""
+        self._pending_unlocks[clue_id] = int(unlocked)
+
+    def note(self, clue_id):
+        if clue_id in self._pending_notes:
+            return self._pending_notes[clue_id]
+        row = self.conn.execute("SELECT text FROM clue_notes WHERE clue_id = ?", (clue_id,)).fetchone()
+        return row[0] if row else ""
+
+    def set_note(self, clue_id, text):
+        self._pending_notes[clue_id] = text
+
+    # --- Vật phẩm ---
+
+    def item_codes(self, case_id=None):
+        if case_id is None:
+            rows = self.conn.execute("SELECT code FROM items ORDER BY position")
+        else:
+            rows = self.conn.execute(
+                "SELECT i.code FROM items i JOIN case_items c ON c.item_code = i.code "
+                "WHERE c.case_id = ? ORDER BY i.position", (case_id,))
+        return [r[0] for r in rows]
+
+    def item_rows(self, case_id):
+        """
+        (code, name, icon_id, starting) của các vật phẩm trong vụ án theo thứ tự
+        khai báo - không đọc description.
+        """
+        return self.conn.execute(
+            "SELECT i.code, i.name, i.icon_id, c.starting FROM items i JOIN case_items c ON c.item_code = i.code "
+            "WHERE c.case_id = ? ORDER BY i.position", (case_id,)).fetchall()
+
+    def item_description(self, code):
+        row = self.conn.execute("SELECT description FROM items WHERE code = ?", (code,)).fetchone()
+        return row[0] if row else ""
+
+    def fetch_items(self, codes):
+        """Đọc các vật phẩm theo code (description đọc khi cần), giữ nguyên thứ tự của `codes`."""
+        rows = {}
+        for chunk in _chunks(list(codes)):
+            marks = ",".join("?" * len(chunk))
+            for code, name, icon_id in self.conn.execute(
+                    f"SELECT code, name, icon_id FROM items WHERE code IN ({marks})", chunk):
+                rows[code] = Item(name, code, None, icon_id, self.item_description)
+        return [rows[code] for code in codes if code in rows]
+
+    # --- Ghi xuống đĩa ---
+
+    def flush(self):
+        """Ghi mọi thay đổi mở khóa / ghi chú đang chờ trong một transaction."""
+        if not (self._pending_unlocks or self._pending_notes):
+            return 0
+        unlocks = list(self._pending_unlocks.items())
+        notes = list(self._pending_notes.items())
+        self._pending_unlocks.clear()
+        self._pending_notes.clear()
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO clue_unlocks (clue_id, unlocked) VALUES (?, ?)", unlocks)
+            self.conn.executemany("INSERT OR REPLACE INTO clue_notes (clue_id, text) VALUES (?, ?)", notes)
+        return len(unlocks) + len(notes)
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+
+class CasebookClueStore(ClueStore):
+    """
+    ClueStore đọc manh mối từ Casebook.
+
+    Chỉ giữ danh sách id (số nguyên) trong bộ nhớ; nội dung từng dòng được đọc
+    theo trang khi Notebook cần và giữ trong LRU các trang gần đây. Mỗi dòng là
+    dict {"name", "description", "unlocked"} như của ClueStore, và unlock/lock
+    có cùng độ phức tạp (O(n) dời phần tử trong list id, xem ClueStore).
+    """
+
+    def __init__(self, casebook, case_id=None, cache_rows=64):
+        """
+        Args:
+            casebook: Casebook nguồn
+            case_id: Chỉ lấy manh mối của vụ án này (None = mọi vụ án)
+            cache_rows: Số dòng giữ trong cache (vài trang Notebook)
+        """
+        self.casebook = casebook
+        self.case_id = case_id
+        self.cache_rows = cache_rows
+        self._ids = casebook.clue_ids(case_id)
+        self._unlocked = casebook.unlocked_clue_ids(case_id)
+        self._unlocked_set = set(self._unlocked)
+        self._rows = OrderedDict()
+        self._listeners = []
+
+    # --- Truy cập dữ liệu ---
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __getitem__(self, clue_id):
+        row = self._rows.get(clue_id)
+        if row is None:
+            self.prefetch([clue_id])
+            row = self._rows.get(clue_id)
+            if row is None:
+                raise IndexError(clue_id)
+        else:
+            self._rows.move_to_end(clue_id)
+        return row
+
+    def __iter__(self):
+        for _, clue in self.rows(self._ids):
+            yield clue
+
+    def rows(self, ids):
+        # Đọc theo lô, không đưa vào cache (dùng cho việc quét một lần như build chỉ mục)
+        ids = list(ids)
+        for chunk in _chunks(ids):
+            fetched = self.casebook.fetch_clues(chunk)
+            for clue_id in chunk:
+                if clue_id in fetched:
+                    yield clue_id, fetched[clue_id]
+
+    def prefetch(self, ids):
+        """Đọc các dòng chưa có trong cache bằng một truy vấn."""
+        missing = [i for i in ids if i not in self._rows]
+        if missing:
+            self._rows.update(self.casebook.fetch_clues(missing))
+        for clue_id in ids:
+            if clue_id in self._rows:
+                self._rows.move_to_end(clue_id)
+        while len(self._rows) > self.cache_rows:
+            self._rows.popitem(last=False)
+
+    def find(self, name):
+        return self.casebook.find_clue(name)
+
+    def is_unlocked(self, clue_id):
+        return clue_id in self._unlocked_set
+
+    def page(self, page, per_page):
+        ids = super().page(page, per_page)
+        self.prefetch(ids)
+        return ids
+
+    # --- Thay đổi ---
+
+    def unlock(self, clue_id):
+        if clue_id in self._unlocked_set:
+            return False
+        self._unlocked_set.add(clue_id)
+        insort(self._unlocked, clue_id)
+        self.casebook.set_clue_unlocked(clue_id, True)
+        self._set_cached_unlocked(clue_id, True)
+        self._notify("unlock", clue_id)
+        return True
+
+    def lock(self, clue_id):
+        if clue_id not in self._unlocked_set:
+            return False
+        self._unlocked_set.discard(clue_id)
+        del self._unlocked[self.position_of(clue_id)]
+        self.casebook.set_clue_unlocked(clue_id, False)
+        self._set_cached_unlocked(clue_id, False)
+        self._notify("lock", clue_id)
+        return True
+
+    def _set_cached_unlocked(self, clue_id, unlocked):
+        row = self._rows.get(clue_id)
+        if row is not None:
+            row["unlocked"] = unlocked
+
+    def add(self, clue):
+        unlocked = bool(clue.get("unlocked"))
+        clue_id = self.casebook.add_clue(clue["name"], clue["description"], unlocked,
+                                         self.case_id or DEFAULT_CASE)
+        self._ids.append(clue_id)
+        if unlocked:
+            self._unlocked_set.add(clue_id)
+            insort(self._unlocked, clue_id)
+        self._notify("add", clue_id)
+        return clue_id
+
+    # --- Ghi chú ---
+
+    def note(self, clue_id):
+        return self.casebook.note(clue_id)
+
+    def set_note(self, clue_id, text):
+        self.casebook.set_note(clue_id, text)
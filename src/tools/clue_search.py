@@ -0,0 +1,114 @@
+# file: clue_search.py
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from .rich_text import plain_text
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def normalize_text(text):
+    """Chữ thường, bỏ dấu tiếng Việt (vd: "Đồng hồ" -> "dong ho")."""
+    text = text.lower()
+    if text.isascii():
+        return text
+    text = text.replace("đ", "d")
+    decomposed = unicodedata.normalize("NFD", text)
+    return "".join(ch for ch in decomposed if unicodedata.category(ch) != "Mn")
+
+
+def tokenize(text):
+    return _WORD_RE.findall(normalize_text(text))
+
+
+class ClueSearchIndex:
+    """
+    Chỉ mục đảo (token -> tập id manh mối) trên "name" và "description"
+    của các manh mối đã mở khóa.
+
+    Chỉ mục được build ở lần tìm kiếm đầu tiên (không đọc mọi manh mối khi mở
+    game), sau đó cập nhật từng manh mối khi ClueStore báo mở/khóa, không build
+    lại. Tìm kiếm hỗ trợ tiền tố: mỗi từ trong câu truy vấn khớp với mọi token
+    bắt đầu bằng nó (tra bằng bisect trên danh sách token đã sắp xếp).
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._postings = {}       # token -> set(clue_id)
+        self._sorted_tokens = []  # token đã sắp xếp, để tra tiền tố
+        self._clue_tokens = {}    # clue_id -> set(token), để gỡ khỏi chỉ mục
+        self._prefix_cache = {}
+        self.built = False
+        store.subscribe(self._on_clues_changed)
+
+    def _ensure_built(self):
+        if self.built:
+            return
+        self.built = True
+        for clue_id, clue in self.store.rows(self.store.unlocked_ids):
+            self.add(clue_id, clue)
+
+    def _on_clues_changed(self, event, clue_id):
+        if not self.built:
+            return  # Lần build đầu sẽ đọc trạng thái hiện tại
+        if event in ("unlock", "add") and self.store.is_unlocked(clue_id):
+            self.add(clue_id)
+        elif event == "lock":
+            self.remove(clue_id)
+
+    def add(self, clue_id, clue=None):
+        if clue_id in self._clue_tokens:
+            return
+        if clue is None:
+            clue = self.store[clue_id]
+        tokens = set(tokenize(clue["name"])) | set(tokenize(plain_text(clue["description"])))
+        self._clue_tokens[clue_id] = tokens
+        for token in tokens:
+            ids = self._postings.get(token)
+            if ids is None:
+                ids = self._postings[token] = set()
+                insort(self._sorted_tokens, token)
+            ids.add(clue_id)
+        self._prefix_cache.clear()
+
+    def remove(self, clue_id):
+        tokens = self._clue_tokens.pop(clue_id, None)
+        if not tokens:
+            return
+        for token in tokens:
+            ids = self._postings[token]
+            ids.discard(clue_id)
+            if not ids:
+                del self._postings[token]
+                del self._sorted_tokens[bisect_left(self._sorted_tokens, token)]
+        self._prefix_cache.clear()
+
+    def _match_prefix(self, prefix):
+        ids = self._prefix_cache.get(prefix)
+        if ids is not None:
+            return ids
+        ids = set()
+        pos = bisect_left(self._sorted_tokens, prefix)
+        while pos < len(self._sorted_tokens) and self._sorted_tokens[pos].startswith(prefix):
+            ids |= self._postings[self._sorted_tokens[pos]]
+            pos += 1
+        self._prefix_cache[prefix] = ids
+        return ids
+
+    def search(self, query):
+        """
+        Trả về id các manh mối khớp mọi từ trong query (theo thứ tự gốc),
+        hoặc None nếu query rỗng.
+        """
+        words = tokenize(query)
+        if not words:
+            return None
+        self._ensure_built()
+        # Bắt đầu từ từ dài nhất (thường ít kết quả nhất) để giao tập nhanh hơn
+        words.sort(key=len, reverse=True)
+        result = set(self._match_prefix(words[0]))
+        for word in words[1:]:
+            if not result:
+                break
+            result &= self._match_prefix(word)
+        return sorted(result)
@@ -0,0 +1,137 @@
+# file: clue_store.py
+import math
+from bisect import bisect_left, insort
+
+
+class ClueStore:
+    """
+    Kho manh mối có chỉ mục cho Notebook.
+
+    Giữ danh sách id (vị trí gốc) của các manh mối đã mở khóa theo thứ tự,
+    nên Notebook không phải quét lại toàn bộ danh sách mỗi frame. Mỗi thay
+    đổi được báo cho các listener đã đăng ký (callback(event, clue_id)).
+
+    Độ phức tạp: tìm vị trí là O(log n) (bisect), lấy một trang là
+    O(per_page), còn unlock/lock là O(n) vì chèn/xóa giữa list phải dời các
+    phần tử phía sau (một lần memmove). Ở quy mô của game (vài chục đến vài
+    nghìn manh mối) chi phí này ~1-6 µs mỗi thao tác, ~60 µs ở 100k; unlock
+    xảy ra theo hành động người chơi chứ không mỗi frame, nên không cần cấu
+    trúc cây/bucket phức tạp hơn.
+    """
+
+    def __init__(self, clues):
+        """
+        Args:
+            clues: Danh sách dict {"name", "description", "unlocked"} (vd: Notebook_clues.clues)
+        """
+        self._clues = clues
+        self._unlocked = [i for i, c in enumerate(clues) if c.get("unlocked")]
+        self._listeners = []
+        self._notes = {}  # clue_id -> ghi chú của người chơi
+
+    # --- Truy cập dữ liệu ---
+
+    def __len__(self):
+        return len(self._clues)
+
+    def __getitem__(self, clue_id):
+        return self._clues[clue_id]
+
+    def __iter__(self):
+        return iter(self._clues)
+
+    def rows(self, ids):
+        """Duyệt (id, manh mối) cho danh sách id (kho ngoài có thể đọc theo lô)."""
+        for clue_id in ids:
+            yield clue_id, self._clues[clue_id]
+
+    def find(self, name):
+        """Id của manh mối có tên `name` (không phân biệt hoa thường), -1 nếu không có."""
+        name = name.casefold()
+        for clue_id, clue in enumerate(self._clues):
+            if clue["name"].casefold() == name:
+                return clue_id
+        return -1
+
+    def is_unlocked(self, clue_id):
+        return self._clues[clue_id].get("unlocked", False)
+
+    @property
+    def unlocked_ids(self):
+        """Id các manh mối đã mở khóa, theo thứ tự gốc (không được sửa trực tiếp)."""
+        return self._unlocked
+
+    def unlocked_count(self):
+        return len(self._unlocked)
+
+    # --- Phân trang ---
+
+    def page_count(self, per_page):
+        return max(1, math.ceil(len(self._unlocked) / per_page))
+
+    def page(self, page, per_page):
+        """Id các manh mối trên trang `page`."""
+        start = page * per_page
+        return self._unlocked[start:start + per_page]
+
+    def position_of(self, clue_id):
+        """Vị trí của manh mối trong danh sách đã mở khóa, -1 nếu chưa mở."""
+        pos = bisect_left(self._unlocked, clue_id)
+        if pos < len(self._unlocked) and self._unlocked[pos] == clue_id:
+            return pos
+        return -1
+
+    def page_of(self, clue_id, per_page):
+        pos = self.position_of(clue_id)
+        return pos // per_page if pos != -1 else -1
+
+    # --- Thay đổi ---
+
+    def unlock(self, clue_id):
+        """Mở khóa manh mối. Trả về False nếu đã mở khóa từ trước."""
+        clue = self._clues[clue_id]
+        if clue.get("unlocked"):
+            return False
+        clue["unlocked"] = True
+        insort(self._unlocked, clue_id)  # O(log n) tìm + O(n) dời phần tử
+        self._notify("unlock", clue_id)
+        return True
+
+    def lock(self, clue_id):
+        clue = self._clues[clue_id]
+        if not clue.get("unlocked"):
+            return False
+        clue["unlocked"] = False
+        del self._unlocked[self.position_of(clue_id)]
+        self._notify("lock", clue_id)
+        return True
+
+    def add(self, clue):
+        """Thêm manh mối mới vào cuối danh sách; trả về id của nó."""
+        clue_id = len(self._clues)
+        self._clues.append(clue)
+        if clue.get("unlocked"):
+            self._unlocked.append(clue_id)
+        self._notify("add", clue_id)
+        return clue_id
+
+    # --- Ghi chú ---
+
+    def note(self, clue_id):
+        return self._notes.get(clue_id, "")
+
+    def set_note(self, clue_id, text):
+        self._notes[clue_id] = text
+
+    # --- Thông báo ---
+
+    def subscribe(self, callback):
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, event, clue_id):
+        for callback in self._listeners:
+            callback(event, clue_id)
@@ -0,0 +1,174 @@
+# evidence_combiner.py
+
+# Recipes are declared next to the items, in assets/data/items/<case_id>.json:
+#   "recipes": [
+#       {"items": ["FPD5", "LTRX"],          # the two item codes (order does not matter)
+#        "produces": ["LTRF"],               # item codes, or [code, quantity] pairs
+#        "consumes": ["LTRX"],               # default: both inputs
+#        "unlocks": ["Strange Fingerprint"], # Notebook clue names
+#        "message": "..."}
+#   ]
+
+from collections import Counter
+
+from .Inventory_Item import DEFAULT_CASE, item_file, load_case_file
+
+
+class Recipe:
+    __slots__ = ("inputs", "produces", "consumes", "unlocks", "message")
+
+    def __init__(self, inputs, produces=(), consumes=None, unlocks=(), message=""):
+        self.inputs = tuple(inputs)
+        self.produces = tuple(produces)  # (code, quantity)
+        self.consumes = tuple(self.inputs if consumes is None else consumes)
+        self.unlocks = tuple(unlocks)
+        self.message = message
+
+    @property
+    def key(self):
+        return frozenset(self.inputs)
+
+    def __repr__(self):
+        return f"Recipe({' + '.join(self.inputs)})"
+
+
+class RecipeBook:
+    """
+    Combination recipes of the cases in play, compiled into a hash table keyed
+    by the unordered pair of item codes, plus the set of partners of every
+    item. lookup() and partners() are O(1) whatever the number of recipes.
+    """
+
+    def __init__(self, cases=(DEFAULT_CASE,), registry=None):
+        """
+        Args:
+            cases: Case ids whose recipes are loaded
+            registry: ItemRegistry used to check that every code in a recipe exists
+        """
+        self.registry = registry
+        self._recipes = {}   # frozenset({code_a, code_b}) -> Recipe
+        self._partners = {}  # code -> set(partner codes)
+        for case_id in cases:
+            self.load_case(case_id)
+
+    def load_case(self, case_id):
+        for entry in load_case_file(case_id).get("recipes", []):
+            self.add(self._compile(entry, item_file(case_id)))
+
+    def _compile(self, entry, source):
+        inputs = entry.get("items", ())
+        if len(inputs) != 2:
+            raise ValueError(f"{source}: a recipe needs exactly two items, got {inputs}")
+        produces = [(p, 1) if isinstance(p, str) else (p[0], int(p[1])) for p in entry.get("produces", ())]
+        recipe = Recipe(inputs, produces, entry.get("consumes"), entry.get("unlocks", ()), entry.get("message", ""))
+        if Counter(recipe.consumes) - Counter(recipe.inputs):
+            raise ValueError(f"{source}: recipe {recipe} consumes items that are not its inputs {list(recipe.consumes)}")
+        if self.registry is not None:
+            unknown = [code for code in (*recipe.inputs, *(c for c, _ in recipe.produces)) if code not in self.registry]
+            if unknown:
+                raise ValueError(f"{source}: recipe {recipe} uses unknown items {unknown}")
+        return recipe
+
+    def add(self, recipe):
+        key = recipe.key
+        if key in self._recipes:
+            raise ValueError(f"Duplicate recipe for {' + '.join(recipe.inputs)}")
+        self._recipes[key] = recipe
+        code_a, code_b = recipe.inputs
+        self._partners.setdefault(code_a, set()).add(code_b)
+        self._partners.setdefault(code_b, set()).add(code_a)
+
+    def lookup(self, code_a, code_b):
+        return self._recipes.get(frozenset((code_a, code_b)))
+
+    def partners(self, code):
+        """Codes of the items that combine with `code`."""
+        return self._partners.get(code, frozenset())
+
+    def __len__(self):
+        return len(self._recipes)
+
+
+class CombineResult:
+    __slots__ = ("success", "message", "recipe", "produced", "unlocked")
+
+    def __init__(self, success, message, recipe=None, produced=(), unlocked=()):
+        self.success = success
+        self.message = message
+        self.recipe = recipe
+        self.produced = list(produced)  # Item
+        self.unlocked = list(unlocked)  # clue ids
+
+
+class EvidenceCombiner:
+    """Applies recipes to an InventoryManager and unlocks clues in the ClueStore."""
+
+    def __init__(self, recipes, registry, clue_store=None):
+        self.recipes = recipes
+        self.registry = registry
+        self.clue_store = clue_store
+
+    def partner_slots(self, inventory, index):
+        """Slots holding items that combine with the item in slot `index`."""
+        item = inventory.get_item(index)
+        if item is None:
+            return set()
+        slots = set()
+        for code in self.recipes.partners(item.code):
+            slots.update(inventory.find_slots(code))
+        if item.code in self.recipes.partners(item.code) and inventory.count(item.code) < 2:
+            slots.discard(index)
+        return slots
+
+    def combine(self, inventory, index_a, index_b):
+        item_a = inventory.get_item(index_a)
+        item_b = inventory.get_item(index_b)
+        if item_a is None or item_b is None:
+            return CombineResult(False, "Select two items to combine.")
+        if index_a == index_b and inventory.get_quantity(index_a) < 2:
+            return CombineResult(False, "You need two of these.")
+        recipe = self.recipes.lookup(item_a.code, item_b.code)
+        if recipe is None:
+            return CombineResult(False, f"{item_a.name} and {item_b.name} don't go together.")
+
+        products = [(self.registry[code], quantity) for code, quantity in recipe.produces]
+        consumed = self._consumed_slots(recipe, ((index_a, item_a.code), (index_b, item_b.code)))
+        saved = {index: (inventory.get_item(index), inventory.get_quantity(index)) for index in consumed}
+        with inventory.batch():
+            for index in consumed:
+                inventory.remove_item(index, 1)
+            rejected = inventory.add_items(products)
+            if rejected:
+                # Inventory is full: undo everything, putting the inputs back in their slots
+                for item, quantity in products:
+                    if (item, quantity) not in rejected:
+                        inventory.remove_by_code(item.code, quantity)
+                for index, (item, quantity) in saved.items():
+                    inventory.add_item(item, index, quantity)
+                return CombineResult(False, "Your inventory is full.", recipe)
+
+        unlocked = []
+        if self.clue_store is not None:
+            for name in recipe.unlocks:
+                clue_id = self.clue_store.find(name)
+                if clue_id >= 0 and not self.clue_store.is_unlocked(clue_id):
+                    self.clue_store.unlock(clue_id)
+                    unlocked.append(clue_id)
+
+        message = recipe.message or f"Combined {item_a.name} with {item_b.name}."
+        if unlocked:
+            message += " New clue in the Notebook!"
+        return CombineResult(True, message, recipe, [item for item, _ in products], unlocked)
+
+    @staticmethod
+    def _consumed_slots(recipe, selected):
+        """Selected slot of each consumed code (the same slot twice for a pair from one stack)."""
+        selected = list(selected)
+        slots = []
+        for code in recipe.consumes:
+            for k, (index, selected_code) in enumerate(selected):
+                if selected_code == code:
+                    slots.append(index)
+                    del selected[k]
+                    break
+        return slots
@@ -0,0 +1,144 @@
+# file: icon_atlas.py
+import json
+import os
+import pygame
+from .help_func import get_sprite
+
+DEFAULT_SHEET_PATH = "assets/images/tools/UI_Item_icon_temp.png"
+DEFAULT_CACHE_DIR = os.path.join("saves", "cache")
+ATLAS_VERSION = 1
+
+# Ô icon trên sprite sheet gốc
+ICON_GRID_SIZE = 340
+ICONS_PER_ROW = 3
+TILE_OFFSET = (10, 15)
+
+# 16/32/64 cho HUD, ô inventory, kéo thả; DETAIL_SIZE cho khung chi tiết
+DETAIL_SIZE = 96
+ICON_SIZES = (16, 32, 64, DETAIL_SIZE)
+
+
+class IconAtlas:
+    """
+    Atlas icon vật phẩm đã thu nhỏ sẵn nhiều cỡ.
+
+    Sprite sheet chỉ được cắt và smoothscale một lần; mỗi cỡ là một ảnh atlas
+    (các icon xếp lưới) được lưu vào cache_dir cùng file manifest. Các lần chạy
+    sau chỉ load ảnh atlas nếu sheet gốc và danh sách cỡ không đổi.
+
+    get(icon_id, size) trả về subsurface dùng chung: chỉ blit, không vẽ lên.
+    """
+
+    def __init__(self, sheet_path=DEFAULT_SHEET_PATH, sizes=ICON_SIZES, cache_dir=DEFAULT_CACHE_DIR):
+        """
+        Args:
+            sheet_path: Sprite sheet icon gốc
+            sizes: Các cỡ icon (px) cần dựng sẵn
+            cache_dir: Thư mục lưu atlas (None = không lưu ra đĩa)
+        """
+        self.sheet_path = sheet_path
+        self.sizes = tuple(sorted(set(sizes)))
+        self.cache_dir = cache_dir
+        self.count = 0
+        self._atlases = {}  # size -> Surface atlas
+        self._icons = {}    # size -> [subsurface theo icon_id]
+        if not self._load_cached():
+            self._build()
+            self._save()
+        self._slice()
+
+    # --- Dựng atlas ---
+
+    def _signature(self):
+        try:
+            st = os.stat(self.sheet_path)
+            source = f"{st.st_mtime_ns}:{st.st_size}"
+        except OSError:
+            source = "missing"
+        return {
+            "version": ATLAS_VERSION,
+            "source": source,
+            "sizes": list(self.sizes),
+            "tile": [ICON_GRID_SIZE, ICONS_PER_ROW, *TILE_OFFSET],
+        }
+
+    def _build(self):
+        sheet = pygame.image.load(self.sheet_path).convert_alpha()
+        rows = -(-(sheet.get_height() - TILE_OFFSET[1]) // ICON_GRID_SIZE)
+        self.count = ICONS_PER_ROW * rows
+        tiles = []
+        for icon_id in range(self.count):
+            x = (icon_id % ICONS_PER_ROW) * ICON_GRID_SIZE + TILE_OFFSET[0]
+            y = (icon_id // ICONS_PER_ROW) * ICON_GRID_SIZE + TILE_OFFSET[1]
+            tiles.append(get_sprite(sheet, x, y, ICON_GRID_SIZE, ICON_GRID_SIZE))
+
+        for size in self.sizes:
+            atlas = pygame.Surface(self._atlas_size(size), pygame.SRCALPHA)
+            for icon_id, tile in enumerate(tiles):
+                atlas.blit(pygame.transform.smoothscale(tile, (size, size)), self._icon_pos(icon_id, size))
+            self._atlases[size] = atlas
+
+    def _atlas_size(self, size):
+        rows = -(-self.count // ICONS_PER_ROW)
+        return ICONS_PER_ROW * size, rows * size
+
+    @staticmethod
+    def _icon_pos(icon_id, size):
+        return (icon_id % ICONS_PER_ROW) * size, (icon_id // ICONS_PER_ROW) * size
+
+    def _slice(self):
+        for size, atlas in self._atlases.items():
+            self._icons[size] = [
+                atlas.subsurface(pygame.Rect(self._icon_pos(icon_id, size), (size, size)))
+                for icon_id in range(self.count)
+            ]
+
+    # --- Cache trên đĩa ---
+
+    def _manifest_path(self):
+        return os.path.join(self.cache_dir, "icon_atlas.json")
+
+    def _image_path(self, size):
+        return os.path.join(self.cache_dir, f"icon_atlas_{size}.png")
+
+    def _load_cached(self):
+        if self.cache_dir is None:
+            return False
+        try:
+            with open(self._manifest_path(), encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("signature") != self._signature():
+                return False
+            self.count = manifest["count"]
+            atlases = {}
+            for size in self.sizes:
+                atlas = pygame.image.load(self._image_path(size)).convert_alpha()
+                if atlas.get_size() != self._atlas_size(size):
+                    return False
+                atlases[size] = atlas
+        except (OSError, ValueError, KeyError, pygame.error):
+            return False
+        self._atlases = atlases
+        return True
+
+    def _save(self):
+        if self.cache_dir is None:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for size, atlas in self._atlases.items():
+                pygame.image.save(atlas, self._image_path(size))
+            # Manifest ghi sau cùng: atlas lưu dở sẽ không bị coi là hợp lệ
+            with open(self._manifest_path(), "w", encoding="utf-8") as f:
+                json.dump({"signature": self._signature(), "count": self.count}, f)
+        except (OSError, pygame.error) as e:
+            print(f"Icon atlas: không lưu được cache ({e})")
+
+    # --- Tra cứu ---
+
+    def get(self, icon_id, size):
+        """Icon đã thu nhỏ sẵn; None nếu icon_id hoặc cỡ không có trong atlas."""
+        icons = self._icons.get(size)
+        if icons is None or not 0 <= icon_id < self.count:
+            return None
+        return icons[icon_id]
@@ -0,0 +1,387 @@
+# file: note_editor.py
+import pygame
+from bisect import bisect_right
+from src.utils.text_cache import render_text
+from .text_layout import line_spans
+
+CARET_BLINK_MS = 1000
+KEY_REPEAT = (400, 35)  # (delay, interval) khi đang gõ
+
+
+class NoteEditor:
+    """
+    Ô soạn ghi chú nhiều dòng (con trỏ, vùng chọn, nhập IME).
+
+    Văn bản được giữ theo đoạn; mỗi đoạn có cache vị trí xuống dòng (line_spans).
+    Mỗi lần gõ chỉ tính lại đoạn đang sửa, và chỉ dựng lại bảng "dòng đầu của
+    mỗi đoạn" khi số dòng thay đổi. Các dòng không đổi dùng lại surface trong
+    text cache, nên vẽ mỗi frame chỉ là vài lần blit.
+
+    Vị trí trong văn bản là tuple (đoạn, offset), so sánh được trực tiếp.
+    """
+
+    def __init__(self, font, rect, line_height, color=(10, 10, 10), selection_color=(150, 190, 230)):
+        """
+        Args:
+            font: Font dùng để vẽ chữ
+            rect: Vùng soạn thảo; rect.top là đáy (baseline) của dòng đầu tiên
+            line_height: Khoảng cách giữa các dòng (khớp dòng kẻ của sổ)
+        """
+        self.font = font
+        self.rect = pygame.Rect(rect)
+        self.line_height = line_height
+        self.visible_lines = max(1, self.rect.height // line_height)
+        self.color = color
+        self.selection_color = selection_color
+
+        self.focused = False
+        self.dirty = False  # đã sửa kể từ lần lưu gần nhất
+        self.composition = ""  # chuỗi IME đang soạn (TEXTEDITING)
+        self.scroll = 0  # dòng hiển thị đầu tiên
+        self.relayout_count = 0
+
+        self._dragging = False
+        self._goal_x = None  # giữ cột khi di chuyển lên/xuống
+        self.set_text("")
+
+    # --- Văn bản ---
+
+    @property
+    def text(self):
+        return "\n".join(self.paragraphs)
+
+    def set_text(self, text):
+        self.paragraphs = text.split("\n")
+        self._starts = [self._layout(p) for p in self.paragraphs]
+        self._reindex()
+        self.cursor = (0, 0)
+        self.anchor = None
+        self.composition = ""
+        self.scroll = 0
+        self.dirty = False
+
+    def _layout(self, paragraph):
+        """Danh sách offset bắt đầu của từng dòng trong đoạn."""
+        self.relayout_count += 1
+        return [start for start, _ in line_spans(paragraph, self.font, self.rect.width)] or [0]
+
+    def _relayout(self, index):
+        """Tính lại một đoạn; chỉ dựng lại chỉ mục dòng nếu số dòng đổi."""
+        old_count = len(self._starts[index])
+        self._starts[index] = self._layout(self.paragraphs[index])
+        if len(self._starts[index]) != old_count:
+            self._reindex()
+
+    def _reindex(self):
+        self._first_line = []
+        total = 0
+        for starts in self._starts:
+            self._first_line.append(total)
+            total += len(starts)
+        self.total_lines = total
+
+    # --- Hình học ---
+
+    def _line_of(self, pos):
+        """Dòng hiển thị (toàn cục) và chỉ số dòng trong đoạn của một vị trí."""
+        para, offset = pos
+        local = bisect_right(self._starts[para], offset) - 1
+        return self._first_line[para] + local, local
+
+    def _line_text(self, para, local):
+        starts = self._starts[para]
+        end = starts[local + 1] if local + 1 < len(starts) else len(self.paragraphs[para])
+        return starts[local], self.paragraphs[para][starts[local]:end]
+
+    def _x_of(self, pos):
+        para, offset = pos
+        _, local = self._line_of(pos)
+        start, _ = self._line_text(para, local)
+        return self.font.size(self.paragraphs[para][start:offset])[0]
+
+    def _offset_at_x(self, para, local, x):
+        """Offset gần x nhất trên một dòng (tìm kiếm nhị phân trên độ rộng tiền tố)."""
+        start, line = self._line_text(para, local)
+        if local + 1 < len(self._starts[para]):
+            line = line.rstrip(" ") or line[:1]
+        lo, hi = 0, len(line)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.font.size(line[:mid + 1])[0] - self.font.size(line[mid])[0] / 2 < x:
+                lo = mid + 1
+            else:
+                hi = mid
+        return start + lo
+
+    def _pos_at_line(self, line, x):
+        line = max(0, min(self.total_lines - 1, line))
+        para = bisect_right(self._first_line, line) - 1
+        return para, self._offset_at_x(para, line - self._first_line[para], x)
+
+    def pos_at(self, mouse_pos):
+        mx, my = mouse_pos
+        row = (my - (self.rect.top - self.line_height)) // self.line_height
+        return self._pos_at_line(self.scroll + row, mx - self.rect.left)
+
+    def hit_rect(self):
+        """Vùng chứa chữ trên màn hình (dòng đầu nằm ngay trên rect.top)."""
+        return pygame.Rect(self.rect.left, self.rect.top - self.line_height,
+                           self.rect.width, self.visible_lines * self.line_height)
+
+    def caret_rect(self):
+        line, _ = self._line_of(self.cursor)
+        x = self.rect.left + self._x_of(self.cursor)
+        bottom = self.rect.top + (line - self.scroll) * self.line_height
+        height = self.font.get_height()
+        return pygame.Rect(x, bottom - height, 2, height)
+
+    def _ensure_visible(self):
+        line, _ = self._line_of(self.cursor)
+        if line < self.scroll:
+            self.scroll = line
+        elif line >= self.scroll + self.visible_lines:
+            self.scroll = line - self.visible_lines + 1
+
+    # --- Vùng chọn ---
+
+    def selection(self):
+        """(start, end) đã sắp xếp, hoặc None nếu không có vùng chọn."""
+        if self.anchor is None or self.anchor == self.cursor:
+            return None
+        return min(self.anchor, self.cursor), max(self.anchor, self.cursor)
+
+    def selected_text(self):
+        sel = self.selection()
+        if sel is None:
+            return ""
+        (p0, o0), (p1, o1) = sel
+        if p0 == p1:
+            return self.paragraphs[p0][o0:o1]
+        parts = [self.paragraphs[p0][o0:]] + self.paragraphs[p0 + 1:p1] + [self.paragraphs[p1][:o1]]
+        return "\n".join(parts)
+
+    def select_all(self):
+        self.anchor = (0, 0)
+        self.cursor = (len(self.paragraphs) - 1, len(self.paragraphs[-1]))
+
+    def _move(self, pos, extend):
+        if extend:
+            if self.anchor is None:
+                self.anchor = self.cursor
+        else:
+            self.anchor = None
+        self.cursor = pos
+
+    # --- Sửa văn bản ---
+
+    def delete_selection(self):
+        sel = self.selection()
+        self.anchor = None
+        if sel is None:
+            return False
+        (p0, o0), (p1, o1) = sel
+        self.paragraphs[p0] = self.paragraphs[p0][:o0] + self.paragraphs[p1][o1:]
+        if p1 > p0:
+            del self.paragraphs[p0 + 1:p1 + 1]
+            del self._starts[p0 + 1:p1 + 1]
+            self._starts[p0] = self._layout(self.paragraphs[p0])
+            self._reindex()
+        else:
+            self._relayout(p0)
+        self.cursor = (p0, o0)
+        self.dirty = True
+        return True
+
+    def insert(self, text):
+        self.delete_selection()
+        para, offset = self.cursor
+        current = self.paragraphs[para]
+        pieces = text.split("\n")
+        if len(pieces) == 1:
+            self.paragraphs[para] = current[:offset] + text + current[offset:]
+            self._relayout(para)
+            self.cursor = (para, offset + len(text))
+        else:
+            new_paragraphs = [current[:offset] + pieces[0]] + pieces[1:-1] + [pieces[-1] + current[offset:]]
+            self.paragraphs[para:para + 1] = new_paragraphs
+            self._starts[para:para + 1] = [self._layout(p) for p in new_paragraphs]
+            self._reindex()
+            self.cursor = (para + len(pieces) - 1, len(pieces[-1]))
+        self.dirty = True
+
+    def backspace(self):
+        if self.delete_selection():
+            return
+        para, offset = self.cursor
+        if offset > 0:
+            self.anchor = (para, offset - 1)
+        elif para > 0:
+            self.anchor = (para - 1, len(self.paragraphs[para - 1]))
+        self.delete_selection()
+
+    def delete_forward(self):
+        if self.delete_selection():
+            return
+        para, offset = self.cursor
+        if offset < len(self.paragraphs[para]):
+            self.anchor = (para, offset + 1)
+        elif para + 1 < len(self.paragraphs):
+            self.anchor = (para + 1, 0)
+        self.delete_selection()
+
+    # --- Focus ---
+
+    def focus(self):
+        self.focused = True
+
+    def blur(self):
+        self.focused = False
+        self.composition = ""
+        self._dragging = False
+
+    # --- Sự kiện ---
+
+    def handle_event(self, event):
+        """Xử lý sự kiện khi đang focus; trả về True nếu sự kiện đã được dùng."""
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if not self.hit_rect().collidepoint(event.pos):
+                return False
+            self.focus()
+            shift = pygame.key.get_mods() & pygame.KMOD_SHIFT
+            self._move(self.pos_at(event.pos), bool(shift))
+            if self.anchor is None:
+                self.anchor = self.cursor
+            self._dragging = True
+            self._goal_x = None
+            return True
+        if event.type == pygame.MOUSEMOTION and self._dragging:
+            self.cursor = self.pos_at(event.pos)
+            self._ensure_visible()
+            return True
+        if event.type == pygame.MOUSEBUTTONUP and event.button == 1 and self._dragging:
+            self._dragging = False
+            return True
+        if event.type == pygame.MOUSEWHEEL:
+            max_scroll = max(0, self.total_lines - self.visible_lines)
+            self.scroll = max(0, min(max_scroll, self.scroll - event.y))
+            return True
+
+        if not self.focused:
+            return False
+        if event.type == pygame.TEXTEDITING:
+            self.composition = event.text
+            return True
+        if event.type == pygame.TEXTINPUT:
+            self.composition = ""
+            self.insert(event.text)
+            self._goal_x = None
+            self._ensure_visible()
+            return True
+        if event.type == pygame.KEYDOWN:
+            return self._handle_key(event)
+        return False
+
+    def _handle_key(self, event):
+        key = event.key
+        shift = bool(event.mod & pygame.KMOD_SHIFT)
+        ctrl = bool(event.mod & (pygame.KMOD_CTRL | pygame.KMOD_META))
+        para, offset = self.cursor
+        keep_goal = False
+
+        if key == pygame.K_BACKSPACE:
+            self.backspace()
+        elif key == pygame.K_DELETE:
+            self.delete_forward()
+        elif key in (pygame.K_RETURN, pygame.K_KP_ENTER):
+            self.insert("\n")
+        elif ctrl and key == pygame.K_a:
+            self.select_all()
+        elif key == pygame.K_LEFT:
+            sel = self.selection()
+            if sel and not shift:
+                self._move(sel[0], False)
+            elif offset > 0:
+                self._move((para, offset - 1), shift)
+            elif para > 0:
+                self._move((para - 1, len(self.paragraphs[para - 1])), shift)
+        elif key == pygame.K_RIGHT:
+            sel = self.selection()
+            if sel and not shift:
+                self._move(sel[1], False)
+            elif offset < len(self.paragraphs[para]):
+                self._move((para, offset + 1), shift)
+            elif para + 1 < len(self.paragraphs):
+                self._move((para + 1, 0), shift)
+        elif key in (pygame.K_UP, pygame.K_DOWN):
+            if self._goal_x is None:
+                self._goal_x = self._x_of(self.cursor)
+            line, _ = self._line_of(self.cursor)
+            target = line - 1 if key == pygame.K_UP else line + 1
+            if 0 <= target < self.total_lines:
+                self._move(self._pos_at_line(target, self._goal_x), shift)
+            keep_goal = True
+        elif key == pygame.K_HOME:
+            if ctrl:
+                self._move((0, 0), shift)
+            else:
+                _, local = self._line_of(self.cursor)
+                self._move((para, self._starts[para][local]), shift)
+        elif key == pygame.K_END:
+            if ctrl:
+                self._move((len(self.paragraphs) - 1, len(self.paragraphs[-1])), shift)
+            else:
+                _, local = self._line_of(self.cursor)
+                start, line = self._line_text(para, local)
+                last = local + 1 == len(self._starts[para])
+                self._move((para, start + len(line if last else line.rstrip(" "))), shift)
+        else:
+            return False
+
+        if not keep_goal:
+            self._goal_x = None
+        self._ensure_visible()
+        return True
+
+    # --- Vẽ ---
+
+    def draw(self, surface):
+        left, top = self.rect.left, self.rect.top
+        sel = self.selection()
+        caret_line, _ = self._line_of(self.cursor)
+        text_height = self.font.get_height()
+        last_line = min(self.total_lines, self.scroll + self.visible_lines)
+
+        para = bisect_right(self._first_line, self.scroll) - 1
+        for line in range(self.scroll, last_line):
+            while para + 1 < len(self._first_line) and self._first_line[para + 1] <= line:
+                para += 1
+            local = line - self._first_line[para]
+            start, text = self._line_text(para, local)
+            bottom = top + (line - self.scroll) * self.line_height
+
+            if sel is not None:
+                lo = max(sel[0], (para, start))
+                hi = min(sel[1], (para, start + len(text)))
+                if lo < hi:
+                    x0 = self.font.size(text[:lo[1] - start])[0]
+                    x1 = self.font.size(text[:hi[1] - start])[0]
+                    pygame.draw.rect(surface, self.selection_color,
+                                     (left + x0, bottom - text_height, max(2, x1 - x0), text_height))
+
+            if line == caret_line and self.composition:
+                split = self.cursor[1] - start
+                text = text[:split] + self.composition + text[split:]
+                x0 = self.font.size(text[:split])[0]
+                x1 = x0 + self.font.size(self.composition)[0]
+                pygame.draw.line(surface, self.color, (left + x0, bottom + 1), (left + x1, bottom + 1), 1)
+
+            if text.strip(" "):
+                image = render_text(self.font, text, self.color)
+                surface.blit(image, image.get_rect(bottomleft=(left, bottom)))
+
+        if self.focused and pygame.time.get_ticks() % CARET_BLINK_MS < CARET_BLINK_MS // 2:
+            if self.scroll <= caret_line < last_line:
+                caret = self.caret_rect()
+                if self.composition:
+                    caret.x += self.font.size(self.composition)[0]
+                pygame.draw.rect(surface, self.color, caret)
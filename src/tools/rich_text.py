@@ -0,0 +1,260 @@
+# file: rich_text.py
+import re
+import pygame
+from collections import OrderedDict
+from src.utils.font_registry import fonts
+from src.utils.text_cache import render_text
+from .text_layout import _break_long_word
+
+# Cú pháp đánh dấu trong "description" của manh mối:
+#   **chữ đậm**   *chữ nghiêng*   {red:từ khóa màu}
+#   [[Tên manh mối]]   [[Tên manh mối|chữ hiển thị]]   [[7|chữ hiển thị]] (theo id)
+_MARKUP_RE = re.compile(r"\*\*(.+?)\*\*|\*(.+?)\*|\{(\w+):(.+?)\}|\[\[(.+?)\]\]")
+_PIECE_RE = re.compile(r"[^ ]+ *| +")
+
+KEYWORD_COLORS = {
+    "red": (170, 20, 20),
+    "blue": (20, 60, 160),
+    "green": (20, 110, 40),
+    "gold": (150, 100, 0),
+    "gray": (110, 100, 90),
+}
+LINK_COLOR = (0, 100, 200)
+
+RICH_LAYOUT_CACHE_SIZE = 128
+
+
+class TextStyle:
+    """Kiểu của một đoạn chữ (bất biến, dùng làm key)."""
+    __slots__ = ("bold", "italic", "color", "link")
+
+    def __init__(self, bold=False, italic=False, color=None, link=None):
+        self.bold = bold
+        self.italic = italic
+        self.color = color  # None = màu mặc định của người vẽ
+        self.link = link    # tên / id manh mối đích
+
+    def _key(self):
+        return (self.bold, self.italic, self.color, self.link)
+
+    def __eq__(self, other):
+        return isinstance(other, TextStyle) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+
+PLAIN = TextStyle()
+
+
+def has_markup(text):
+    return _MARKUP_RE.search(text) is not None
+
+
+def parse_markup(text):
+    """Tách text thành danh sách (đoạn chữ, TextStyle)."""
+    runs = []
+    pos = 0
+    for match in _MARKUP_RE.finditer(text):
+        if match.start() > pos:
+            runs.append((text[pos:match.start()], PLAIN))
+        bold, italic, color_name, colored, link = match.groups()
+        if bold is not None:
+            runs.append((bold, TextStyle(bold=True)))
+        elif italic is not None:
+            runs.append((italic, TextStyle(italic=True)))
+        elif colored is not None:
+            runs.append((colored, TextStyle(bold=True, color=KEYWORD_COLORS.get(color_name.lower()))))
+        else:
+            target, _, label = link.partition("|")
+            runs.append((label or target, TextStyle(link=target.strip())))
+        pos = match.end()
+    if pos < len(text):
+        runs.append((text[pos:], PLAIN))
+    return runs
+
+
+def plain_text(text):
+    """Bỏ ký hiệu đánh dấu, chỉ giữ chữ hiển thị (dùng cho tìm kiếm)."""
+    return "".join(run for run, _ in parse_markup(text)) if has_markup(text) else text
+
+
+class RichLayout:
+    """
+    Kết quả xuống dòng của text có đánh dấu.
+
+    lines: mỗi dòng là danh sách (x, text, font, style) đã đo sẵn.
+    links: (dòng, x, width, height, đích) - hộp click tương đối so với đáy dòng.
+    """
+    __slots__ = ("lines", "links", "line_height")
+
+    def __init__(self, lines, links, line_height):
+        self.lines = lines
+        self.links = links
+        self.line_height = line_height
+
+    def fits(self, max_lines):
+        return len(self.lines) <= max_lines
+
+    def draw(self, surface, color, rect, link_color=LINK_COLOR):
+        """
+        Vẽ từng dòng (bottomleft) từ rect.top như TextLayout.draw.
+        Trả về danh sách (Rect, đích) của các link đã vẽ, theo tọa độ của surface.
+        """
+        y = rect.top
+        drawn = 0
+        for fragments in self.lines:
+            if y > rect.bottom:
+                break
+            for x, text, font, style in fragments:
+                if style.link is not None:
+                    frag_color = link_color
+                else:
+                    frag_color = style.color or color
+                image = render_text(font, text, frag_color)
+                surface.blit(image, image.get_rect(bottomleft=(rect.left + x, y)))
+            y += self.line_height
+            drawn += 1
+
+        boxes = []
+        for line, x, width, height, target in self.links:
+            if line >= drawn:
+                break
+            bottom = rect.top + line * self.line_height
+            box = pygame.Rect(rect.left + x, bottom - height, width, height)
+            pygame.draw.line(surface, link_color, (box.left, bottom - 2), (box.right, bottom - 2), 1)
+            boxes.append((box, target))
+        return boxes
+
+
+def _style_font(font, style):
+    if style.bold or style.italic:
+        return fonts.variant(font, style.bold, style.italic)
+    return font
+
+
+def _atoms(runs):
+    """Gom các đoạn thành "token" (một từ + khoảng trắng sau), có thể gồm nhiều kiểu chữ."""
+    atom = []
+    for text, style in runs:
+        for paragraph_index, paragraph in enumerate(text.split("\n")):
+            if paragraph_index:
+                if atom:
+                    yield atom
+                    atom = []
+                yield None  # xuống đoạn
+            for piece in _PIECE_RE.findall(paragraph):
+                atom.append((piece, style))
+                if piece.endswith(" "):
+                    yield atom
+                    atom = []
+    if atom:
+        yield atom
+
+
+def _finish_line(fragments, base_font):
+    """Bỏ khoảng trắng cuối, gộp các mảnh cùng kiểu rồi tính vị trí x."""
+    while fragments and not fragments[-1][0].rstrip(" "):
+        fragments.pop()
+    if fragments:
+        text, style = fragments[-1]
+        fragments[-1] = (text.rstrip(" "), style)
+
+    merged = []
+    for text, style in fragments:
+        if merged and merged[-1][1] == style:
+            merged[-1] = (merged[-1][0] + text, style)
+        else:
+            merged.append((text, style))
+
+    line = []
+    x = 0
+    for text, style in merged:
+        font = _style_font(base_font, style)
+        line.append((x, text, font, style))
+        x += fonts.text_width(font, text)
+    return line
+
+
+def _layout(text, font, width, line_height):
+    lines = []
+    line = []
+    line_width = 0
+
+    for atom in _atoms(parse_markup(text)):
+        if atom is None:
+            lines.append(line)
+            line, line_width = [], 0
+            continue
+
+        widths = [fonts.text_width(_style_font(font, style), piece) for piece, style in atom]
+        token_width = sum(widths)
+        last_piece, last_style = atom[-1]
+        trailing = len(last_piece) - len(last_piece.rstrip(" "))
+        word_width = token_width
+        if trailing:
+            word_width -= fonts.text_width(_style_font(font, last_style), " " * trailing)
+
+        if line_width + word_width <= width:
+            line.extend(atom)
+            line_width += token_width
+            continue
+
+        if line:
+            lines.append(line)
+            line, line_width = [], 0
+
+        if word_width > width and len(atom) == 1:
+            piece, style = atom[0]
+            word = piece.rstrip(" ")
+            pieces = _break_long_word(word, _style_font(font, style), width)
+            lines.extend([(p, style)] for p in pieces[:-1])
+            atom = [(pieces[-1] + piece[len(word):], style)]
+            token_width = fonts.text_width(_style_font(font, style), atom[0][0])
+
+        if atom[0][0].strip(" ") or len(atom) > 1:
+            line.extend(atom)
+            line_width = token_width
+
+    if line:
+        lines.append(line)
+
+    laid_out = [_finish_line(fragments, font) for fragments in lines]
+
+    links = []
+    for index, fragments in enumerate(laid_out):
+        for x, piece, piece_font, style in fragments:
+            if style.link is None:
+                continue
+            piece_width = fonts.text_width(piece_font, piece)
+            last = links[-1] if links else None
+            # Link bị cắt thành nhiều mảnh liền nhau trên cùng dòng -> 1 hộp
+            if last and last[0] == index and last[4] == style.link and last[1] + last[2] == x:
+                links[-1] = (index, last[1], last[2] + piece_width, last[3], style.link)
+            else:
+                links.append((index, x, piece_width, piece_font.get_height(), style.link))
+    return RichLayout(laid_out, links, line_height)
+
+
+_rich_cache = OrderedDict()
+
+
+def layout_rich_text(text, font, width, line_height=None):
+    """
+    Tính xuống dòng cho text có đánh dấu; kết quả (kể cả hộp click của link)
+    được ghi nhớ theo (text, font, width, line_height).
+    """
+    if line_height is None:
+        line_height = font.get_linesize()
+    width = int(width)
+    key = (text, font, width, line_height)
+    layout = _rich_cache.get(key)
+    if layout is not None:
+        _rich_cache.move_to_end(key)
+        return layout
+
+    layout = _layout(text, font, width, line_height)
+    _rich_cache[key] = layout
+    if len(_rich_cache) > RICH_LAYOUT_CACHE_SIZE:
+        _rich_cache.popitem(last=False)
+    return layout
@@ -0,0 +1,94 @@
+# file: scene_analyzer.py
+# Kiểm tra khả năng đi tới của các scene (xem scenes/reachability.py).
+#
+#   python src/tools/scene_analyzer.py                 # cả 9 scene, ảnh vào saves/analysis
+#   python src/tools/scene_analyzer.py sloth_case --no-images
+#
+# Mã thoát 1 nếu có mục tiêu không tới được hoặc vị trí bắt đầu kẹt trong
+# tường, để chạy sau mỗi lần sửa nội dung scene.
+import argparse
+import os
+import sys
+import time
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_ROOT = os.path.dirname(SRC_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import pygame
+
+from src.scenes.reachability import analyze, render_heatmap
+from src.scenes.office import OfficeScene
+from src.scenes.interrogation_room import InterrogationRoomScene
+from src.scenes.greed_case import GreedCaseScene
+from src.scenes.envy_case import EnvyCaseScene
+from src.scenes.wrath_case import WrathCaseScene
+from src.scenes.sloth_case import SlothCaseScene
+from src.scenes.gluttony_case import GluttonyCaseScene
+from src.scenes.lust_case import LustCaseScene
+from src.scenes.pride_case import PrideCaseScene
+
+# Cùng thứ tự và kích thước với Game.init_scenes
+SCREEN_SIZE = (1280, 720)
+SCENES = {
+    "office": OfficeScene,
+    "interrogation_room": InterrogationRoomScene,
+    "greed_case": GreedCaseScene,
+    "envy_case": EnvyCaseScene,
+    "wrath_case": WrathCaseScene,
+    "sloth_case": SlothCaseScene,
+    "gluttony_case": GluttonyCaseScene,
+    "lust_case": LustCaseScene,
+    "pride_case": PrideCaseScene,
+}
+DEFAULT_OUT_DIR = os.path.join("saves", "analysis")
+
+
+def build_scene(name: str):
+    """Dựng scene như trong game (log lúc load được ẩn)."""
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        return SCENES[name](*SCREEN_SIZE)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Reachability / stuck-spot analysis of the game scenes.")
+    parser.add_argument("scenes", nargs="*", choices=[[]] + list(SCENES), metavar="scene",
+                        help=f"scenes to analyze (default: all): {', '.join(SCENES)}")
+    parser.add_argument("--out", default=DEFAULT_OUT_DIR, help="heatmap directory (relative to src/)")
+    parser.add_argument("--no-images", action="store_true", help="skip the heatmap PNGs")
+    args = parser.parse_args(argv)
+
+    os.chdir(SRC_DIR)  # đường dẫn asset tương đối với src/, như khi chạy game
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode(SCREEN_SIZE)
+
+    started = time.perf_counter()
+    problems = 0
+    for name in args.scenes or list(SCENES):
+        scene = build_scene(name)
+        if not hasattr(scene, "collision_rects"):
+            print(f"{name}: no collision geometry, skipped")
+            continue
+        report = analyze(scene, name)
+        problems += report.problems
+        print(report.summary())
+        if not args.no_images:
+            os.makedirs(args.out, exist_ok=True)
+            path = os.path.join(args.out, f"{name}.png")
+            pygame.image.save(render_heatmap(report, scene.background), path)
+            print(f"   heatmap: {path}")
+
+    print(f"{'✅' if not problems else '⚠️ '} {problems} problem(s), {time.perf_counter() - started:.1f}s")
+    pygame.quit()
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
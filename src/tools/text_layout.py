@@ -0,0 +1,135 @@
+# file: text_layout.py
+import re
+from collections import OrderedDict
+from src.utils.font_registry import fonts
+from src.utils.text_cache import render_text
+
+# Một token = một từ + khoảng trắng phía sau (hoặc một dãy khoảng trắng đầu đoạn)
+_TOKEN_RE = re.compile(r"[^ ]+ *| +")
+
+LAYOUT_CACHE_SIZE = 256
+
+
+class TextLayout:
+    """Kết quả xuống dòng của một đoạn văn: danh sách dòng đã tính sẵn."""
+    __slots__ = ("lines", "width", "line_height")
+
+    def __init__(self, lines, width, line_height):
+        self.lines = lines
+        self.width = width
+        self.line_height = line_height
+
+    def fits(self, max_lines):
+        return len(self.lines) <= max_lines
+
+    def draw(self, surface, font, color, rect, aa=True, bkg=None):
+        """Vẽ từng dòng (bottomleft) từ rect.top; trả về phần chữ không vẽ được."""
+        y = rect.top
+        drawn = 0
+        for line in self.lines:
+            if y > rect.bottom:
+                break
+            if line:
+                image = render_text(font, line, color, aa, bkg)
+                surface.blit(image, image.get_rect(bottomleft=(rect.left, y)))
+            y += self.line_height
+            drawn += 1
+        return " ".join(self.lines[drawn:])
+
+
+def _break_long_word(word, font, width):
+    """Tách một từ dài hơn chiều rộng bằng tìm kiếm nhị phân trên độ dài tiền tố."""
+    pieces = []
+    while word:
+        lo, hi = 1, len(word)
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if fonts.text_width(font, word[:mid]) <= width:
+                lo = mid
+            else:
+                hi = mid - 1
+        pieces.append(word[:lo])
+        word = word[lo:]
+    return pieces
+
+
+def line_spans(paragraph, font, width):
+    """
+    Vị trí xuống dòng của một đoạn (không chứa "\n"): danh sách (start, end)
+    sao cho dòng i là paragraph[start:end] (có thể còn khoảng trắng cuối).
+    Đoạn rỗng trả về [].
+    """
+    spans = []
+    line_start = None
+    line_end = 0
+    line_width = 0  # tổng độ rộng các token (prefix sum của dòng hiện tại)
+
+    for match in _TOKEN_RE.finditer(paragraph):
+        token = match.group()
+        start = match.start()
+        word = token.rstrip(" ")
+        token_width = fonts.text_width(font, token)
+        word_width = fonts.text_width(font, word) if word != token else token_width
+
+        if line_width + word_width <= width:
+            if line_start is None:
+                line_start = start
+            line_width += token_width
+            line_end = match.end()
+            continue
+
+        if line_start is not None:
+            spans.append((line_start, line_end))
+            line_start, line_width = None, 0
+
+        if word_width > width:
+            pieces = _break_long_word(word, font, width)
+            for piece in pieces[:-1]:
+                spans.append((start, start + len(piece)))
+                start += len(piece)
+            token = paragraph[start:match.end()]
+            token_width = fonts.text_width(font, token)
+
+        if token.strip(" "):
+            line_start = start
+            line_width = token_width
+            line_end = match.end()
+
+    if line_start is not None:
+        spans.append((line_start, line_end))
+    return spans
+
+
+def _wrap_paragraph(paragraph, font, width):
+    return [paragraph[start:end].rstrip(" ") for start, end in line_spans(paragraph, font, width)]
+
+
+_layout_cache = OrderedDict()
+
+
+def layout_text(text, font, width, line_height=None):
+    """
+    Tính xuống dòng cho text với font và chiều rộng cho trước.
+
+    Độ rộng mỗi từ chỉ được đo một lần cho mỗi font (cache trong FontRegistry),
+    và kết quả được ghi nhớ theo (text, font, width, line_height) để check_text_fit
+    và draw_text dùng chung một layout.
+    """
+    if line_height is None:
+        line_height = font.get_linesize()
+    width = int(width)
+    key = (text, font, width, line_height)
+    layout = _layout_cache.get(key)
+    if layout is not None:
+        _layout_cache.move_to_end(key)
+        return layout
+
+    lines = []
+    for paragraph in text.split("\n"):
+        lines.extend(_wrap_paragraph(paragraph, font, width) or [""])
+    layout = TextLayout(lines, width, line_height)
+
+    _layout_cache[key] = layout
+    if len(_layout_cache) > LAYOUT_CACHE_SIZE:
+        _layout_cache.popitem(last=False)
+    return layout
@@ -1,5 +1,7 @@
 import pygame
 from typing import Optional, Callable, Tuple, Any
+from src.utils.text_cache import render_text
+from src.utils.font_registry import fonts
 
 class Button:
     """Interactive button with hover and click states using sprite frames"""
@@ -24,7 +26,7 @@ class Button:
         self._is_clicked = False
         self.on_click = on_click
 
-    def update(self):
+    def update(self, mouse_pos: Optional[Tuple[int, int]] = None, mouse_pressed: Optional[bool] = None):
         """
         Update the button state based on mouse interaction
         
@@ -32,12 +34,19 @@ class Button:
         - Frame 0: Normal state
         - Frame 1: Hover state
         - Frame 2: Clicked state
+
+        Args:
+            mouse_pos: Mouse position polled once by the caller (polled here if None)
+            mouse_pressed: Left mouse button state (polled here if None)
         """
-        mouse_pos = pygame.mouse.get_pos()
+        if mouse_pos is None:
+            mouse_pos = pygame.mouse.get_pos()
+        if mouse_pressed is None:
+            mouse_pressed = pygame.mouse.get_pressed()[0]
         if self.rect.collidepoint(mouse_pos):
             self.frame = 1
             self._is_hover = True
-            if pygame.mouse.get_pressed()[0]: 
+            if mouse_pressed: 
                 self.frame = 2
                 self._is_clicked = True
             else:
@@ -61,6 +70,19 @@ class Button:
         source_rect = pygame.Rect(self.frame * self.frame_width, 0, self.frame_width, self.frame_height)
         screen.blit(self.image, self.rect, source_rect)
 
+    def get_frames(self) -> list[pygame.Surface]:
+        """
+        Slice the sprite sheet into one surface per frame (normal, hover, clicked)
+        
+        Returns:
+            list[pygame.Surface]: Frame surfaces, used by the HUD compositor
+        """
+        split = self.image.get_width() // self.frame_width
+        return [
+            self.image.subsurface(pygame.Rect(i * self.frame_width, 0, self.frame_width, self.frame_height))
+            for i in range(split)
+        ]
+
     def is_hover(self):
         """
         Check if the mouse is hovering over the button
@@ -111,7 +133,7 @@ class TextButton:
         self.border_width = border_width
         self.on_click = on_click
         
-        self.font = pygame.font.Font(None, self.font_size)
+        self.font = fonts.font(None, self.font_size)
         
         self._is_hover = False
         self._is_clicked = False
@@ -119,7 +141,7 @@ class TextButton:
         self._update_rect()
 
     def _update_rect(self):
-        text_surf = self.font.render(self.text, True, self.normal_text)
+        text_surf = render_text(self.font, self.text, self.normal_text)
         self.width = text_surf.get_width() + self.padding * 2
         self.height = text_surf.get_height() + self.padding * 2
         self.rect = pygame.Rect(self.position[0], self.position[1], self.width, self.height)
@@ -160,6 +182,6 @@ class TextButton:
             pygame.draw.rect(screen, self.border_color, self.rect, self.border_width)
             
         # Draw text
-        text_surf = self.font.render(self.text, True, text_color)
+        text_surf = render_text(self.font, self.text, text_color)
         text_rect = text_surf.get_rect(center=self.rect.center)
         screen.blit(text_surf, text_rect)
@@ -0,0 +1,138 @@
+import pygame
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+class HudWidget:
+    """One icon of the HUD with its pre-rendered state variants"""
+
+    def __init__(self, name: str, rect: pygame.Rect, frames: Sequence[pygame.Surface]) -> None:
+        """
+        Args:
+            name: Unique widget name inside the layer
+            rect: Screen-space rect of the widget
+            frames: Surfaces indexed by state (0: idle, 1: hover, 2: pressed).
+                    Missing states fall back to the previous one.
+        """
+        self.name = name
+        self.rect = pygame.Rect(rect)
+        self.frames: List[pygame.Surface] = list(frames)
+        self.frame = 0
+        self.visible = True
+
+    def current_surface(self) -> pygame.Surface:
+        return self.frames[min(self.frame, len(self.frames) - 1)]
+
+
+class HudLayer:
+    """
+    Retained-mode compositor for the always-on HUD icons (notebook, inventory,
+    menu, map, journal).
+
+    The widgets are composited once into a single surface covering their
+    union rect. As long as no widget changes hover/pressed state or
+    visibility, drawing the layer costs exactly one blit. Popups drawn
+    between two groups of icons need one layer per group.
+    """
+
+    IDLE = 0
+    HOVER = 1
+    PRESSED = 2
+
+    def __init__(self) -> None:
+        self.widgets: Dict[str, HudWidget] = {}
+        self._order: List[HudWidget] = []
+        self._surface: Optional[pygame.Surface] = None
+        self._bounds = pygame.Rect(0, 0, 0, 0)
+        self._dirty = True
+        self.composite_count = 0
+
+    def add_widget(self, name: str, rect: pygame.Rect, frames: Sequence[pygame.Surface]) -> HudWidget:
+        """
+        Register a widget. Widgets are composited in insertion order.
+
+        Returns:
+            HudWidget: The registered widget
+        """
+        widget = HudWidget(name, rect, frames)
+        if name in self.widgets:
+            self._order.remove(self.widgets[name])
+        self.widgets[name] = widget
+        self._order.append(widget)
+        self._dirty = True
+        return widget
+
+    def set_frame(self, name: str, frame: int) -> None:
+        """Set the state of a widget; only marks the layer dirty on change"""
+        widget = self.widgets[name]
+        if widget.frame != frame:
+            widget.frame = frame
+            self._dirty = True
+
+    def set_visible(self, name: str, visible: bool) -> None:
+        widget = self.widgets[name]
+        if widget.visible != visible:
+            widget.visible = visible
+            self._dirty = True
+
+    def update_hover(self, name: str, mouse_pos: Tuple[int, int], mouse_pressed: bool = False) -> bool:
+        """
+        Derive the widget state from the mouse for widgets that have no
+        state machine of their own.
+
+        Returns:
+            bool: True if the mouse is over the widget
+        """
+        widget = self.widgets[name]
+        hovered = widget.visible and widget.rect.collidepoint(mouse_pos)
+        if not hovered:
+            self.set_frame(name, self.IDLE)
+        elif mouse_pressed and len(widget.frames) > self.PRESSED:
+            self.set_frame(name, self.PRESSED)
+        else:
+            self.set_frame(name, self.HOVER)
+        return hovered
+
+    def invalidate(self) -> None:
+        self._dirty = True
+
+    def _composite(self) -> None:
+        visible = [w for w in self._order if w.visible]
+        if not visible:
+            self._surface = None
+            self._dirty = False
+            return
+
+        self._bounds = visible[0].rect.unionall([w.rect for w in visible[1:]])
+        if self._surface is None or self._surface.get_size() != self._bounds.size:
+            self._surface = pygame.Surface(self._bounds.size, pygame.SRCALPHA)
+        self._surface.fill((0, 0, 0, 0))
+
+        for widget in visible:
+            self._surface.blit(
+                widget.current_surface(),
+                (widget.rect.x - self._bounds.x, widget.rect.y - self._bounds.y)
+            )
+        self._dirty = False
+        self.composite_count += 1
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """Blit the HUD, re-compositing only if a widget state changed"""
+        if self._dirty:
+            self._composite()
+        if self._surface is not None:
+            screen.blit(self._surface, self._bounds.topleft)
+
+
+def make_outline_frames(surface: pygame.Surface, hover_color: Tuple[int, int, int],
+                        width: int = 2) -> List[pygame.Surface]:
+    """
+    Build [idle, hover] frames for an icon whose hover state is an outline
+
+    Args:
+        surface: Idle icon surface
+        hover_color: Outline color drawn on the hover variant
+        width: Outline width in pixels
+    """
+    hover = surface.copy()
+    pygame.draw.rect(hover, hover_color, hover.get_rect(), width)
+    return [surface, hover]
@@ -2,6 +2,7 @@ import pygame
 from .button import Button
 from .map_button import MapButton
 from .popups import MenuPopup
+from .hud import HudLayer
 from typing import Optional, Callable
 
 MAIN_MENU_IMG = "assets/images/ui/menu-button.png"
@@ -46,6 +47,24 @@ class MainSceneUi:
             on_building_click=on_building_click or self._default_building_click_handler
         )
         self.journal_button = Button(position=(10, self.map_button.rect.bottom + 10), image=journal_img, scale=2, split=3)
+
+        # HUD compositor (optional) - khi được gắn, các button không tự vẽ nữa
+        self.hud: Optional[HudLayer] = None
+
+    def _hud_buttons(self):
+        return (("menu", self.menu_button), ("journal", self.journal_button), ("map", self.map_button))
+
+    def attach_hud(self, hud: HudLayer):
+        """
+        Đăng ký các button Menu, Map, Journal vào HUD compositor. Layer này được
+        vẽ trong draw(), dưới popup bản đồ và popup menu
+
+        Args:
+            hud: HudLayer riêng của các button này
+        """
+        self.hud = hud
+        for name, button in self._hud_buttons():
+            hud.add_widget(name, button.rect, button.get_frames())
     
     def _default_building_click_handler(self, building_id: str):
         """
@@ -81,9 +100,13 @@ class MainSceneUi:
 # main_scene.py (trong class MainSceneUi)
     def update(self):
         """Cập nhật trạng thái UI"""
+        # Đọc chuột một lần cho tất cả các button
+        mouse_pos = pygame.mouse.get_pos()
+        mouse_pressed = pygame.mouse.get_pressed()[0]
+
         # Cập nhật các nút toggle (Menu, Map) để cho phép đóng popup
-        self.menu_button.update()
-        self.map_button.update()
+        self.menu_button.update(mouse_pos, mouse_pressed)
+        self.map_button.update(mouse_pos, mouse_pressed)
         
         is_menu_open = self.menu_popup.is_open()
 
@@ -91,14 +114,23 @@ class MainSceneUi:
             self.menu_popup.update()
             # Các nút khác chỉ được cập nhật khi menu không mở
         else:
-            self.journal_button.update()
+            self.journal_button.update(mouse_pos, mouse_pressed)
             # self.map_button đã được update ở trên
+
+        if self.hud is not None:
+            for name, button in self._hud_buttons():
+                self.hud.set_frame(name, button.frame)
             
     def draw(self, screen: pygame.Surface):
 
-        self.menu_button.draw(screen)
-        self.journal_button.draw(screen)
-        self.map_button.draw(screen)
+        if self.hud is None:
+            self.menu_button.draw(screen)
+            self.journal_button.draw(screen)
+            self.map_button.draw(screen)
+        else:
+            # Các button: một lần blit từ HUD, rồi tới popup bản đồ
+            self.hud.draw(screen)
+            self.map_button.map_popup.draw(screen)
         
         if self.menu_popup.is_open():
             self.menu_popup.draw(screen)
\ No newline at end of file
@@ -137,9 +137,9 @@ class MapButton(Button):
         # GIỮ NGUYÊN: self.was_clicked
         self.was_clicked = False
     
-    def update(self):
+    def update(self, mouse_pos: Optional[tuple[int, int]] = None, mouse_pressed: Optional[bool] = None):
         """Cập nhật trạng thái button và xử lý click"""
-        super().update() # Cập nhật self._is_clicked của Button
+        super().update(mouse_pos, mouse_pressed) # Cập nhật self._is_clicked của Button
         
         # GIỮ NGUYÊN: Logic click edge-triggered (khắc phục lỗi gọi 2 lần, giữ nguyên hành vi cũ)
         if self.is_clicked() and not self.was_clicked:
@@ -1,4 +1,6 @@
 import pygame
+from src.utils.text_cache import render_text
+from src.utils.font_registry import fonts
 
 class Tooltip:
     """Independent tooltip class for displaying hover information"""
@@ -25,8 +27,8 @@ class Tooltip:
         self.padding = padding
         
         # Create font and render text
-        self.font = pygame.font.Font(None, font_size)
-        self.text_surface = self.font.render(text, True, text_color)
+        self.font = fonts.font(None, font_size)
+        self.text_surface = render_text(self.font, text, text_color)
         
         # Calculate tooltip dimensions
         self.width = self.text_surface.get_width() + padding * 2
@@ -0,0 +1,92 @@
+import pygame
+from typing import Tuple
+
+
+class Camera:
+    """
+    Viewport of a scene whose world can be larger than the screen.
+
+    The camera keeps its target inside a dead-zone (a centred box covering
+    `dead_zone` of the view) and eases towards it by `smoothing` of the
+    remaining distance per update, always clamped to the world. Drawing code
+    subtracts `offset` from world positions; `rect` is the visible part of the
+    world, for culling.
+    """
+
+    def __init__(self, view_size: Tuple[int, int], world_size: Tuple[int, int],
+                 dead_zone: Tuple[float, float] = (0.3, 0.3), smoothing: float = 0.15) -> None:
+        """
+        Args:
+            view_size: Screen size in pixels
+            world_size: World size in pixels (at least the view size is used)
+            dead_zone: Size of the dead-zone as a fraction of the view (0 = always centred)
+            smoothing: Fraction of the distance covered per update (1 = no easing)
+        """
+        self.view_width, self.view_height = view_size
+        self.dead_zone = dead_zone
+        self.smoothing = smoothing
+        self.x = 0.0
+        self.y = 0.0
+        self.set_world_size(world_size)
+
+    def set_world_size(self, world_size: Tuple[int, int]) -> None:
+        self.world_width = max(int(world_size[0]), self.view_width)
+        self.world_height = max(int(world_size[1]), self.view_height)
+        self.x, self.y = self._clamp(self.x, self.y)
+
+    @property
+    def scrolls(self) -> bool:
+        """False when the whole world fits on screen (the offset is always (0, 0))."""
+        return self.world_width > self.view_width or self.world_height > self.view_height
+
+    @property
+    def offset(self) -> Tuple[int, int]:
+        """Top-left of the view in world coordinates, in whole pixels (no shimmering)."""
+        return round(self.x), round(self.y)
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """Visible part of the world."""
+        return pygame.Rect(self.offset, (self.view_width, self.view_height))
+
+    def _clamp(self, x: float, y: float) -> Tuple[float, float]:
+        return (min(max(x, 0.0), float(self.world_width - self.view_width)),
+                min(max(y, 0.0), float(self.world_height - self.view_height)))
+
+    def _target(self, rect: pygame.Rect) -> Tuple[float, float]:
+        """Closest camera position that keeps `rect`'s centre inside the dead-zone."""
+        zone_w = self.view_width * self.dead_zone[0] / 2
+        zone_h = self.view_height * self.dead_zone[1] / 2
+        cx = self.x + self.view_width / 2
+        cy = self.y + self.view_height / 2
+        tx, ty = rect.center
+        x = self.x + (tx - (cx + zone_w) if tx > cx + zone_w else tx - (cx - zone_w) if tx < cx - zone_w else 0)
+        y = self.y + (ty - (cy + zone_h) if ty > cy + zone_h else ty - (cy - zone_h) if ty < cy - zone_h else 0)
+        return self._clamp(x, y)
+
+    def update(self, target: pygame.Rect) -> None:
+        """Eases towards the dead-zone position of `target` (call once per frame)."""
+        if not self.scrolls:
+            return
+        x, y = self._target(target)
+        self.x += (x - self.x) * self.smoothing
+        self.y += (y - self.y) * self.smoothing
+        if abs(x - self.x) < 0.5 and abs(y - self.y) < 0.5:
+            self.x, self.y = x, y
+
+    def center_on(self, target: pygame.Rect) -> None:
+        """Jumps to `target` without easing (scene change, teleport)."""
+        self.x, self.y = self._clamp(target.centerx - self.view_width / 2, target.centery - self.view_height / 2)
+
+    def to_screen(self, pos: Tuple[int, int]) -> Tuple[int, int]:
+        ox, oy = self.offset
+        return pos[0] - ox, pos[1] - oy
+
+    def to_world(self, pos: Tuple[int, int]) -> Tuple[int, int]:
+        ox, oy = self.offset
+        return pos[0] + ox, pos[1] + oy
+
+    def apply(self, rect: pygame.Rect) -> pygame.Rect:
+        """`rect` moved from world to screen coordinates (a new Rect)."""
+        ox, oy = self.offset
+        return rect.move(-ox, -oy)
@@ -0,0 +1,128 @@
+import weakref
+import pygame
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+FontKey = Tuple[Optional[str], int, bool, bool]
+
+
+class FontRegistry:
+    """
+    Process-wide memo of pygame Font objects.
+
+    Fonts are keyed by (path or system name, size, bold, italic), so every
+    caller asking for the same font shares one object. Missing font files
+    are resolved to their fallback once and never probed again, and
+    `SysFont` lookups (which scan the system fonts) run once per key.
+
+    The registry also caches glyph advances and text widths per font, used
+    by the text layout code to avoid re-measuring the same strings. The
+    width cache is an LRU bounded per font, since its keys are arbitrary
+    strings (player notes, search queries) rather than a fixed glyph set.
+    """
+
+    def __init__(self, max_widths: int = 4096) -> None:
+        """
+        Args:
+            max_widths: Number of memoized text widths kept per font
+        """
+        self.max_widths = max_widths
+        self._fonts: Dict[FontKey, pygame.font.Font] = {}
+        self._keys: Dict[int, Tuple[FontKey, Optional[int]]] = {}  # id(font) -> (key, fallback_size)
+        self._missing_paths: set = set()
+        self._advances: "weakref.WeakKeyDictionary[pygame.font.Font, Dict[str, int]]" = weakref.WeakKeyDictionary()
+        self._widths: "weakref.WeakKeyDictionary[pygame.font.Font, OrderedDict[str, int]]" = weakref.WeakKeyDictionary()
+        self.created = 0
+
+    def font(self, path: Optional[str], size: int, bold: bool = False, italic: bool = False,
+             fallback_size: Optional[int] = None) -> pygame.font.Font:
+        """
+        Get a font loaded from a file (or pygame's default font if path is None).
+
+        Args:
+            path: Font file path, None for the default font
+            size: Point size
+            bold, italic: Style emulation flags
+            fallback_size: Size of the default font used if the file is missing
+                           (defaults to `size`)
+        """
+        key = (path, size, bold, italic)
+        font = self._fonts.get(key)
+        if font is not None:
+            return font
+
+        if path is not None and path not in self._missing_paths:
+            try:
+                font = pygame.font.Font(path, size)
+            except (FileNotFoundError, OSError):
+                print(f"⚠️  Font not found: {path}. Using default font.")
+                self._missing_paths.add(path)
+        if font is None:
+            font = self.font(None, fallback_size or size, bold, italic) if path is not None else pygame.font.Font(None, size)
+
+        font.set_bold(bold)
+        font.set_italic(italic)
+        self._fonts[key] = font
+        self._keys.setdefault(id(font), (key, fallback_size))
+        self.created += 1
+        return font
+
+    def sysfont(self, name: str, size: int, bold: bool = False, italic: bool = False) -> pygame.font.Font:
+        """Get a system font; the system font scan happens once per key."""
+        key = ("sys:" + name, size, bold, italic)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+            self._fonts[key] = font
+            self._keys[id(font)] = (key, None)
+            self.created += 1
+        return font
+
+    def variant(self, font: pygame.font.Font, bold: bool = False, italic: bool = False) -> pygame.font.Font:
+        """
+        Bold/italic version of a font obtained from this registry
+        (fonts created elsewhere are returned unchanged).
+        """
+        entry = self._keys.get(id(font))
+        if entry is None:
+            return font
+        (path, size, _, _), fallback_size = entry
+        if path is not None and path.startswith("sys:"):
+            return self.sysfont(path[4:], size, bold, italic)
+        return self.font(path, size, bold, italic, fallback_size)
+
+    # --- Metrics caches ---
+
+    def advance(self, font: pygame.font.Font, char: str) -> int:
+        """Horizontal advance of a single glyph."""
+        advances = self._advances.get(font)
+        if advances is None:
+            advances = self._advances[font] = {}
+        value = advances.get(char)
+        if value is None:
+            metrics = font.metrics(char)
+            value = metrics[0][4] if metrics and metrics[0] else font.size(char)[0]
+            advances[char] = value
+        return value
+
+    def text_width(self, font: pygame.font.Font, text: str) -> int:
+        """Rendered width of a string (memoized in a per-font LRU, includes kerning)."""
+        widths = self._widths.get(font)
+        if widths is None:
+            widths = self._widths[font] = OrderedDict()
+        value = widths.get(text)
+        if value is not None:
+            widths.move_to_end(text)
+            return value
+        value = widths[text] = font.size(text)[0]
+        if len(widths) > self.max_widths:
+            widths.popitem(last=False)
+        return value
+
+    def clear_metrics(self) -> None:
+        self._advances.clear()
+        self._widths.clear()
+
+
+# Shared registry
+fonts = FontRegistry()
@@ -1,31 +1,34 @@
 import pygame
 from typing import Callable
+from src.utils.text_cache import render_text
+from src.utils.font_registry import fonts
 
 class InteractionArea:
     """
     Represents a 2D area that a player can enter and interact with.
     When the player is inside, it displays an "[F]" prompt and listens for
     an interaction key press to trigger a callback function.
+    Scenes drive their areas through a TriggerManager (see trigger_manager.py);
+    update() / handle_event() remain for standalone use.
     """
-    def __init__(self, rect: pygame.Rect, callback: Callable):
+    def __init__(self, rect: pygame.Rect, callback: Callable, priority: int = 0):
         """
         Initializes the InteractionArea.
 
         Args:
             rect: A pygame.Rect defining the trigger area.
             callback: The function to call when the interaction is triggered.
+            priority: When areas overlap, the interact key goes to the highest priority.
         """
         self.rect = rect
         self.callback = callback
+        self.priority = priority
         self.player_is_inside = False
 
-        # Basic font and render for the "[F]" prompt
-        try:
-            self.font = pygame.font.Font("src/assets/fonts/Harmonic.ttf", 32)
-        except FileNotFoundError:
-            self.font = pygame.font.Font(None, 36)
+        # Basic font and render for the "[F]" prompt (shared by all areas)
+        self.font = fonts.font("src/assets/fonts/Harmonic.ttf", 32, fallback_size=36)
             
-        self.text_surface = self.font.render("[F]", True, (255, 255, 255))
+        self.text_surface = render_text(self.font, "[F]", (255, 255, 255))
         self.text_rect = self.text_surface.get_rect()
         
         # Simple background for better visibility
@@ -66,13 +69,18 @@ class InteractionArea:
             screen.blit(self.text_background, bg_rect)
             screen.blit(self.text_surface, self.text_rect)
 
-    def draw_debug(self, screen: pygame.Surface):
+    def draw_debug(self, screen: pygame.Surface, offset: tuple = (0, 0)):
         """
         Draws the boundary of the interaction area for debugging purposes.
+
+        Args:
+            screen: Surface to draw on.
+            offset: Camera offset (world -> screen), see Camera.offset.
         """
+        rect = self.rect.move(-offset[0], -offset[1])
         # Draw with a unique color to distinguish from obstacle rects
         debug_color = (0, 255, 255, 150) # Cyan
-        debug_surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        debug_surface = pygame.Surface(rect.size, pygame.SRCALPHA)
         debug_surface.fill(debug_color)
-        screen.blit(debug_surface, self.rect.topleft)
-        pygame.draw.rect(screen, (0, 255, 255), self.rect, 2)
+        screen.blit(debug_surface, rect.topleft)
+        pygame.draw.rect(screen, (0, 255, 255), rect, 2)
@@ -0,0 +1,107 @@
+import pygame
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+Cell = Tuple[int, int]
+
+
+class SpatialHash:
+    """
+    Uniform-grid broadphase for axis-aligned rects.
+
+    Each rect is registered under a hashable key in every grid cell it covers,
+    so a query only tests the rects sharing a cell with the query rect instead
+    of the whole list. Rects are copied on insert: after moving an entry, call
+    insert() again with the new rect (or rebuild the hash).
+    """
+
+    def __init__(self, cell_size: int = 64) -> None:
+        """
+        Args:
+            cell_size: Side of a grid cell in pixels (roughly the size of a typical query rect)
+        """
+        self.cell_size = cell_size
+        self._cells: Dict[Cell, List[Hashable]] = {}
+        self._cell_rects: Dict[Cell, List[pygame.Rect]] = {}  # parallel to _cells, for Rect.collidelist
+        self._rects: Dict[Hashable, pygame.Rect] = {}
+
+    def _cells_of(self, rect: pygame.Rect) -> Iterable[Cell]:
+        size = self.cell_size
+        xs = range(rect.left // size, (rect.right - 1) // size + 1)
+        for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+            for cx in xs:
+                yield cx, cy
+
+    def insert(self, key: Hashable, rect) -> None:
+        """Registers (or moves) `key`. Empty rects are ignored: they never collide."""
+        if key in self._rects:
+            self.remove(key)
+        rect = pygame.Rect(rect)
+        if rect.width <= 0 or rect.height <= 0:
+            return
+        self._rects[key] = rect
+        for cell in self._cells_of(rect):
+            self._cells.setdefault(cell, []).append(key)
+            self._cell_rects.setdefault(cell, []).append(rect)
+
+    def remove(self, key: Hashable) -> None:
+        rect = self._rects.pop(key, None)
+        if rect is None:
+            return
+        for cell in self._cells_of(rect):
+            keys = self._cells[cell]
+            index = keys.index(key)
+            del keys[index]
+            del self._cell_rects[cell][index]
+            if not keys:
+                del self._cells[cell]
+                del self._cell_rects[cell]
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._cell_rects.clear()
+        self._rects.clear()
+
+    def get(self, key: Hashable) -> Optional[pygame.Rect]:
+        return self._rects.get(key)
+
+    def query(self, rect: pygame.Rect) -> List[Hashable]:
+        """Keys of every rect colliding with `rect`, each listed once."""
+        size = self.cell_size
+        cells = self._cells
+        cell_rects = self._cell_rects
+        found = []
+        seen = set()
+        x0 = rect.left // size
+        x1 = (rect.right - 1) // size + 1
+        for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+            for cx in range(x0, x1):
+                rects = cell_rects.get((cx, cy))
+                if rects:
+                    keys = cells[cx, cy]
+                    for index in rect.collidelistall(rects):  # test in C
+                        key = keys[index]
+                        if key not in seen:  # a rect spanning several cells is seen once per cell
+                            seen.add(key)
+                            found.append(key)
+        return found
+
+    def first_hit(self, rect: pygame.Rect) -> Optional[Hashable]:
+        """Key of any rect colliding with `rect` (None if none); stops at the first hit."""
+        size = self.cell_size
+        cell_rects = self._cell_rects
+        x0 = rect.left // size
+        x1 = (rect.right - 1) // size + 1
+        for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+            for cx in range(x0, x1):
+                rects = cell_rects.get((cx, cy))
+                if rects:
+                    index = rect.collidelist(rects)  # test in C
+                    if index != -1:
+                        return self._cells[cx, cy][index]
+        return None
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._rects
@@ -0,0 +1,78 @@
+import pygame
+from typing import Dict, Hashable, Optional
+
+# Footprint masks shared by every prop drawn from the same sprite at the same scale
+_footprint_masks: Dict[Hashable, pygame.mask.Mask] = {}
+
+
+def opaque_bounds(surface: pygame.Surface, min_alpha: int = 1) -> pygame.Rect:
+    """
+    Bounding box of the non-transparent pixels of `surface` (relative to it).
+    Falls back to the whole surface when it has no opaque pixel.
+    """
+    bounds = surface.get_bounding_rect(min_alpha)
+    if bounds.width == 0 or bounds.height == 0:
+        return surface.get_rect()
+    return bounds
+
+
+def footprint_rect(surface: pygame.Surface, ratio: Optional[float] = None,
+                   band: Optional[int] = None) -> pygame.Rect:
+    """
+    Ground footprint of a sprite, relative to the surface: the bounding box of
+    the opaque pixels in a band at the bottom of the sprite.
+
+    Args:
+        surface: Sprite (ideally already trimmed to its opaque bounds)
+        ratio: Band height as a fraction of the sprite height (0 < ratio <= 1)
+        band: Band height in pixels (used when ratio is None)
+    """
+    mask = pygame.mask.from_surface(surface)
+    width, height = mask.get_size()
+    if ratio is not None:
+        band_height = round(height * ratio)
+    else:
+        band_height = band if band is not None else height
+    band_height = max(1, min(height, band_height))
+
+    band_mask = pygame.mask.Mask((width, band_height), fill=True)
+    in_band = mask.overlap_mask(band_mask, (0, height - band_height))
+    rects = in_band.get_bounding_rects()
+    if not rects:
+        return pygame.Rect(0, height - band_height, width, band_height)
+    return rects[0].unionall(rects[1:])
+
+
+def footprint_mask(surface: pygame.Surface, footprint: pygame.Rect,
+                   key: Optional[Hashable] = None) -> pygame.mask.Mask:
+    """
+    Pixel mask of a sprite's footprint, sized and positioned like `footprint`
+    (relative to the surface). Each row is filled between its first and last
+    opaque pixel so the player cannot slip between chair or table legs.
+
+    Args:
+        surface: Sprite the footprint was derived from
+        footprint: Footprint rect relative to the surface (see footprint_rect)
+        key: Cache key, e.g. (image path, scaled size); props sharing a key share the mask
+    """
+    if key is not None:
+        key = (key, tuple(footprint))
+        cached = _footprint_masks.get(key)
+        if cached is not None:
+            return cached
+
+    width, height = footprint.size
+    area = surface.subsurface(footprint)
+    opaque = pygame.mask.from_surface(area).to_surface(setcolor=(255, 255, 255, 255), unsetcolor=(0, 0, 0, 0))
+    alpha = pygame.image.tobytes(opaque, "RGBA")[3::4]  # 1 byte per pixel
+    mask = pygame.mask.Mask((width, height))
+    for y in range(height):
+        row = alpha[y * width:(y + 1) * width]
+        right = len(row.rstrip(b"\x00"))
+        if right:
+            left = width - len(row.lstrip(b"\x00"))
+            mask.draw(pygame.mask.Mask((right - left, 1), fill=True), (left, y))
+
+    if key is not None:
+        _footprint_masks[key] = mask
+    return mask
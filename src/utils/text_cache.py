@@ -0,0 +1,93 @@
+import pygame
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+Color = Tuple[int, ...]
+
+
+class TextCache:
+    """
+    LRU cache of rendered text surfaces shared by every UI text path.
+
+    Entries are keyed by (font id, text, color, antialias, background). The
+    font object is kept alive by its entry so that its id cannot be reused
+    by another font while the entry exists. The cache is bounded by the
+    total pixel memory of the cached surfaces.
+
+    Returned surfaces are shared: callers must blit them, never draw on them.
+    """
+
+    def __init__(self, max_bytes: int = 8 * 1024 * 1024) -> None:
+        """
+        Args:
+            max_bytes: Memory cap for the cached surfaces (width * height * bytesize)
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[tuple, Tuple[pygame.Surface, pygame.font.Font, int]]" = OrderedDict()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font: pygame.font.Font, text: str, color: Color,
+               antialias: bool = True, background: Optional[Color] = None) -> pygame.Surface:
+        """
+        Same contract as `font.render`, but returns a cached surface when possible.
+        """
+        key = (
+            id(font),
+            text,
+            tuple(color),
+            bool(antialias),
+            tuple(background) if background is not None else None,
+        )
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        surface = font.render(text, antialias, color, background)
+        size = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        self._entries[key] = (surface, font, size)
+        self.bytes_used += size
+        self._evict()
+        return surface
+
+    def _evict(self) -> None:
+        # Always keep the newest entry, even if it alone exceeds the cap
+        while self.bytes_used > self.max_bytes and len(self._entries) > 1:
+            _, (_, _, size) = self._entries.popitem(last=False)
+            self.bytes_used -= size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes_used = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes_used,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+
+# Process-wide cache used by all UI text
+text_cache = TextCache()
+
+
+def render_text(font: pygame.font.Font, text: str, color: Color,
+                antialias: bool = True, background: Optional[Color] = None) -> pygame.Surface:
+    """Render text through the shared cache (drop-in for `font.render`)."""
+    return text_cache.render(font, text, color, antialias, background)
@@ -0,0 +1,140 @@
+import pygame
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+from src.utils.interaction_area import InteractionArea
+from src.utils.spatial_hash import SpatialHash
+
+
+class TriggerManager:
+    """
+    Spatial index of the InteractionAreas of a scene.
+
+    Once per frame, update() finds the areas the player is inside with one
+    broadphase query (cost grows with the nearby areas, not the total), sets
+    their player_is_inside flag and notifies "enter" / "exit" events. The
+    interact key goes only to the focused area: the overlapping area with the
+    highest priority, the closest one on ties.
+
+    Listeners are called as callback(event, area), event in ("enter", "exit").
+    Areas are indexed by their rect at add() time: call move() after changing it.
+    """
+    INTERACT_KEY = pygame.K_f
+
+    def __init__(self, cell_size: int = 128) -> None:
+        """
+        Args:
+            cell_size: Broadphase cell size in pixels
+        """
+        self._hash = SpatialHash(cell_size)
+        self._areas: Dict[InteractionArea, None] = {}  # ordered set
+        self._inside: List[InteractionArea] = []
+        self._listeners: List[Callable[[str, InteractionArea], None]] = []
+        self.focused: Optional[InteractionArea] = None
+
+    # --- Areas ---
+
+    def add(self, area: InteractionArea) -> None:
+        self._areas[area] = None
+        self._hash.insert(area, area.rect)
+
+    def remove(self, area: InteractionArea) -> None:
+        """Unindexes an area; if the player was inside it, an "exit" event is sent."""
+        if area not in self._areas:
+            return
+        del self._areas[area]
+        self._hash.remove(area)
+        if area in self._inside:
+            self._inside.remove(area)
+            area.player_is_inside = False
+            if self.focused is area:
+                self.focused = None
+            self._notify("exit", area)
+
+    def move(self, area: InteractionArea, rect: Optional[pygame.Rect] = None) -> None:
+        """Re-indexes an area after its rect changed (or sets it to `rect`)."""
+        if rect is not None:
+            area.rect = rect
+        if area in self._areas:
+            self._hash.insert(area, area.rect)
+
+    def sync(self, areas: Iterable[InteractionArea]) -> None:
+        """Adds / removes areas so the index holds exactly `areas` (state of kept areas is preserved)."""
+        wanted = list(areas)
+        keep = set(wanted)
+        for area in [a for a in self._areas if a not in keep]:
+            self.remove(area)
+        for area in wanted:
+            if area not in self._areas:
+                self.add(area)
+
+    def __contains__(self, area: InteractionArea) -> bool:
+        return area in self._areas
+
+    def __iter__(self) -> Iterator[InteractionArea]:
+        return iter(self._areas)
+
+    def __len__(self) -> int:
+        return len(self._areas)
+
+    def query(self, rect: pygame.Rect) -> List[InteractionArea]:
+        """Areas overlapping `rect` (e.g. the camera view)."""
+        return self._hash.query(rect)
+
+    @property
+    def active(self) -> List[InteractionArea]:
+        """Areas the player is currently inside."""
+        return list(self._inside)
+
+    # --- Per frame ---
+
+    def update(self, player_rect: pygame.Rect) -> None:
+        inside = self._hash.query(player_rect)
+        inside_set = set(inside)
+        previous = self._inside
+        self._inside = inside
+
+        for area in previous:
+            if area not in inside_set:
+                area.player_is_inside = False
+                self._notify("exit", area)
+        was_inside = set(previous)
+        for area in inside:
+            if area not in was_inside:
+                area.player_is_inside = True
+                self._notify("enter", area)
+
+        if not inside:
+            self.focused = None
+        elif len(inside) == 1:
+            self.focused = inside[0]
+        else:
+            px, py = player_rect.center
+
+            def rank(area):
+                ax, ay = area.rect.center
+                return area.priority, -((ax - px) ** 2 + (ay - py) ** 2)
+            self.focused = max(inside, key=rank)
+
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """Runs the focused area's callback on the interact key. Returns True if handled."""
+        if event.type == pygame.KEYDOWN and event.key == self.INTERACT_KEY and self.focused is not None:
+            self.focused.callback()
+            return True
+        return False
+
+    def draw(self, screen: pygame.Surface, player_rect: pygame.Rect) -> None:
+        """Draws the "[F]" prompt of the focused area only."""
+        if self.focused is not None:
+            self.focused.draw(screen, player_rect)
+
+    # --- Events ---
+
+    def subscribe(self, callback: Callable[[str, InteractionArea], None]) -> None:
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback: Callable[[str, InteractionArea], None]) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, event: str, area: InteractionArea) -> None:
+        for callback in self._listeners:
+            callback(event, area)
@@ -0,0 +1,31 @@
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(PROJECT_ROOT, "src")
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import pygame
+
+
+@pytest.fixture(scope="session")
+def display():
+    """pygame with a (dummy) 1280x720 window, like the game."""
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    yield screen
+    pygame.quit()
+
+
+@pytest.fixture
+def in_src(monkeypatch):
+    """Asset paths are relative to src/, as when the game runs."""
+    monkeypatch.chdir(SRC_DIR)
+    return SRC_DIR
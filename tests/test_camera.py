@@ -0,0 +1,75 @@
+import pygame
+
+from src.utils.camera import Camera
+
+VIEW = (400, 300)
+WORLD = (1600, 900)
+
+
+def target_at(x, y):
+    return pygame.Rect(0, 0, 20, 20).move(x - 10, y - 10)
+
+
+def test_small_world_never_scrolls():
+    camera = Camera(VIEW, (200, 100))
+
+    camera.update(target_at(390, 290))
+    camera.center_on(target_at(390, 290))
+
+    assert not camera.scrolls
+    assert (camera.world_width, camera.world_height) == VIEW
+    assert camera.offset == (0, 0)
+
+
+def test_target_inside_the_dead_zone_does_not_move_the_camera():
+    camera = Camera(VIEW, WORLD, dead_zone=(0.5, 0.5), smoothing=1)
+    camera.center_on(target_at(800, 450))
+    start = camera.offset
+
+    camera.update(target_at(800 + 90, 450 - 60))  # dead-zone is +-100 x +-75 around the centre
+
+    assert camera.offset == start
+
+
+def test_camera_follows_to_the_dead_zone_edge():
+    camera = Camera(VIEW, WORLD, dead_zone=(0.5, 0.5), smoothing=1)
+    camera.center_on(target_at(800, 450))
+
+    camera.update(target_at(1000, 450))
+
+    assert camera.offset == (1000 - 200 - 100, 450 - 150)
+
+
+def test_smoothing_eases_and_then_settles():
+    camera = Camera(VIEW, WORLD, dead_zone=(0, 0), smoothing=0.5)
+    target = target_at(800, 450)
+
+    camera.update(target)
+    assert camera.offset == (300, 150)
+    for _ in range(20):
+        camera.update(target)
+    assert camera.offset == (600, 300)
+    assert (camera.x, camera.y) == (600, 300)
+
+
+def test_camera_is_clamped_to_the_world():
+    camera = Camera(VIEW, WORLD)
+
+    camera.center_on(target_at(5, 5))
+    assert camera.offset == (0, 0)
+    camera.center_on(target_at(1595, 895))
+    assert camera.offset == (1200, 600)
+    assert camera.rect == pygame.Rect(1200, 600, 400, 300)
+
+    camera.set_world_size((800, 600))
+    assert camera.offset == (400, 300)
+
+
+def test_coordinate_conversions_round_trip():
+    camera = Camera(VIEW, WORLD)
+    camera.center_on(target_at(700, 500))
+    ox, oy = camera.offset
+
+    assert camera.to_screen((700, 500)) == (700 - ox, 500 - oy)
+    assert camera.to_world(camera.to_screen((123, 456))) == (123, 456)
+    assert camera.apply(pygame.Rect(700, 500, 10, 10)).topleft == camera.to_screen((700, 500))
@@ -0,0 +1,170 @@
+import pytest
+
+from src.tools import Notebook_clues
+from src.tools.casebook import RUNTIME_CLUE_BASE, Casebook, CasebookClueStore
+
+DEFAULT_UNLOCKED = [i for i, clue in enumerate(Notebook_clues.clues) if clue.get("unlocked")]
+LOCKED = next(i for i in range(len(Notebook_clues.clues)) if i not in DEFAULT_UNLOCKED)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "casebook.db")
+
+
+@pytest.fixture
+def casebook(db_path):
+    casebook = Casebook(db_path)
+    yield casebook
+    casebook.close()
+
+
+def test_content_is_imported_once(casebook, db_path, capsys):
+    assert casebook.clue_ids() == list(range(len(Notebook_clues.clues)))
+    assert casebook.unlocked_clue_ids() == DEFAULT_UNLOCKED
+    assert casebook.fetch_clues([0])[0]["name"] == Notebook_clues.clues[0]["name"]
+    capsys.readouterr()
+
+    Casebook(db_path).close()
+
+    assert "Casebook imported" not in capsys.readouterr().out
+
+
+def test_unlocks_are_pending_until_flush(casebook, db_path):
+    casebook.set_clue_unlocked(LOCKED)
+    casebook.set_clue_unlocked(DEFAULT_UNLOCKED[0], False)
+
+    assert LOCKED in casebook.unlocked_clue_ids()
+    assert DEFAULT_UNLOCKED[0] not in casebook.unlocked_clue_ids()
+    stored = {r[0] for r in casebook.conn.execute("SELECT clue_id FROM clue_unlocks WHERE unlocked = 1")}
+    assert LOCKED not in stored
+
+    assert casebook.flush() == 2
+    assert casebook.flush() == 0
+    casebook.close()
+
+    reopened = Casebook(db_path)
+    assert LOCKED in reopened.unlocked_clue_ids()
+    assert DEFAULT_UNLOCKED[0] not in reopened.unlocked_clue_ids()
+    reopened.close()
+
+
+def test_notes_are_written_on_flush(casebook, db_path):
+    casebook.set_note(0, "Check the alibi.")
+
+    assert casebook.note(0) == "Check the alibi."
+    assert casebook.note(1) == ""
+    assert casebook.flush() == 1
+    casebook.close()
+
+    reopened = Casebook(db_path)
+    assert reopened.note(0) == "Check the alibi."
+    reopened.close()
+
+
+def test_import_keeps_saved_progress(casebook):
+    casebook.set_clue_unlocked(LOCKED)
+    casebook.flush()
+    clues = [dict(clue, description=f"Rewritten {i}") for i, clue in enumerate(Notebook_clues.clues)]
+
+    casebook.import_content(clues, [])
+
+    assert LOCKED in casebook.unlocked_clue_ids()
+    assert casebook.fetch_clues([LOCKED])[LOCKED]["description"] == f"Rewritten {LOCKED}"
+
+
+def test_reset_progress_restores_the_defaults(casebook):
+    casebook.set_clue_unlocked(LOCKED)
+    casebook.flush()
+    casebook.set_clue_unlocked(DEFAULT_UNLOCKED[0], False)
+
+    casebook.reset_progress()
+
+    assert casebook.unlocked_clue_ids() == DEFAULT_UNLOCKED
+    assert casebook.flush() == 0
+
+
+def test_clue_store_reads_pages_and_records_unlocks(casebook):
+    store = CasebookClueStore(casebook, cache_rows=4)
+
+    assert len(store) == len(Notebook_clues.clues)
+    assert store.unlocked_ids == DEFAULT_UNLOCKED
+    assert store.page(0, 4) == DEFAULT_UNLOCKED[:4]
+    assert store[DEFAULT_UNLOCKED[0]]["name"] == Notebook_clues.clues[DEFAULT_UNLOCKED[0]]["name"]
+
+    store.page(1, 4)
+    assert len(store._rows) == 4
+
+    assert store.unlock(LOCKED)
+    assert not store.unlock(LOCKED)
+    assert store.is_unlocked(LOCKED)
+    assert casebook.flush() == 1
+
+    clue_id = store.add({"name": "Runtime clue", "description": "Added in play.", "unlocked": True})
+    assert clue_id in store.unlocked_ids
+    assert store[clue_id]["name"] == "Runtime clue"
+
+
+def test_import_drops_clues_removed_from_the_source(casebook):
+    casebook.set_note(len(Notebook_clues.clues) - 1, "About to disappear.")
+    casebook.flush()
+    clues = Notebook_clues.clues[:-2]
+
+    casebook.import_content(clues, [])
+
+    assert casebook.clue_ids() == list(range(len(clues)))
+    assert casebook.note(len(Notebook_clues.clues) - 1) == ""
+    assert CasebookClueStore(casebook).unlocked_ids == [i for i in DEFAULT_UNLOCKED if i < len(clues)]
+
+
+def test_runtime_clues_survive_reimport_but_not_a_new_game(casebook):
+    clue_id = casebook.add_clue("Runtime clue", "Added in play.", unlocked=True)
+    second = casebook.add_clue("Second runtime clue", "Added in play.")
+    assert clue_id == RUNTIME_CLUE_BASE and second == RUNTIME_CLUE_BASE + 1
+
+    casebook.import_content(Notebook_clues.clues, [])
+    assert casebook.clue_ids("main")[-2:] == [clue_id, second]
+    assert clue_id in casebook.unlocked_clue_ids()
+
+    casebook.reset_progress()
+    assert casebook.clue_ids() == list(range(len(Notebook_clues.clues)))
+    assert casebook.unlocked_clue_ids() == DEFAULT_UNLOCKED
+
+
+def test_rows_carry_the_unlocked_flag(casebook):
+    store = CasebookClueStore(casebook)
+    row = store[LOCKED]
+    assert row["unlocked"] is False
+
+    store.unlock(LOCKED)
+    assert row["unlocked"] is True
+    assert casebook.fetch_clues([LOCKED])[LOCKED]["unlocked"] is True
+    store.lock(LOCKED)
+    assert casebook.fetch_clues([LOCKED])[LOCKED]["unlocked"] is False
+
+
+def test_notebook_reads_only_the_visible_page_until_a_search(casebook, display, in_src, monkeypatch):
+    from src.tools.Notebook import CLUES_PER_PAGE, Notebook
+    from src.utils.font_registry import fonts
+
+    fetched = []
+    fetch_clues = casebook.fetch_clues
+    monkeypatch.setattr(casebook, "fetch_clues", lambda ids: fetched.extend(ids) or fetch_clues(ids))
+    store = CasebookClueStore(casebook)
+    notebook_fonts = {
+        "list": fonts.font(None, 40),
+        "title_options": {size: fonts.font(None, size) for size in (42, 36, 32, 28, 24)},
+        "desc_options": {size: fonts.font(None, size + 4) for size in (36, 32, 28, 24)},
+        "page_count": fonts.font(None, 32),
+    }
+    notebook = Notebook(display, None, store, notebook_fonts, *display.get_size())
+    notebook.open_notebook()
+    notebook.draw((0, 0))
+
+    assert set(fetched) <= set(DEFAULT_UNLOCKED[:CLUES_PER_PAGE])
+    assert not notebook.search_index.built
+
+    notebook.set_search_query(Notebook_clues.clues[DEFAULT_UNLOCKED[-1]]["name"])
+    assert notebook.search_index.built
+    assert set(DEFAULT_UNLOCKED) <= set(fetched)
+    assert DEFAULT_UNLOCKED[-1] in notebook.search_results
@@ -0,0 +1,96 @@
+from src.tools.clue_search import ClueSearchIndex, normalize_text, tokenize
+from src.tools.clue_store import ClueStore
+
+
+def make_store():
+    return ClueStore([
+        {"name": "Broken Watch", "description": "Stopped at midnight.", "unlocked": True},
+        {"name": "Đồng hồ cát", "description": "Tìm thấy trong bếp.", "unlocked": True},
+        {"name": "Wet Footprints", "description": "Lead to the kitchen door.", "unlocked": True},
+        {"name": "Hidden Letter", "description": "Signed by the owner.", "unlocked": False},
+    ])
+
+
+def test_normalize_text_strips_vietnamese_diacritics():
+    assert normalize_text("Đồng hồ") == "dong ho"
+    assert normalize_text("ASCII Only") == "ascii only"
+    assert tokenize("Tìm thấy, trong bếp!") == ["tim", "thay", "trong", "bep"]
+
+
+def test_search_matches_word_prefixes():
+    index = ClueSearchIndex(make_store())
+
+    assert index.search("foot") == [2]
+    assert index.search("wat") == [0]
+    assert index.search("nothing") == []
+
+
+def test_search_needs_every_word():
+    index = ClueSearchIndex(make_store())
+
+    assert index.search("kitchen") == [2]
+    assert index.search("kitchen door") == [2]
+    assert index.search("kitchen midnight") == []
+
+
+def test_search_ignores_diacritics():
+    index = ClueSearchIndex(make_store())
+
+    assert index.search("dong ho") == [1]
+    assert index.search("Đồng") == [1]
+    assert index.search("bep") == [1]
+
+
+def test_empty_query_returns_none():
+    index = ClueSearchIndex(make_store())
+
+    assert index.search("") is None
+    assert index.search("  ,. ") is None
+
+
+def test_index_follows_unlock_lock_and_add():
+    store = make_store()
+    index = ClueSearchIndex(store)
+    assert index.search("letter") == []
+
+    store.unlock(3)
+    assert index.search("letter") == [3]
+    assert index.search("owner") == [3]
+
+    store.lock(0)
+    assert index.search("watch") == []
+    assert index.search("midnight") == []
+
+    added = store.add({"name": "Torn Receipt", "description": "", "unlocked": True})
+    store.add({"name": "Locked Receipt", "description": "", "unlocked": False})
+    assert index.search("receipt") == [added]
+
+
+def test_markup_is_indexed_as_displayed_text():
+    store = ClueStore([
+        {"name": "Menu", "description": "**Poisoned** {red:dessert}, see [[Broken Watch|the clock]].",
+         "unlocked": True},
+    ])
+    index = ClueSearchIndex(store)
+
+    assert index.search("poisoned dessert") == [0]
+    assert index.search("clock") == [0]
+    assert index.search("red") == []
+    assert index.search("broken") == []
+
+
+def test_index_is_built_on_the_first_search():
+    store = make_store()
+    reads = []
+    rows = store.rows
+    store.rows = lambda ids: reads.append(list(ids)) or rows(ids)
+    index = ClueSearchIndex(store)
+    store.unlock(3)
+    store.lock(0)
+    assert reads == [] and not index.built
+
+    assert index.search("") is None
+    assert reads == []
+    assert index.search("letter") == [3]
+    assert index.search("watch") == []
+    assert reads == [[1, 2, 3]]
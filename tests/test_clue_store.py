@@ -0,0 +1,65 @@
+from src.tools.clue_store import ClueStore
+
+
+def make_clues(count, unlocked=()):
+    return [{"name": f"Clue {i}", "description": "", "unlocked": i in unlocked} for i in range(count)]
+
+
+def test_unlocked_ids_start_in_original_order():
+    store = ClueStore(make_clues(6, unlocked={4, 1, 3}))
+
+    assert store.unlocked_ids == [1, 3, 4]
+    assert store.unlocked_count() == 3
+    assert store.is_unlocked(3) and not store.is_unlocked(0)
+
+
+def test_unlock_and_lock_keep_the_order_and_notify():
+    store = ClueStore(make_clues(6, unlocked={1, 4}))
+    events = []
+    store.subscribe(lambda event, clue_id: events.append((event, clue_id)))
+
+    assert store.unlock(3)
+    assert store.unlock(0)
+    assert not store.unlock(3)
+    assert store.lock(4)
+    assert not store.lock(5)
+
+    assert store.unlocked_ids == [0, 1, 3]
+    assert store[4]["unlocked"] is False
+    assert events == [("unlock", 3), ("unlock", 0), ("lock", 4)]
+
+
+def test_add_appends_and_notifies():
+    store = ClueStore(make_clues(2, unlocked={0}))
+    events = []
+    store.subscribe(lambda event, clue_id: events.append((event, clue_id)))
+
+    locked = store.add({"name": "Locked", "description": "", "unlocked": False})
+    unlocked = store.add({"name": "Open", "description": "", "unlocked": True})
+
+    assert (locked, unlocked) == (2, 3)
+    assert len(store) == 4
+    assert store.unlocked_ids == [0, 3]
+    assert events == [("add", 2), ("add", 3)]
+
+
+def test_pages_follow_the_unlocked_list():
+    store = ClueStore(make_clues(20, unlocked=set(range(0, 20, 2))))
+
+    assert store.page_count(4) == 3
+    assert store.page(0, 4) == [0, 2, 4, 6]
+    assert store.page(2, 4) == [16, 18]
+    assert store.page(3, 4) == []
+    assert store.position_of(8) == 4 and store.position_of(9) == -1
+    assert store.page_of(18, 4) == 2 and store.page_of(9, 4) == -1
+
+    store.unlock(1)
+    assert store.page(0, 4) == [0, 1, 2, 4]
+    assert store.page_of(18, 4) == 2
+
+
+def test_empty_store_has_one_page():
+    store = ClueStore(make_clues(3))
+
+    assert store.page_count(8) == 1
+    assert store.page(0, 8) == []
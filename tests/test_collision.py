@@ -0,0 +1,48 @@
+import pygame
+import pytest
+
+from src.scenes.base_scene import BaseScene
+from src.scenes.scene_objects import Obstacle
+from src.utils.sprite_trim import footprint_mask
+
+POSITION = (200, 100)
+
+
+def triangle_image():
+    """60x60 sprite whose opaque pixels are the lower-left triangle."""
+    image = pygame.Surface((60, 60), pygame.SRCALPHA)
+    pygame.draw.polygon(image, (200, 120, 40), [(0, 0), (0, 59), (59, 59)])
+    return image
+
+
+@pytest.fixture
+def scene(display):
+    return BaseScene(640, 360)
+
+
+def add_triangle(scene, pixel_collision):
+    image = triangle_image()
+    footprint = image.get_rect()
+    mask = footprint_mask(image, footprint) if pixel_collision else None
+    scene.obstacles.append(Obstacle("triangle", image, POSITION, footprint.move(POSITION), mask))
+    scene.rebuild_collision_rects()
+
+
+@pytest.mark.parametrize("pixel_collision, hits_corner", [(False, True), (True, False)])
+def test_footprint_mask_decides_inside_the_rect(scene, pixel_collision, hits_corner):
+    add_triangle(scene, pixel_collision)
+    corner = pygame.Rect(POSITION[0] + 45, POSITION[1] + 2, 10, 10)  # empty upper-right corner
+    solid = pygame.Rect(POSITION[0] + 2, POSITION[1] + 45, 10, 10)
+
+    assert scene.check_collision(corner) is hits_corner
+    assert scene.check_collision(solid)
+    assert not scene.check_collision(pygame.Rect(20, 20, 10, 10))
+
+
+def test_wall_mask_blocks(scene):
+    mask = pygame.mask.Mask((640, 360))
+    mask.draw(pygame.mask.Mask((20, 360), fill=True), (300, 0))
+    scene.set_wall_mask(mask)
+
+    assert scene.check_collision(pygame.Rect(295, 100, 10, 10))
+    assert not scene.check_collision(pygame.Rect(280, 100, 10, 10))
@@ -0,0 +1,149 @@
+import pytest
+
+from src.tools.Inventory_Item import ItemRegistry
+from src.tools.Inventory_Manager import InventoryManager
+from src.tools.clue_store import ClueStore
+from src.tools.evidence_combiner import EvidenceCombiner, Recipe, RecipeBook
+
+
+@pytest.fixture(scope="module")
+def registry():
+    return ItemRegistry()
+
+
+@pytest.fixture
+def recipes(registry):
+    return RecipeBook(registry=registry)
+
+
+def clue(name, unlocked=False):
+    return {"name": name, "description": "", "unlocked": unlocked}
+
+
+def inventory_with(registry, *codes, rows=4, cols=5):
+    inventory = InventoryManager(rows, cols)
+    inventory.add_items([registry[code] for code in codes])
+    return inventory
+
+
+def test_lookup_ignores_the_order_of_the_pair(recipes):
+    recipe = recipes.lookup("FPD5", "LTRX")
+
+    assert recipe is not None
+    assert recipes.lookup("LTRX", "FPD5") is recipe
+    assert recipes.lookup("FPD5", "MAG2") is None
+    assert recipes.partners("FPD5") == {"LTRX"}
+
+
+def test_duplicate_and_unknown_recipes_are_rejected(registry, recipes):
+    with pytest.raises(ValueError):
+        recipes.add(Recipe(("LTRX", "FPD5")))
+    with pytest.raises(ValueError):
+        recipes._compile({"items": ["FPD5", "NOPE"]}, "test")
+    with pytest.raises(ValueError):
+        recipes._compile({"items": ["FPD5"]}, "test")
+    with pytest.raises(ValueError):
+        recipes._compile({"items": ["FPD5", "LTRX"], "consumes": ["MAG2"]}, "test")
+
+
+def test_combine_produces_consumes_and_unlocks(registry, recipes):
+    inventory = inventory_with(registry, "MAG2", "FPD5", "LTRX")
+    store = ClueStore([clue("Witness Sighting"), clue("Strange Fingerprint")])
+    combiner = EvidenceCombiner(recipes, registry, store)
+
+    result = combiner.combine(inventory, 1, 2)
+
+    assert result.success
+    assert [item.code for item in result.produced] == ["LTRF"]
+    assert result.unlocked == [1]
+    assert store.is_unlocked(1)
+    assert "New clue" in result.message
+    assert inventory.has_item("FPD5")
+    assert not inventory.has_item("LTRX")
+    assert inventory.has_item("LTRF")
+
+
+def test_combine_does_not_unlock_a_clue_twice(registry, recipes):
+    inventory = inventory_with(registry, "MAG2", "CB9")
+    store = ClueStore([clue("Witness Sighting", unlocked=True)])
+    combiner = EvidenceCombiner(recipes, registry, store)
+
+    result = combiner.combine(inventory, 0, 1)
+
+    assert result.success
+    assert result.unlocked == []
+    assert inventory.count("MAG2") == 1 and inventory.count("CB9") == 1
+
+
+def test_combine_failures_leave_the_inventory_alone(registry, recipes):
+    inventory = inventory_with(registry, "MAG2", "FPD5")
+    combiner = EvidenceCombiner(recipes, registry)
+
+    assert combiner.combine(inventory, 0, 7).message == "Select two items to combine."
+    assert combiner.combine(inventory, 0, 0).message == "You need two of these."
+    result = combiner.combine(inventory, 0, 1)
+    assert not result.success
+    assert "don't go together" in result.message
+    assert inventory.find_slots("MAG2") == [0] and inventory.find_slots("FPD5") == [1]
+    assert inventory.free_slot_count() == 18
+
+
+def test_full_inventory_rolls_the_combination_back(registry):
+    recipes = RecipeBook(cases=(), registry=registry)
+    recipes.add(Recipe(("MAG2", "CB9"), [("LTRF", 1)], consumes=()))
+    inventory = inventory_with(registry, "MAG2", "CB9", rows=1, cols=2)
+    combiner = EvidenceCombiner(recipes, registry)
+
+    result = combiner.combine(inventory, 0, 1)
+
+    assert not result.success
+    assert result.message == "Your inventory is full."
+    assert inventory.count("MAG2") == 1 and inventory.count("CB9") == 1
+    assert not inventory.has_item("LTRF")
+
+
+def test_combine_consumes_the_selected_slots(registry, recipes):
+    inventory = InventoryManager(2, 5)
+    for index, code in ((0, "LTRX"), (1, "FPD5"), (3, "LTRX")):
+        inventory.add_item(registry[code], index)
+    combiner = EvidenceCombiner(recipes, registry)
+
+    assert combiner.combine(inventory, 0, 1).success
+    assert inventory.find_slots("LTRX") == [3]
+    assert inventory.find_slots("FPD5") == [1]
+
+
+def test_a_pair_from_one_stack_comes_out_of_that_stack(registry):
+    recipes = RecipeBook(cases=(), registry=registry)
+    recipes.add(Recipe(("CB9", "CB9"), [("LTRF", 1)]))
+    inventory = InventoryManager(1, 4)
+    inventory.add_item(registry["CB9"], 0)
+    inventory.add_item(registry["CB9"], 2, quantity=3)
+    combiner = EvidenceCombiner(recipes, registry)
+
+    assert combiner.combine(inventory, 2, 2).success
+    assert inventory.get_quantity(0) == 1 and inventory.get_quantity(2) == 1
+
+
+def test_rollback_restores_the_inputs_in_their_slots(registry):
+    recipes = RecipeBook(cases=(), registry=registry)
+    recipes.add(Recipe(("MAG2", "CB9"), [("LTRF", 1), ("EVD4", 1), ("FPD5", 1)]))
+    inventory = InventoryManager(1, 3)
+    for index, code in ((0, "CB9"), (1, "KEY7"), (2, "MAG2")):
+        inventory.add_item(registry[code], index)
+    combiner = EvidenceCombiner(recipes, registry)
+
+    result = combiner.combine(inventory, 2, 0)
+
+    assert not result.success
+    assert [item.code for item in inventory.items] == ["CB9", "KEY7", "MAG2"]
+    assert inventory.quantities == [1, 1, 1]
+
+
+def test_partner_slots(registry, recipes):
+    inventory = inventory_with(registry, "KEY7", "MAG2", "EVD4", "CB9")
+    combiner = EvidenceCombiner(recipes, registry)
+
+    assert combiner.partner_slots(inventory, 0) == {2}
+    assert combiner.partner_slots(inventory, 1) == {3}
+    assert combiner.partner_slots(inventory, 10) == set()
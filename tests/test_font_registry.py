@@ -0,0 +1,41 @@
+import pytest
+
+from src.utils.font_registry import FontRegistry
+
+
+@pytest.fixture
+def registry(display):
+    return FontRegistry(max_widths=3)
+
+
+def test_same_key_shares_one_font(registry):
+    assert registry.font(None, 20) is registry.font(None, 20)
+    assert registry.font(None, 20) is not registry.font(None, 20, bold=True)
+    assert registry.created == 2
+
+
+def test_missing_file_falls_back_once(registry, capsys):
+    font = registry.font("missing/font.ttf", 18)
+
+    assert registry.font("missing/font.ttf", 18) is font
+    assert registry.font("missing/font.ttf", 22) is not font
+    assert capsys.readouterr().out.count("Font not found") == 1
+
+
+def test_text_width_matches_font(registry):
+    font = registry.font(None, 24)
+
+    assert registry.text_width(font, "Alibi") == font.size("Alibi")[0]
+
+
+def test_text_width_cache_is_bounded_lru(registry):
+    font = registry.font(None, 24)
+    for word in ("one", "two", "three"):
+        registry.text_width(font, word)
+    registry.text_width(font, "one")   # most recently used again
+    registry.text_width(font, "four")  # evicts "two"
+
+    assert list(registry._widths[font]) == ["three", "one", "four"]
+    for i in range(100):
+        registry.text_width(font, f"note {i}")
+    assert len(registry._widths[font]) == 3
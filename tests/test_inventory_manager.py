@@ -0,0 +1,119 @@
+from src.tools.Inventory_Item import Item
+from src.tools.Inventory_Manager import InventoryManager
+
+
+def make_item(code):
+    return Item(f"Item {code}", code, "", 0)
+
+
+class Recorder:
+    def __init__(self, inventory):
+        self.events = []
+        inventory.subscribe(lambda event, slots: self.events.append((event, set(slots))))
+
+
+def test_items_fill_the_lowest_free_slot():
+    inventory = InventoryManager(2, 3)
+    a, b, c = make_item("A"), make_item("B"), make_item("C")
+    inventory.add_item(a)
+    inventory.add_item(b)
+    inventory.add_item(c)
+
+    inventory.remove_item(0)
+    inventory.remove_item(2)
+    inventory.add_item(make_item("D"))
+
+    assert inventory.get_item(0).code == "D"
+    assert inventory.get_item(2) is None
+    assert inventory.free_slot_count() == 4
+
+
+def test_adding_by_index_does_not_hand_out_the_slot_twice():
+    inventory = InventoryManager(1, 3)
+    inventory.add_item(make_item("A"), index=0)
+
+    inventory.add_item(make_item("B"))
+
+    assert inventory.find_slots("A") == [0]
+    assert inventory.find_slots("B") == [1]
+
+
+def test_stacks_fill_up_before_new_slots():
+    inventory = InventoryManager(1, 4, max_stack=5)
+    coin = make_item("COIN")
+
+    assert inventory.add_item(coin, quantity=7)
+    assert inventory.add_item(coin, quantity=2)
+
+    assert inventory.find_slots("COIN") == [0, 1]
+    assert [inventory.get_quantity(i) for i in (0, 1)] == [5, 4]
+    assert inventory.count("COIN") == 9
+
+
+def test_items_that_do_not_fit_are_rejected_whole():
+    inventory = InventoryManager(1, 2, max_stack=5)
+    coin = make_item("COIN")
+
+    assert not inventory.add_item(coin, quantity=11)
+    assert inventory.count("COIN") == 0
+    assert inventory.free_slot_count() == 2
+
+    rejected = inventory.add_items([(coin, 10), make_item("KEY")])
+    assert [getattr(entry, "code", None) for entry in rejected] == ["KEY"]
+    assert inventory.count("COIN") == 10
+
+
+def test_remove_by_code_takes_from_the_latest_slots():
+    inventory = InventoryManager(1, 4, max_stack=5)
+    coin = make_item("COIN")
+    inventory.add_item(coin, quantity=12)
+
+    assert inventory.remove_by_code("COIN", 4) == 4
+    assert [inventory.get_quantity(i) for i in range(3)] == [5, 3, 0]
+    assert inventory.remove_by_code("COIN", 20) == 8
+    assert not inventory.has_item("COIN")
+    assert inventory.free_slot_count() == 4
+
+
+def test_batch_sends_one_event():
+    inventory = InventoryManager(2, 3)
+    recorder = Recorder(inventory)
+
+    with inventory.batch():
+        inventory.add_item(make_item("A"))
+        inventory.add_item(make_item("B"))
+        inventory.remove_item(0)
+    inventory.add_item(make_item("C"), index=4)
+
+    assert recorder.events == [("changed", {0, 1}), ("changed", {4})]
+
+
+def test_clear_inventory_frees_every_slot():
+    inventory = InventoryManager(2, 2)
+    for code in "ABC":
+        inventory.add_item(make_item(code))
+    recorder = Recorder(inventory)
+
+    inventory.clear_inventory()
+
+    assert recorder.events == [("changed", {0, 1, 2})]
+    assert inventory.free_slot_count() == 4
+    assert not inventory.has_item("A")
+    inventory.add_item(make_item("D"))
+    assert inventory.find_slots("D") == [0]
+
+
+def test_grid_grows_on_demand_up_to_max_rows():
+    inventory = InventoryManager(1, 2, max_stack=1, max_rows=3)
+    recorder = Recorder(inventory)
+
+    assert inventory.add_items([make_item(code) for code in "ABC"]) == []
+
+    assert (inventory.rows, inventory.max_slots) == (2, 4)
+    assert recorder.events[0] == ("resized", {2, 3})
+    assert inventory.find_slots("C") == [2]
+    assert inventory.add_item(make_item("D"), quantity=1)
+    assert inventory.add_item(make_item("E"))
+    assert inventory.rows == 3
+    assert not inventory.add_item(make_item("F"), quantity=2)
+    assert inventory.rows == 3
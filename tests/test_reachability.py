@@ -0,0 +1,95 @@
+import numpy as np
+import pygame
+import pytest
+
+from src.scenes.base_scene import BaseScene
+from src.scenes.reachability import REACHABLE, UNREACHABLE, PLAYER_SIZE, analyze, flood_fill
+from src.tools import scene_analyzer
+from src.utils.interaction_area import InteractionArea
+
+SCENE_SIZE = (640, 360)
+WALL_X, WALL_WIDTH = 300, 20
+
+
+def walled_scene(door_height):
+    """Scene split by a vertical wall with one door; start on the left, a target on the right."""
+    scene = BaseScene(*SCENE_SIZE)
+    mask = pygame.mask.Mask(SCENE_SIZE)
+    door_top = (SCENE_SIZE[1] - door_height) // 2
+    for top, bottom in ((0, door_top), (door_top + door_height, SCENE_SIZE[1])):
+        if bottom > top:
+            mask.draw(pygame.mask.Mask((WALL_WIDTH, bottom - top), fill=True), (WALL_X, top))
+    scene.set_wall_mask(mask)
+    scene.player_start = (40, 40)
+    scene.add_interaction_area(InteractionArea(pygame.Rect(520, 140, 60, 60), lambda: None))
+    return scene
+
+
+def test_flood_fill_counts_steps_and_stops_at_walls():
+    passable = np.array([[True, True, False, True, True],
+                         [True, True, True, True, False]])
+    seeds = np.zeros_like(passable)
+    seeds[0, 0] = True
+
+    distance = flood_fill(passable, seeds)
+
+    assert distance.tolist() == [[0, 1, -1, 5, 6],
+                                 [1, 2, 3, 4, -1]]
+
+
+def test_flood_fill_ignores_seeds_on_blocked_cells():
+    passable = np.array([[False, True]])
+    assert flood_fill(passable, np.array([[True, False]])).tolist() == [[-1, -1]]
+
+
+def test_target_behind_a_wide_door_is_reachable(display):
+    report = analyze(walled_scene(door_height=PLAYER_SIZE[1] + 40))
+
+    assert [t["status"] for t in report.targets] == [REACHABLE]
+    assert report.problems == 0
+    assert report.passages == []
+
+
+def test_door_narrower_than_the_player_is_reported(display):
+    report = analyze(walled_scene(door_height=PLAYER_SIZE[1] - 40))
+
+    assert [t["status"] for t in report.targets] == [UNREACHABLE]
+    assert report.problems == 1
+    assert report.pockets, "the right half is a pocket the player cannot enter"
+    assert any(p.left < WALL_X + WALL_WIDTH and p.right > WALL_X for p in report.passages)
+
+
+def test_start_inside_a_wall_is_a_problem(display):
+    scene = walled_scene(door_height=200)
+    scene.player_start = (WALL_X - 10, 0)
+
+    assert analyze(scene).start_blocked
+
+
+# --- The game scenes (same run as `python -m tools.scene_analyzer`) ---
+
+@pytest.fixture
+def gluttony(display, in_src):
+    return scene_analyzer.build_scene("gluttony_case")
+
+
+def test_gluttony_cake_evidence_is_reachable(gluttony):
+    # Regression: a derived dining-table footprint once covered the whole cake area
+    report = analyze(gluttony, "gluttony_case")
+    cake = next(t for t in report.targets if t["name"] == "evidence_cake")
+
+    assert cake["status"] == REACHABLE
+    assert report.problems == 0
+
+
+@pytest.mark.parametrize("name", [name for name in scene_analyzer.SCENES if name != "interrogation_room"])
+def test_game_scenes_have_no_reachability_problems(display, in_src, name):
+    scene = scene_analyzer.build_scene(name)
+    world = pygame.Rect(0, 0, scene.world_width, scene.world_height)
+    report = analyze(scene, name)
+
+    assert report.problems == 0, report.summary()
+    assert report.passages == [], report.summary()
+    assert report.pockets == [], report.summary()
+    for obstacle in scene.obstacles:
+        assert world.contains(obstacle.rect), f"{obstacle.name} footprint {obstacle.rect} leaves the world"
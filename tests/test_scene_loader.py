@@ -0,0 +1,134 @@
+import glob
+import json
+import os
+
+import pygame
+import pytest
+
+from src.scenes.scene_loader import (SCENE_DATA_DIR, SceneDefinitionError, compile_definition, eval_expr,
+                                     load_scene_definition, validate_definition)
+
+ENV = {"W": 1280, "H": 720}
+SCENE_IDS = sorted(os.path.basename(path)[:-5] for path in glob.glob(os.path.join(SCENE_DATA_DIR, "*.json")))
+
+
+@pytest.mark.parametrize("expr, value", [
+    (42, 42),
+    (2.5, 2.5),
+    ("W//2+300", 940),
+    ("(H - 100) / 2", 310),
+    ("-W % 7", -1280 % 7),
+])
+def test_eval_expr_computes_coordinates(expr, value):
+    assert eval_expr(expr, ENV) == value
+
+
+@pytest.mark.parametrize("expr", [
+    "__import__('os').system('true')",
+    "open('x')",
+    "W.bit_length()",
+    "W ** 2",
+    "[W, H]",
+    "X + 1",
+    "True",
+    "W if H else 0",
+    "1/0",
+    "W +",
+    [1, 2],
+    None,
+    False,
+])
+def test_eval_expr_rejects_anything_but_arithmetic(expr):
+    with pytest.raises(SceneDefinitionError):
+        eval_expr(expr, ENV)
+
+
+def sprite(**fields):
+    entry = {"name": "sofa", "image": "sofa.png", "pos": [0, 0]}
+    entry.update(fields)
+    return entry
+
+
+@pytest.mark.parametrize("data, message", [
+    ({"backgrund": "x.png"}, "unknown field"),
+    ({"obstacles": [{"name": "sofa", "pos": [0, 0]}]}, "obstacles[0]: missing required field 'image'"),
+    ({"obstacles": [sprite(), sprite()]}, "obstacles[1]: duplicate name 'sofa'"),
+    ({"obstacles": [sprite(anchor="bottom")]}, "obstacles[0].anchor"),
+    ({"obstacles": [sprite(scale=0)]}, "obstacles[0].scale"),
+    ({"obstacles": [sprite(pos=["W//2"])]}, "obstacles[0].pos"),
+    ({"obstacles": [sprite(interaction={"inflate": [10, 10]})]}, "missing required field 'callback'"),
+    ({"npcs": [{"name": "npc", "pos": [0, 0], "color": [300, 0, 0]}]}, "npcs[0].color"),
+    ({"debug": 1}, "debug"),
+    ({"obstacles": [sprite(footprint={"band": 4, "rect": [0, 0, 4, 4]})]}, "exactly one of"),
+    ({"obstacles": [sprite(footprint={"rect": [0, 0, 0, 4]})]}, "obstacles[0].footprint.rect"),
+    ({"obstacles": [sprite(footprint=1.5)]}, "obstacles[0].footprint"),
+    ({"obstacles": [sprite(collision="pixel")]}, "obstacles[0].collision"),
+    ({"obstacles": {}}, "expected a list"),
+])
+def test_validate_definition_points_at_the_bad_field(data, message):
+    with pytest.raises(SceneDefinitionError) as error:
+        validate_definition(data, "test.json")
+
+    assert message in str(error.value)
+    assert str(error.value).startswith("test.json")
+
+
+@pytest.mark.parametrize("scene_id", SCENE_IDS)
+def test_shipped_scenes_validate(scene_id):
+    with open(os.path.join(SCENE_DATA_DIR, f"{scene_id}.json"), encoding="utf-8") as f:
+        validate_definition(json.load(f), scene_id)
+
+
+def test_npc_coordinates_use_the_screen_size():
+    compiled = compile_definition({
+        "player_start": ["W//2", "H//2"],
+        "npcs": [{"name": "npc", "pos": ["W-100", 50], "color": [1, 2, 3],
+                  "interaction": {"inflate": [20, 20], "callback": "_on_npc_interact"}}],
+    }, (1280, 720))
+
+    assert compiled["player_start"] == (640, 360)
+    npc = compiled["npcs"][0]
+    assert npc["rect"] == (1180, 50, 60, 80)
+    assert npc["interaction"][0] == (1170, 40, 80, 100)
+
+
+def test_compiled_scene_is_cached(in_src, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+
+    first, from_cache = load_scene_definition(SCENE_IDS[0], (1280, 720), cache_dir)
+    assert not from_cache
+    second, from_cache = load_scene_definition(SCENE_IDS[0], (1280, 720), cache_dir)
+    assert from_cache
+    assert second == first
+
+    _, from_cache = load_scene_definition(SCENE_IDS[0], (1920, 1080), cache_dir)
+    assert not from_cache
+
+
+def obstacle_rects(scene_id):
+    compiled, _ = load_scene_definition(scene_id, (1280, 720), cache_dir=None)
+    return {entry["name"]: entry for entry in compiled["obstacles"]}
+
+
+def test_footprint_rect_override_is_relative_to_the_trimmed_image(display, in_src):
+    obstacles = obstacle_rects("gluttony_case")
+
+    assert obstacles["dining_table"]["rect"] == (418, 244, 444, 412)
+    assert obstacle_rects("lust_case")["chair"]["rect"] == (142, 315, 16, 70)
+
+
+def test_table_footprint_leaves_the_cake_reachable(display, in_src):
+    obstacles = obstacle_rects("gluttony_case")
+    table = pygame.Rect(obstacles["dining_table"]["rect"])
+    cake_area = pygame.Rect(obstacles["evidence_cake"]["interaction"][0])
+
+    assert not table.contains(cake_area)
+    assert cake_area.bottom > table.bottom
+
+
+@pytest.mark.parametrize("scene_id", SCENE_IDS)
+def test_footprints_stay_inside_the_world(display, in_src, scene_id):
+    world = pygame.Rect(0, 0, 1280, 720)
+
+    for name, entry in obstacle_rects(scene_id).items():
+        assert world.contains(pygame.Rect(entry["rect"])), name
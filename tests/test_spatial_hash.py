@@ -0,0 +1,58 @@
+import pygame
+
+from src.utils.spatial_hash import SpatialHash
+
+
+def test_query_lists_each_hit_once():
+    grid = SpatialHash(cell_size=32)
+    grid.insert("wide", (0, 0, 200, 20))  # spans several cells
+    grid.insert("small", (100, 100, 10, 10))
+
+    assert grid.query(pygame.Rect(0, 0, 300, 300)) == ["wide", "small"]
+    assert grid.query(pygame.Rect(150, 5, 4, 4)) == ["wide"]
+    assert grid.query(pygame.Rect(50, 50, 10, 10)) == []
+    assert grid.first_hit(pygame.Rect(105, 105, 2, 2)) == "small"
+    assert grid.first_hit(pygame.Rect(50, 50, 10, 10)) is None
+
+
+def test_touching_rects_do_not_collide():
+    grid = SpatialHash(cell_size=32)
+    grid.insert("a", (0, 0, 32, 32))
+
+    assert grid.query(pygame.Rect(32, 0, 10, 10)) == []
+    assert grid.query(pygame.Rect(31, 31, 10, 10)) == ["a"]
+
+
+def test_insert_moves_and_remove_forgets():
+    grid = SpatialHash(cell_size=32)
+    grid.insert("a", (0, 0, 10, 10))
+    grid.insert("a", (300, 300, 10, 10))
+
+    assert len(grid) == 1
+    assert grid.get("a") == pygame.Rect(300, 300, 10, 10)
+    assert grid.query(pygame.Rect(0, 0, 20, 20)) == []
+    assert grid.query(pygame.Rect(295, 295, 10, 10)) == ["a"]
+
+    grid.remove("a")
+    grid.remove("a")
+    assert "a" not in grid
+    assert grid.query(pygame.Rect(0, 0, 400, 400)) == []
+
+
+def test_empty_rects_are_ignored():
+    grid = SpatialHash()
+    grid.insert("empty", (10, 10, 0, 5))
+
+    assert "empty" not in grid
+    assert grid.query(pygame.Rect(0, 0, 50, 50)) == []
+
+
+def test_query_matches_brute_force():
+    grid = SpatialHash(cell_size=48)
+    rects = {i: pygame.Rect((i * 37) % 500, (i * 91) % 400, 5 + i % 60, 5 + (i * 7) % 45) for i in range(200)}
+    for key, rect in rects.items():
+        grid.insert(key, rect)
+
+    for probe in (pygame.Rect(0, 0, 64, 96), pygame.Rect(200, 150, 120, 30), pygame.Rect(-50, -50, 60, 60)):
+        expected = {key for key, rect in rects.items() if rect.colliderect(probe)}
+        assert set(grid.query(probe)) == expected
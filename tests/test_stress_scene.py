@@ -0,0 +1,95 @@
+import csv
+
+import pygame
+import pytest
+
+from src.scenes.stress_scene import COVERAGE, LAYOUTS, MAX_SIZE, MIN_SIZE, WALL_STYLES, StressScene
+from src.tools import benchmark
+
+
+def build(**kwargs):
+    return benchmark.quiet(StressScene, 640, 360, **kwargs)
+
+
+@pytest.fixture
+def fast_benchmark(monkeypatch):
+    monkeypatch.setattr(benchmark, "TIME_BUDGET", 0.01)
+    monkeypatch.setattr(benchmark, "MAX_CALLS", 50)
+
+
+def test_counts_match_the_request(display, in_src):
+    scene = build(obstacles=30, npcs=4, collectibles=5, areas=6)
+
+    assert len(scene.obstacles) == 30
+    assert len(scene.npcs) == 4
+    assert len(scene.collectible_items) == 5
+    assert len(scene.interaction_areas) == 4 + 6
+    assert len(scene.collision_rects) == 30
+
+
+@pytest.mark.parametrize("layout", LAYOUTS)
+def test_same_seed_gives_the_same_scene(display, in_src, layout):
+    first = build(obstacles=50, layout=layout, seed=3)
+    again = build(obstacles=50, layout=layout, seed=3)
+    other = build(obstacles=50, layout=layout, seed=4)
+
+    assert [o.rect for o in first.obstacles] == [o.rect for o in again.obstacles]
+    assert [o.rect for o in first.obstacles] != [o.rect for o in other.obstacles]
+    world = pygame.Rect(0, 0, 640, 360)
+    assert all(world.colliderect(o.image.get_rect(topleft=o.position)) for o in first.obstacles)
+
+
+def test_object_size_keeps_the_coverage(display, in_src):
+    scene = build(obstacles=0)
+
+    sizes = [scene.object_size(count) for count in (10, 100, 1000)]
+
+    assert sizes == sorted(sizes, reverse=True)
+    assert 100 * sizes[1] ** 2 == pytest.approx(640 * 360 * COVERAGE, rel=0.1)
+    assert scene.object_size(1) == MAX_SIZE
+    assert scene.object_size(10 ** 6) == MIN_SIZE
+
+
+def test_rooms_add_walls_to_the_border(display, in_src):
+    border, rooms, diagonal = (build(obstacles=0, walls=w).wall_mask.count() for w in ("border", "rooms", "diagonal"))
+
+    assert 0 < border < rooms < diagonal
+
+
+@pytest.mark.parametrize("walls", WALL_STYLES)
+def test_wall_styles(display, in_src, walls):
+    scene = build(obstacles=0, walls=walls)
+    x, y = scene.player_start
+
+    assert (scene.wall_mask.count() == 0) == (walls == "none")
+    assert not scene.check_collision(pygame.Rect(x, y, 16, 16))
+
+
+def test_pixel_collision_attaches_footprint_masks(display, in_src):
+    solid = build(obstacles=20)
+    masked = build(obstacles=20, pixel_collision=True)
+
+    assert all(mask is None for mask in solid.collision_masks)
+    assert all(mask is not None and mask.get_size() == rect.size
+               for mask, rect in zip(masked.collision_masks, masked.collision_rects))
+
+
+def test_bad_arguments_are_rejected(display, in_src):
+    with pytest.raises(ValueError):
+        build(layout="grid")
+    with pytest.raises(ValueError):
+        build(walls="maze")
+
+
+def test_benchmark_writes_a_row_per_operation(display, in_src, fast_benchmark, tmp_path):
+    rows = benchmark.quiet(benchmark.run, [10, 40], ["random"], "border", False, 0)
+
+    assert [(row[1], row[2]) for row in rows] == [(count, op) for count in (10, 40) for op in benchmark.OPERATIONS]
+    assert all(row[3] > 0 and row[4] > 0 for row in rows)
+
+    path = tmp_path / "stress.csv"
+    benchmark.write_csv(rows, str(path))
+    with open(path, newline="", encoding="utf-8") as f:
+        assert len(list(csv.reader(f))) == len(rows) + 1
+    benchmark.plot(rows, str(tmp_path / "stress.png"), "test")
+    assert (tmp_path / "stress.png").stat().st_size > 0
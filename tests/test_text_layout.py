@@ -0,0 +1,71 @@
+import pygame
+import pytest
+
+from src.tools.text_layout import layout_text, line_spans
+from src.utils.font_registry import fonts
+
+TEXT = "The butler swears he was polishing silver in the pantry all evening long."
+
+
+@pytest.fixture
+def font(display):
+    return fonts.font(None, 24)
+
+
+def test_lines_fit_and_keep_every_word(font):
+    layout = layout_text(TEXT, font, 160)
+
+    assert len(layout.lines) > 1
+    assert all(font.size(line)[0] <= 160 for line in layout.lines)
+    assert " ".join(layout.lines).split() == TEXT.split()
+
+
+def test_paragraphs_and_blank_lines_are_kept(font):
+    layout = layout_text("First line\n\nThird line", font, 400)
+
+    assert layout.lines == ["First line", "", "Third line"]
+
+
+def test_long_word_is_broken_to_the_width(font):
+    word = "Pneumonoultramicroscopicsilicovolcanoconiosis"
+    layout = layout_text(word, font, 80)
+
+    assert len(layout.lines) > 1
+    assert "".join(layout.lines) == word
+    assert all(font.size(line)[0] <= 80 for line in layout.lines)
+
+
+def test_layout_is_memoized(font):
+    first = layout_text(TEXT, font, 200)
+
+    assert layout_text(TEXT, font, 200.0) is first
+    assert layout_text(TEXT, font, 201) is not first
+    assert first.line_height == font.get_linesize()
+
+
+def test_draw_returns_the_text_that_did_not_fit(font):
+    layout = layout_text(TEXT, font, 160)
+    surface = pygame.Surface((160, 200))
+    line_height = layout.line_height
+
+    assert layout.draw(surface, font, (0, 0, 0), surface.get_rect()) == ""
+    rest = layout.draw(surface, font, (0, 0, 0), pygame.Rect(0, 0, 160, line_height))
+    assert rest == " ".join(layout.lines[2:])
+    assert layout.fits(len(layout.lines)) and not layout.fits(1)
+
+
+def test_line_spans_index_the_paragraph(font):
+    spans = line_spans(TEXT, font, 160)
+
+    assert spans[0][0] == 0 and spans[-1][1] == len(TEXT)
+    assert all(end == next_start for (_, end), (next_start, _) in zip(spans, spans[1:]))
+    assert [TEXT[start:end].rstrip(" ") for start, end in spans] == layout_text(TEXT, font, 160).lines
+
+
+def test_line_spans_of_a_long_word_and_an_empty_paragraph(font):
+    word = "Pneumonoultramicroscopicsilicovolcanoconiosis"
+    spans = line_spans("ab " + word, font, 80)
+
+    assert "".join(("ab " + word)[start:end] for start, end in spans).replace(" ", "") == "ab" + word
+    assert all(font.size(("ab " + word)[start:end].rstrip(" "))[0] <= 80 for start, end in spans)
+    assert line_spans("", font, 80) == []
@@ -0,0 +1,114 @@
+import pygame
+import pytest
+
+from src.utils.interaction_area import InteractionArea
+from src.utils.trigger_manager import TriggerManager
+
+
+class Triggers(TriggerManager):
+    """TriggerManager recording its events; add() returns the area."""
+
+    def __init__(self):
+        super().__init__(cell_size=64)
+        self.events = []
+        self.subscribe(lambda event, area: self.events.append((event, area)))
+
+    def add_area(self, x, y, size=40, priority=0, callback=lambda: None):
+        area = InteractionArea(pygame.Rect(x, y, size, size), callback, priority)
+        self.add(area)
+        return area
+
+
+@pytest.fixture
+def triggers(display, in_src):
+    return Triggers()
+
+
+def test_triggers_send_enter_and_exit(triggers):
+    door = triggers.add_area(100, 100)
+    player = pygame.Rect(0, 0, 20, 20)
+
+    triggers.update(player)
+    assert triggers.events == [] and triggers.focused is None
+
+    player.topleft = (110, 110)
+    triggers.update(player)
+    triggers.update(player)
+    assert triggers.events == [("enter", door)]
+    assert door.player_is_inside and triggers.focused is door
+
+    player.topleft = (300, 300)
+    triggers.update(player)
+    assert triggers.events == [("enter", door), ("exit", door)]
+    assert not door.player_is_inside and triggers.focused is None
+
+
+def test_removing_an_occupied_area_sends_exit(triggers):
+    door = triggers.add_area(100, 100)
+    triggers.update(pygame.Rect(110, 110, 20, 20))
+
+    triggers.remove(door)
+
+    assert triggers.events[-1] == ("exit", door)
+    assert triggers.focused is None and door not in triggers
+
+
+def test_focus_prefers_priority_then_distance(triggers):
+    near = triggers.add_area(100, 100)
+    far = triggers.add_area(125, 125)
+    player = pygame.Rect(100, 100, 30, 30)
+
+    triggers.update(player)
+    assert triggers.focused is near
+
+    important = triggers.add_area(128, 128, priority=1)
+    triggers.update(player)
+    assert triggers.focused is important
+    assert set(triggers.active) == {near, far, important}
+
+
+def test_interact_key_runs_the_focused_callback(triggers):
+    calls = []
+    triggers.add_area(100, 100, callback=lambda: calls.append("door"))
+    key = pygame.event.Event(pygame.KEYDOWN, key=TriggerManager.INTERACT_KEY)
+
+    assert not triggers.handle_event(key)
+    triggers.update(pygame.Rect(110, 110, 10, 10))
+    assert triggers.handle_event(key)
+    assert calls == ["door"]
+
+
+def test_move_reindexes_an_area(triggers):
+    door = triggers.add_area(100, 100)
+
+    triggers.move(door, pygame.Rect(400, 400, 40, 40))
+    triggers.update(pygame.Rect(110, 110, 10, 10))
+    assert triggers.events == []
+
+    triggers.update(pygame.Rect(410, 410, 10, 10))
+    assert triggers.events == [("enter", door)]
+
+
+def test_sync_keeps_the_state_of_kept_areas(triggers):
+    door = triggers.add_area(100, 100)
+    window = triggers.add_area(300, 300)
+    triggers.update(pygame.Rect(110, 110, 10, 10))
+    chest = InteractionArea(pygame.Rect(500, 500, 40, 40), lambda: None)
+
+    triggers.sync([door, chest])
+
+    assert list(triggers) == [door, chest]
+    assert window not in triggers
+    assert triggers.focused is door
+    assert triggers.events == [("enter", door)]
+
+
+def test_query_returns_the_areas_in_view(triggers):
+    door = triggers.add_area(100, 100)
+    far = triggers.add_area(2000, 100)
+
+    assert triggers.query(pygame.Rect(0, 0, 1280, 720)) == [door]
+
+    triggers.move(door, pygame.Rect(400, 400, 40, 40))
+    assert triggers.query(pygame.Rect(100, 100, 40, 40)) == []
+    assert triggers.query(pygame.Rect(1900, 0, 400, 400)) == [far]
@@ -0,0 +1,68 @@
+import pygame
+
+from src.scenes.wall_geometry import decompose_mask, load_wall_geometry, merge_rows, residual_mask
+
+
+def wall_mask(diagonal=False):
+    surface = pygame.Surface((200, 120), pygame.SRCALPHA)
+    pygame.draw.rect(surface, (255, 255, 255), (0, 0, 200, 120), 6)
+    pygame.draw.rect(surface, (255, 255, 255), (90, 0, 10, 70))
+    if diagonal:
+        pygame.draw.line(surface, (255, 255, 255), (20, 20), (80, 100), 9)
+    return pygame.mask.from_surface(surface)
+
+
+def rebuild(size, rects, residual):
+    mask = residual.copy() if residual else pygame.mask.Mask(size)
+    for x, y, w, h in rects:
+        mask.draw(pygame.mask.Mask((w, h), fill=True), (x, y))
+    return mask
+
+
+def assert_disjoint(rects):
+    rects = [pygame.Rect(r) for r in rects]
+    for i, rect in enumerate(rects):
+        assert rect.collidelist(rects[i + 1:]) == -1
+
+
+def test_merge_rows_joins_identical_runs():
+    rows = [[(0, 4)], [(0, 4)], [(0, 4), (6, 8)], [(6, 8)]]
+
+    assert sorted(merge_rows(rows)) == [(0, 0, 4, 3), (6, 2, 2, 2)]
+
+
+def test_straight_walls_become_exact_rects(display):
+    mask = wall_mask()
+
+    rects = decompose_mask(mask)
+
+    assert len(rects) <= 6
+    assert residual_mask(mask, rects) is None
+    assert_disjoint(rects)
+    assert rebuild(mask.get_size(), rects, None).overlap_area(mask, (0, 0)) == mask.count()
+
+
+def test_rects_and_residual_cover_the_mask_exactly(display):
+    mask = wall_mask(diagonal=True)
+
+    rects = decompose_mask(mask)
+    residual = residual_mask(mask, rects)
+
+    assert residual is not None
+    assert_disjoint(rects)
+    covered = rebuild(mask.get_size(), rects, residual)
+    assert covered.count() == mask.count()
+    assert covered.overlap_area(mask, (0, 0)) == mask.count()
+
+
+def test_geometry_is_cached_per_source(display, tmp_path):
+    source = tmp_path / "walls.png"
+    source.write_bytes(b"stand-in for the wall image")
+    mask = wall_mask(diagonal=True)
+
+    rects, residual, from_cache = load_wall_geometry(mask, str(source), str(tmp_path))
+    assert not from_cache
+    cached, cached_residual, from_cache = load_wall_geometry(mask, str(source), str(tmp_path))
+    assert from_cache
+    assert cached == rects
+    assert cached_residual.count() == residual.count()